@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold and warm lookup latency per read profile (DB_READ_PROFILE).
+
+Opens the database once per read profile exactly as the API pool does
+(read_only_uri() + read_profile() from src/db/connection.py) and times the
+API's single-postcode lookup query for a random sample of postcodes:
+
+- cold: first lookup of each postcode on a fresh connection (empty SQLite
+  page cache; with --drop-caches also an empty OS page cache)
+- warm: the same postcodes again on the same connection, --repeat times
+
+Without --drop-caches the OS page cache stays warm between profiles, so
+"cold" then only measures SQLite's own cache; profiles run in the order
+given.
+
+Usage:
+    python3 benchmarks/bench-read-profile.py --db /opt/postcode/geodata/bag.sqlite
+    sudo python3 benchmarks/bench-read-profile.py --drop-caches --samples 5000
+    python3 benchmarks/bench-read-profile.py --profiles tuned --json > tuned.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import structlog
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Progress and API logs go to stderr, so stdout carries only the results (--json can be piped)
+structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+
+from src.db.connection import READ_PROFILES, REPORTED_PRAGMAS, read_only_uri, read_profile  # noqa: E402
+from src.db.repository import LOOKUP_QUERIES  # noqa: E402
+
+# Configuration
+DEFAULT_DB = Path("/opt/postcode/geodata/bag.sqlite")
+DEFAULT_SAMPLES = 2000
+DEFAULT_REPEAT = 3
+SAMPLE_SEED = 42
+DROP_CACHES = Path("/proc/sys/vm/drop_caches")
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stderr)]
+)
+logger = logging.getLogger('bench-read-profile')
+
+
+def lookup_source(db_path):
+    """postcode_geo when the materialized table exists, unilabel otherwise (as POSTCODE_SOURCE=auto)"""
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postcode_geo'"
+        ).fetchone()
+        return "postcode_geo" if row else "unilabel"
+    finally:
+        conn.close()
+
+
+def sample_postcodes(db_path, source, count):
+    """Random sample of postcodes present in the database"""
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+    try:
+        table = "postcode_geo" if source == "postcode_geo" else "nums"
+        postcodes = [row[0] for row in conn.execute(f"SELECT DISTINCT postcode FROM {table} WHERE postcode != ''")]
+    finally:
+        conn.close()
+
+    random.Random(SAMPLE_SEED).shuffle(postcodes)
+    return postcodes[:count]
+
+
+def drop_os_caches():
+    """Flush dirty pages and drop the Linux page cache (requires root)"""
+    os.sync()
+    DROP_CACHES.write_text("1\n")
+
+
+def open_profile(db_path, profile):
+    """Connection configured like a pooled API connection with this read profile"""
+    immutable, pragmas = read_profile(profile)
+    conn = sqlite3.connect(read_only_uri(db_path, immutable), uri=True)
+    for pragma in pragmas:
+        conn.execute(pragma)
+    return conn
+
+
+def effective_settings(conn):
+    """PRAGMA values SQLite actually applied"""
+    return {pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0] for pragma in REPORTED_PRAGMAS}
+
+
+def time_lookups(conn, query, postcodes):
+    """Latency of one lookup per postcode, in microseconds"""
+    latencies = []
+    for postcode in postcodes:
+        start = time.perf_counter()
+        conn.execute(query, (postcode,)).fetchone()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def summarize(latencies):
+    """p50/p95/p99/mean/max of a latency list"""
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "lookups": len(latencies),
+        "p50_us": round(cuts[49], 1),
+        "p95_us": round(cuts[94], 1),
+        "p99_us": round(cuts[98], 1),
+        "mean_us": round(statistics.fmean(latencies), 1),
+        "max_us": round(max(latencies), 1)
+    }
+
+
+def benchmark_profile(db_path, profile, query, postcodes, repeat, drop_caches):
+    """Cold and warm latency summaries for one read profile"""
+    if drop_caches:
+        drop_os_caches()
+
+    conn = open_profile(db_path, profile)
+    try:
+        cold = time_lookups(conn, query, postcodes)
+        warm = []
+        for _ in range(repeat):
+            warm.extend(time_lookups(conn, query, postcodes))
+        return {
+            "profile": profile,
+            "settings": effective_settings(conn),
+            "cold": summarize(cold),
+            "warm": summarize(warm)
+        }
+    finally:
+        conn.close()
+
+
+def print_results(results):
+    """Latency table followed by the effective settings per profile"""
+    print()
+    print(f"{'profile':<10} {'phase':<6} {'lookups':>8} {'p50 µs':>9} {'p95 µs':>9} {'p99 µs':>9} {'mean µs':>9} {'max µs':>10}")
+    for result in results:
+        for phase in ("cold", "warm"):
+            s = result[phase]
+            print(
+                f"{result['profile']:<10} {phase:<6} {s['lookups']:>8} {s['p50_us']:>9} {s['p95_us']:>9} "
+                f"{s['p99_us']:>9} {s['mean_us']:>9} {s['max_us']:>10}"
+            )
+    print()
+    for result in results:
+        settings = ", ".join(f"{k}={v}" for k, v in result["settings"].items())
+        print(f"{result['profile']}: {settings}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold and warm lookup latency per read profile")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="SQLite database to read")
+    parser.add_argument("--profiles", nargs="+", choices=READ_PROFILES, default=list(READ_PROFILES),
+                        help="Read profiles to compare, in run order")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Postcodes looked up per pass")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Warm passes over the sample")
+    parser.add_argument("--drop-caches", action="store_true",
+                        help="Drop the OS page cache before each profile (Linux, root)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+    if args.drop_caches and not os.access(DROP_CACHES, os.W_OK):
+        logger.error(f"--drop-caches needs write access to {DROP_CACHES} (run as root)")
+        sys.exit(1)
+
+    source = lookup_source(args.db)
+    postcodes = sample_postcodes(args.db, source, args.samples)
+    if len(postcodes) < 2:
+        logger.error("Not enough postcodes in the database to benchmark")
+        sys.exit(1)
+    logger.info(f"Benchmarking {len(postcodes)} postcodes from {source} in {args.db}")
+    if not args.drop_caches:
+        logger.info("OS page cache is not dropped: cold numbers only cover SQLite's cache")
+
+    results = []
+    for profile in args.profiles:
+        logger.info(f"Profile {profile}...")
+        results.append(benchmark_profile(
+            args.db, profile, LOOKUP_QUERIES[source], postcodes, args.repeat, args.drop_caches
+        ))
+
+    if args.json:
+        print(json.dumps({"db": str(args.db), "source": source, "results": results}, indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: cache-hit throughput of GET /postcode/{postcode}.
+
+Drives the full ASGI app (middleware + route) in-process, without a server or
+HTTP client, so the numbers show the CPU cost per request on one core. Runs
+the same warm-cache workload twice:
+
+- model:      PostcodeResponse construction + response_model validation + JSON encoding
+- serialized: pre-encoded JSON bytes and ETag from the serialized response cache
+
+Usage:
+    DB_PATH=/opt/postcode/geodata/bag-sample.sqlite python3 benchmarks/bench-response-cache.py
+    python3 benchmarks/bench-response-cache.py --requests 50000 --postcodes 200
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.main import app, lifespan  # noqa: E402
+from src.db.connection import DatabasePool  # noqa: E402
+from src.db.repository import repository  # noqa: E402
+
+# Keep request logging out of the measurement (same as POST /debug/log-level)
+logging.getLogger().setLevel(logging.WARNING)
+
+
+async def call(path: str) -> int:
+    """Send one GET request through the ASGI app and return the status code."""
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return status
+
+
+async def sample_postcodes(count: int) -> list:
+    async with DatabasePool.acquire() as conn:
+        async with conn.execute(
+            f"SELECT DISTINCT postcode FROM {repository.source} WHERE postcode != '' LIMIT ?",
+            (count,)
+        ) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+
+async def run(mode: str, paths: list, total: int) -> float:
+    """Run `total` warm-cache requests and return requests per second."""
+    repository.serialized_cache_enabled = mode == "serialized"
+
+    # Warm both caches so only hits are measured
+    for path in paths:
+        assert await call(path) == 200, path
+
+    start = time.perf_counter()
+    for i in range(total):
+        await call(paths[i % len(paths)])
+    elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per mode")
+    parser.add_argument("--postcodes", type=int, default=100, help="Distinct postcodes to cycle through")
+    args = parser.parse_args()
+
+    async with lifespan(app):
+        postcodes = await sample_postcodes(args.postcodes)
+        if not postcodes:
+            print("No postcodes found in database")
+            return
+        paths = [f"/postcode/{pc}" for pc in postcodes]
+
+        print(f"{args.requests:,} cache-hit requests over {len(paths)} postcodes, single core\n")
+        print(f"{'mode':<12} {'req/s':>10} {'us/req':>10}")
+        results = {}
+        for mode in ("model", "serialized"):
+            rps = await run(mode, paths, args.requests)
+            results[mode] = rps
+            print(f"{mode:<12} {rps:>10,.0f} {1e6 / rps:>10.1f}")
+
+        print(f"\nspeedup: {results['serialized'] / results['model']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reverse geocoding latency for urban and rural points.
+
+Calls GeoRepository.nearest_postcodes() in-process against the geoindex
+R-tree, or with --engine memory against the in-memory grid SpatialIndex
+(plus a vectorized nearest_many() pass over all points). Each query point is jittered by up to --jitter metres, so repeated
+rounds do not hit exactly the same SQLite pages. Dense city centres resolve
+within the first radius; rural points need one or more widening steps.
+
+Usage:
+    DB_PATH=/opt/postcode/geodata/bag.sqlite python3 benchmarks/bench-reverse-geocode.py
+    python3 benchmarks/bench-reverse-geocode.py --rounds 500 --limit 3
+    python3 benchmarks/bench-reverse-geocode.py --engine memory
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import settings  # noqa: E402
+from src.core.geo import METERS_PER_DEGREE_LAT  # noqa: E402
+from src.db.connection import DatabasePool  # noqa: E402
+from src.db.geo_repository import geo_repository  # noqa: E402
+from src.db.repository import repository  # noqa: E402
+from src.db.spatial_index import SpatialIndex  # noqa: E402
+
+# Keep per-query logging out of the measurement
+logging.getLogger().setLevel(logging.WARNING)
+
+POINTS = {
+    "urban": [
+        ("Amsterdam Dam", 52.3731, 4.8926),
+        ("Utrecht Dom", 52.0907, 5.1214),
+        ("Rotterdam Centraal", 51.9244, 4.4691),
+        ("Den Haag Binnenhof", 52.0799, 4.3133),
+        ("Eindhoven 18 Septemberplein", 51.4406, 5.4780),
+    ],
+    "rural": [
+        ("Hoge Veluwe", 52.0700, 5.8200),
+        ("Drenthe, Dwingelderveld", 52.8100, 6.4200),
+        ("Friesland, Lauwersmeer", 53.3600, 6.2100),
+        ("Zeeland, Schouwen", 51.7000, 3.8000),
+        ("Noordoostpolder", 52.7000, 5.7500),
+    ],
+}
+
+
+def jitter(lat: float, lon: float, metres: float):
+    """Move a point randomly by up to `metres` in each direction."""
+    dlat = random.uniform(-metres, metres) / METERS_PER_DEGREE_LAT
+    dlon = random.uniform(-metres, metres) / (METERS_PER_DEGREE_LAT * 0.62)  # cos(52 deg)
+    return lat + dlat, lon + dlon
+
+
+async def run(points: list, rounds: int, limit: int, jitter_m: float) -> dict:
+    """Query every point `rounds` times; return latency and radius statistics."""
+    latencies = []
+    radii = []
+    not_found = 0
+
+    for _ in range(rounds):
+        for _, lat, lon in points:
+            qlat, qlon = jitter(lat, lon, jitter_m)
+            start = time.perf_counter()
+            results, radius = await geo_repository.nearest_postcodes(qlat, qlon, limit)
+            latencies.append(time.perf_counter() - start)
+            radii.append(radius)
+            not_found += not results
+
+    latencies.sort()
+    return {
+        "queries": len(latencies),
+        "qps": len(latencies) / sum(latencies),
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "mean_radius_m": statistics.mean(radii),
+        "not_found": not_found,
+    }
+
+
+def run_batch(index: SpatialIndex, points: list, rounds: int, limit: int, jitter_m: float) -> dict:
+    """Query all jittered points in one vectorized nearest_many() call."""
+    queries = [jitter(lat, lon, jitter_m) for _ in range(rounds) for _, lat, lon in points]
+    lats = [lat for lat, _ in queries]
+    lons = [lon for _, lon in queries]
+
+    start = time.perf_counter()
+    positions, _ = index.nearest_many(lats, lons, limit, geo_repository.max_radius_m)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "queries": len(queries),
+        "qps": len(queries) / elapsed,
+        "us_per_point": elapsed / len(queries) * 1e6,
+        "not_found": int((positions[:, 0] < 0).sum()),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200, help="Queries per point")
+    parser.add_argument("--limit", type=int, default=1, help="Postcodes per query")
+    parser.add_argument("--jitter", type=float, default=200.0, help="Random offset per query in metres")
+    parser.add_argument("--engine", choices=["rtree", "memory"], default="rtree", help="Spatial engine")
+    parser.add_argument("--cell", type=float, default=settings.spatial_grid_cell_m, help="Grid cell size in metres (memory engine)")
+    args = parser.parse_args()
+
+    await DatabasePool.initialize(settings.get_db_path_for_env(), pool_size=1)
+    try:
+        index = None
+        if args.engine == "memory":
+            repository.configure_source()
+            start = time.perf_counter()
+            index = await SpatialIndex.load(repository.source, args.cell)
+            geo_repository.attach_index(index)
+            print(f"spatial index: {len(index):,} postcodes, {args.cell:.0f} m cells, "
+                  f"loaded in {time.perf_counter() - start:.2f} s\n")
+        elif not geo_repository.is_available():
+            print("Database has no geoindex R-tree; run bagconv-source/geo-queries first")
+            return
+
+        print(
+            f"nearest {args.limit} postcode(s), {args.rounds} rounds per point, "
+            f"initial radius {geo_repository.initial_radius_m:.0f} m, "
+            f"max {geo_repository.max_radius_m:.0f} m\n"
+        )
+        print(f"{'area':<8} {'queries':>8} {'qps':>8} {'p50 ms':>8} {'p95 ms':>8} {'radius m':>9} {'none':>6}")
+        for area, points in POINTS.items():
+            stats = await run(points, args.rounds, args.limit, args.jitter)
+            print(
+                f"{area:<8} {stats['queries']:>8} {stats['qps']:>8,.0f} {stats['p50_ms']:>8.2f} "
+                f"{stats['p95_ms']:>8.2f} {stats['mean_radius_m']:>9.0f} {stats['not_found']:>6}"
+            )
+
+        if index is not None:
+            print(f"\n{'batch':<8} {'queries':>8} {'qps':>8} {'us/point':>9} {'none':>6}")
+            for area, points in POINTS.items():
+                stats = run_batch(index, points, args.rounds, args.limit, args.jitter)
+                print(
+                    f"{area:<8} {stats['queries']:>8} {stats['qps']:>8,.0f} "
+                    f"{stats['us_per_point']:>9.1f} {stats['not_found']:>6}"
+                )
+    finally:
+        await DatabasePool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Binary Postcode Index Builder - Writes the file served by LOOKUP_ENGINE=mmap
+
+Reads one row per postcode from bag.sqlite (the postcode_geo table when it
+exists, the unilabel view otherwise) and writes a compact, checksummed
+binary file (layout in src/db/binary_index.py) stamped with the BAG version
+from current-bag-version.json. Run after every BAG build:
+
+    python3 build-postcode-index.py --db /opt/postcode/geodata/bag.sqlite \\
+        --output /opt/postcode/geodata/postcodes.bin
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.db.binary_index import BinaryPostcodeIndex, write_binary_index  # noqa: E402
+from src.db.memory_index import LOAD_BATCH_SIZE, LOAD_QUERIES  # noqa: E402
+
+# Configuration
+DEFAULT_DB = Path("/opt/postcode/geodata/bag.sqlite")
+DEFAULT_OUTPUT = Path("/opt/postcode/geodata/postcodes.bin")
+CURRENT_VERSION_FILE = Path("/opt/postcode/current-bag-version.json")
+SAMPLE_EVERY = 500  # Rows re-checked against the written file
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger('build-postcode-index')
+
+
+def read_bag_version(version_file):
+    """BAG version date from the version file, or "" if unavailable"""
+    try:
+        return json.loads(Path(version_file).read_text()).get("version_date") or ""
+    except (OSError, ValueError):
+        logger.warning(f"No BAG version in {version_file}; the index will not be stamped")
+        return ""
+
+
+def iter_postcodes(conn, source, sample):
+    """Yield (postcode, lat, lon, woonplaats) rows, keeping every SAMPLE_EVERY-th in `sample`"""
+    cursor = conn.execute(LOAD_QUERIES[source])
+    seen = 0
+    while True:
+        rows = cursor.fetchmany(LOAD_BATCH_SIZE)
+        if not rows:
+            break
+        for row in rows:
+            if seen % SAMPLE_EVERY == 0 and row[1] is not None and row[2] is not None:
+                sample.append(row)
+            seen += 1
+            yield row
+
+
+def build_index(db_path, output_path, version_file):
+    """Build the binary index and verify it maps and matches the database"""
+    start = time.time()
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postcode_geo'"
+        ).fetchone()
+        source = "postcode_geo" if has_table else "unilabel"
+        bag_version = read_bag_version(version_file)
+
+        logger.info(f"Reading postcodes from {db_path} ({source})...")
+        sample = []
+        summary = write_binary_index(output_path, iter_postcodes(conn, source, sample), bag_version=bag_version)
+
+        # Spot-check the written file against the rows it was built from
+        index = BinaryPostcodeIndex.open(str(output_path))
+        try:
+            for postcode, lat, lon, woonplaats in sample:
+                result = index.get(postcode)
+                if (
+                    result is None
+                    or result["woonplaats"] != (woonplaats or "")
+                    or abs(result["lat"] - lat) > 1e-5
+                    or abs(result["lon"] - lon) > 1e-5
+                ):
+                    raise RuntimeError(f"Index mismatch for {postcode}: {result} != {(lat, lon, woonplaats)}")
+        finally:
+            index.close()
+    finally:
+        conn.close()
+
+    logger.info("✓ Index built!")
+    logger.info(f"  Postcodes: {summary['postcodes']:,}")
+    logger.info(f"  Cities: {summary['cities']:,}")
+    logger.info(f"  Size: {summary['size_bytes'] / (1024 * 1024):.2f} MB")
+    logger.info(f"  BAG version: {bag_version or '-'}")
+    logger.info(f"  sha256: {summary['sha256']}")
+    logger.info(f"  Time: {time.time() - start:.1f}s")
+    logger.info(f"  File: {output_path}")
+    return summary
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description="Build the binary postcode index (LOOKUP_ENGINE=mmap)")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="SQLite database to read")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Binary index file to write")
+    parser.add_argument("--version-file", type=Path, default=CURRENT_VERSION_FILE,
+                        help="BAG version file to stamp into the index")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    try:
+        build_index(args.db, args.output, args.version_file)
+    except Exception as e:
+        logger.error(f"Index build failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
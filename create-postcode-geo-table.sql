@@ -0,0 +1,42 @@
+-- Gematerialiseerde postcode_geo tabel
+-- Doel: 1 lat/lon punt per postcode voor de API, zonder per request de
+-- unilabel view (join over nums, oprs, vbos en vbo_num) uit te voeren.
+-- Vervangt de postcode_geo view uit create-postcode-geo-view.sql.
+--
+-- Draaien na mkindx (ingest), op een schrijfbare kopie van de database:
+--   sqlite3 bag.sqlite < create-postcode-geo-table.sql
+--
+-- WITHOUT ROWID: de primary key B-tree bevat alle kolommen en is dus zelf
+-- de covering index; een lookup is een enkele B-tree probe.
+
+DROP VIEW IF EXISTS postcode_geo;
+DROP TABLE IF EXISTS postcode_geo;
+
+CREATE TABLE postcode_geo (
+    postcode      TEXT PRIMARY KEY,
+    lat           REAL NOT NULL,
+    lon           REAL NOT NULL,
+    woonplaats    TEXT NOT NULL,
+    address_count INTEGER NOT NULL
+) WITHOUT ROWID;
+
+INSERT INTO postcode_geo (postcode, lat, lon, woonplaats, address_count)
+SELECT
+    postcode,
+    lat,
+    lon,
+    woonplaats,
+    COUNT(*)
+FROM unilabel
+WHERE postcode != ''
+  AND lat IS NOT NULL
+  AND lon IS NOT NULL
+GROUP BY postcode;
+
+ANALYZE postcode_geo;
+
+-- Test query:
+-- SELECT * FROM postcode_geo WHERE postcode = '7557NX';
+
+-- Performance check (verwacht: SEARCH postcode_geo USING PRIMARY KEY):
+-- EXPLAIN QUERY PLAN SELECT * FROM postcode_geo WHERE postcode = '7557NX';
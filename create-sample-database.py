@@ -14,6 +14,7 @@ import random
 # Configuration
 SOURCE_DB = Path("/opt/postcode/geodata/bag.sqlite")
 TARGET_DB = Path("/opt/postcode/geodata/bag-sample.sqlite")
+POSTCODE_GEO_SQL = Path(__file__).parent / "create-postcode-geo-table.sql"
 TOTAL_POSTCODES = 1000
 MAJOR_CITY_POSTCODES = 250  # Rest will be random
 
@@ -150,6 +151,7 @@ def create_schema(target_conn, source_conn):
         WHERE type='table'
           AND name NOT LIKE 'geoindex%'
           AND name NOT LIKE 'sqlite_%'
+          AND name != 'postcode_geo'
           AND sql IS NOT NULL
         """
     )
@@ -287,6 +289,15 @@ def create_views(target_conn, source_conn):
     target_conn.commit()
 
 
+def build_postcode_geo(target_conn):
+    """Materialize the postcode_geo lookup table from the sampled data"""
+    logger.info("Building postcode_geo table...")
+
+    target_conn.executescript(POSTCODE_GEO_SQL.read_text(encoding='utf-8'))
+    count = target_conn.execute("SELECT COUNT(*) FROM postcode_geo").fetchone()[0]
+    logger.info(f"  postcode_geo: {count:,} postcodes")
+
+
 def validate_sample_database(db_path):
     """Validate the created sample database"""
     logger.info("Validating sample database...")
@@ -345,11 +356,11 @@ def main():
 
     try:
         # Connect to databases
-        logger.info("\n[1/7] Connecting to source database...")
+        logger.info("\n[1/8] Connecting to source database...")
         source_conn = sqlite3.connect(SOURCE_DB)
 
         # Select postcodes
-        logger.info("\n[2/7] Selecting postcodes...")
+        logger.info("\n[2/8] Selecting postcodes...")
         major_city_postcodes = get_major_city_postcodes(source_conn)
         random_count = TOTAL_POSTCODES - len(major_city_postcodes)
         random_postcodes = get_random_postcodes(source_conn, random_count, major_city_postcodes)
@@ -358,16 +369,16 @@ def main():
         logger.info(f"Total selected: {len(all_postcodes)} postcodes")
 
         # Get all related IDs
-        logger.info("\n[3/7] Gathering related data IDs...")
+        logger.info("\n[3/8] Gathering related data IDs...")
         ids = get_related_ids(source_conn, all_postcodes)
 
         # Create target database
-        logger.info(f"\n[4/7] Creating target database at {TARGET_DB}...")
+        logger.info(f"\n[4/8] Creating target database at {TARGET_DB}...")
         target_conn = sqlite3.connect(TARGET_DB)
         create_schema(target_conn, source_conn)
 
         # Copy data
-        logger.info("\n[5/7] Copying filtered data...")
+        logger.info("\n[5/8] Copying filtered data...")
         copy_table_data(target_conn, source_conn, 'nums', 'id', ids['num_ids'])
         copy_table_data(target_conn, source_conn, 'vbos', 'id', ids['vbo_ids'])
         copy_table_data(target_conn, source_conn, 'oprs', 'id', ids['opr_ids'])
@@ -378,13 +389,17 @@ def main():
         target_conn.commit()
 
         # Create indices
-        logger.info("\n[6/7] Creating indices...")
+        logger.info("\n[6/8] Creating indices...")
         create_indices(target_conn, source_conn)
 
         # Create views
-        logger.info("\n[7/7] Creating views...")
+        logger.info("\n[7/8] Creating views...")
         create_views(target_conn, source_conn)
 
+        # Materialize lookup table
+        logger.info("\n[8/8] Building postcode_geo lookup table...")
+        build_postcode_geo(target_conn)
+
         # Cleanup
         source_conn.close()
         target_conn.close()
@@ -1,20 +1,101 @@
 #!/usr/bin/env python3
 """
 Export Postcodes to CSV - Creates CSV files from the database
+
+Without arguments the sample database (and optionally production) is exported
+interactively. The detailed export (one row per address) runs in parallel:
+
+    python3 export-postcodes-to-csv.py --db /opt/postcode/geodata/bag.sqlite \
+        --detailed --output /opt/postcode/postcodes-detailed.csv.gz --gzip --workers 8
+
+An interrupted detailed export resumes from its checkpoint when run again
+with the same arguments (--restart starts over).
+
+With pyarrow installed, --format parquet or --format arrow writes typed
+columnar files instead (float64 lat/lon, dictionary-encoded text columns,
+uint32 postcode keys); Arrow IPC files are uncompressed and can be
+memory-mapped.
 """
 
-import sqlite3
+import argparse
 import csv
+import gzip
+import json
 import logging
+import os
+import shutil
+import sqlite3
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# Optional columnar output (--format parquet / arrow)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
 # Configuration
 SAMPLE_DB = Path("/opt/postcode/geodata/bag-sample.sqlite")
 PRODUCTION_DB = Path("/opt/postcode/geodata/bag.sqlite")
 OUTPUT_DIR = Path("/opt/postcode")
 
+# Detailed export: postcode prefix ranges, rows per fetchmany()
+DEFAULT_RANGES = 100
+EXPORT_BATCH_ROWS = 10000
+
+DETAILED_FIELDNAMES = [
+    'postcode', 'woonplaats', 'straat', 'huisnummer',
+    'huisletter', 'huistoevoeging', 'lat', 'lon',
+    'oppervlakte', 'gebruiksdoelen', 'num_status', 'vbo_status'
+]
+
+# Columnar output: formats, Parquet row group size, and the text columns that
+# are dictionary-encoded with one dataset-wide dictionary each (the Arrow IPC
+# file format requires the same dictionary in every record batch)
+COLUMNAR_FORMATS = ("parquet", "arrow")
+PARQUET_ROW_GROUP_ROWS = 262144
+
+DICTIONARY_QUERIES = {
+    'woonplaats': "SELECT DISTINCT woonplaats FROM nums WHERE woonplaats IS NOT NULL ORDER BY 1",
+    'straat': "SELECT DISTINCT naam FROM oprs WHERE naam IS NOT NULL ORDER BY 1",
+    'huisletter': "SELECT DISTINCT huisletter FROM nums WHERE huisletter IS NOT NULL ORDER BY 1",
+    'huistoevoeging': "SELECT DISTINCT huistoevoeging FROM nums WHERE huistoevoeging IS NOT NULL ORDER BY 1",
+    'gebruiksdoelen': "SELECT DISTINCT gebruiksdoelen FROM vbos WHERE gebruiksdoelen IS NOT NULL ORDER BY 1",
+    'num_status': "SELECT DISTINCT status FROM nums WHERE status IS NOT NULL ORDER BY 1",
+    'vbo_status': "SELECT DISTINCT status FROM vbos WHERE status IS NOT NULL ORDER BY 1",
+}
+
+# unilabel, unrolled so the planner walks adridx for the range and the
+# ORDER BY (no temp B-tree): SEARCH nums USING INDEX adridx (postcode>? AND postcode<?).
+# {condition} is filled in by range_condition()
+DETAILED_RANGE_QUERY = """
+    SELECT
+        nums.postcode,
+        nums.woonplaats,
+        oprs.naam,
+        nums.huisnummer,
+        nums.huisletter,
+        nums.huistoevoeging,
+        vbos.lat,
+        vbos.lon,
+        vbos.oppervlakte,
+        vbos.gebruiksdoelen,
+        nums.status,
+        vbos.status
+    FROM nums
+    JOIN vbo_num ON vbo_num.num = nums.id
+    JOIN vbos ON vbos.id = vbo_num.vbo
+    JOIN oprs ON oprs.id = nums.ligtAanRef
+    WHERE {condition}
+      AND nums.status != 'Naamgeving ingetrokken'
+    ORDER BY nums.postcode, nums.huisnummer, nums.huisletter, nums.huistoevoeging
+"""
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +104,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def export_postcodes_to_csv(db_path, output_file, detailed=False):
+def export_postcodes_to_csv(db_path, output_file, detailed=False, workers=None, compress=False):
     """
     Export postcodes from database to CSV
 
@@ -31,56 +112,34 @@ def export_postcodes_to_csv(db_path, output_file, detailed=False):
         db_path: Path to SQLite database
         output_file: Output CSV filename
         detailed: If True, export one row per address. If False, one row per postcode.
+        workers: Worker processes for the detailed export (default: CPU count)
+        compress: Gzip the detailed export
     """
-    logger.info(f"Connecting to database: {db_path}")
-    conn = sqlite3.connect(db_path)
-
     output_path = OUTPUT_DIR / output_file
 
     if detailed:
-        # One row per address (can be large)
-        logger.info("Exporting detailed address data (one row per address)...")
-
-        query = """
-            SELECT
-                postcode,
-                woonplaats,
-                straat,
-                huisnummer,
-                huisletter,
-                huistoevoeging,
-                lat,
-                lon,
-                oppervlakte,
-                gebruiksdoelen,
-                num_status,
-                vbo_status
-            FROM unilabel
-            ORDER BY postcode, huisnummer, huisletter, huistoevoeging
-        """
+        # One row per address (can be large): split by postcode range
+        return export_detailed_parallel(db_path, output_path, workers=workers, compress=compress)
 
-        fieldnames = [
-            'postcode', 'woonplaats', 'straat', 'huisnummer',
-            'huisletter', 'huistoevoeging', 'lat', 'lon',
-            'oppervlakte', 'gebruiksdoelen', 'num_status', 'vbo_status'
-        ]
-    else:
-        # One row per postcode (summary)
-        logger.info("Exporting postcode summary (one row per postcode)...")
-
-        query = """
-            SELECT
-                postcode,
-                woonplaats,
-                lat,
-                lon,
-                COUNT(*) as address_count
-            FROM unilabel
-            GROUP BY postcode
-            ORDER BY postcode
-        """
+    logger.info(f"Connecting to database: {db_path}")
+    conn = sqlite3.connect(db_path)
+
+    # One row per postcode (summary)
+    logger.info("Exporting postcode summary (one row per postcode)...")
+
+    query = """
+        SELECT
+            postcode,
+            woonplaats,
+            lat,
+            lon,
+            COUNT(*) as address_count
+        FROM unilabel
+        GROUP BY postcode
+        ORDER BY postcode
+    """
 
-        fieldnames = ['postcode', 'woonplaats', 'lat', 'lon', 'address_count']
+    fieldnames = ['postcode', 'woonplaats', 'lat', 'lon', 'address_count']
 
     cursor = conn.execute(query)
 
@@ -114,6 +173,444 @@ def export_postcodes_to_csv(db_path, output_file, detailed=False):
     return row_count, size_mb
 
 
+def postcode_key(postcode):
+    """
+    Pack a postcode into a uint32 key: "1234AB" -> 1234 * 676 + 0 * 26 + 1.
+
+    Same packing as src/db/memory_index.pack_postcode; keys sort like the
+    postcode strings. Returns None for malformed postcodes.
+    """
+    if not postcode or len(postcode) != 6 or not postcode[:4].isdigit():
+        return None
+    l1 = ord(postcode[4]) - 65
+    l2 = ord(postcode[5]) - 65
+    if not (0 <= l1 < 26 and 0 <= l2 < 26):
+        return None
+    return int(postcode[:4]) * 676 + l1 * 26 + l2
+
+
+def load_dictionaries(conn, names):
+    """Dataset-wide dictionaries (sorted distinct values) for the given columns."""
+    return {name: [row[0] for row in conn.execute(DICTIONARY_QUERIES[name])] for name in names}
+
+
+def _dictionary_type(size):
+    """Smallest signed index type for a dictionary of `size` values."""
+    if size < 2 ** 7:
+        return pa.dictionary(pa.int8(), pa.string())
+    if size < 2 ** 15:
+        return pa.dictionary(pa.int16(), pa.string())
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def columnar_schema(detailed, dictionaries):
+    """Arrow schema of the summary or detailed export."""
+    def text(name):
+        return pa.field(name, _dictionary_type(len(dictionaries[name])))
+
+    if not detailed:
+        return pa.schema([
+            pa.field('postcode', pa.string()),
+            pa.field('postcode_key', pa.uint32()),
+            text('woonplaats'),
+            pa.field('lat', pa.float64()),
+            pa.field('lon', pa.float64()),
+            pa.field('address_count', pa.int32()),
+        ])
+
+    return pa.schema([
+        pa.field('postcode', pa.string()),
+        pa.field('postcode_key', pa.uint32()),
+        text('woonplaats'),
+        text('straat'),
+        pa.field('huisnummer', pa.int32()),
+        text('huisletter'),
+        text('huistoevoeging'),
+        pa.field('lat', pa.float64()),
+        pa.field('lon', pa.float64()),
+        pa.field('oppervlakte', pa.int32()),
+        text('gebruiksdoelen'),
+        text('num_status'),
+        text('vbo_status'),
+    ])
+
+
+class RecordBatchBuilder:
+    """Turns fetchmany() row lists into Arrow record batches of a fixed schema."""
+
+    def __init__(self, schema, fieldnames, dictionaries):
+        """
+        Args:
+            schema: Target schema (see columnar_schema())
+            fieldnames: Names of the query's columns, in order
+            dictionaries: Dictionary values per dictionary-encoded column
+        """
+        self.schema = schema
+        self._source = {name: i for i, name in enumerate(fieldnames)}
+        self._dictionaries = {name: pa.array(values, pa.string()) for name, values in dictionaries.items()}
+        self._indices = {name: {value: i for i, value in enumerate(values)} for name, values in dictionaries.items()}
+
+    def build(self, rows):
+        """Build one record batch from a list of row tuples."""
+        columns = list(zip(*rows))
+        arrays = []
+        for field in self.schema:
+            if field.name == 'postcode_key':
+                values = columns[self._source['postcode']]
+                arrays.append(pa.array([postcode_key(value) for value in values], pa.uint32()))
+            elif pa.types.is_dictionary(field.type):
+                lookup = self._indices[field.name]
+                indices = pa.array([lookup.get(value) for value in columns[self._source[field.name]]],
+                                   field.type.index_type)
+                arrays.append(pa.DictionaryArray.from_arrays(indices, self._dictionaries[field.name]))
+            else:
+                arrays.append(pa.array(columns[self._source[field.name]], field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class ColumnarWriter:
+    """
+    Streaming writer for Parquet or Arrow IPC files.
+
+    Parquet: zstd-compressed, record batches buffered into row groups of
+    PARQUET_ROW_GROUP_ROWS. Arrow: uncompressed IPC file format, batches
+    written as they come, so the file can be memory-mapped.
+    """
+
+    def __init__(self, path, schema, fmt):
+        self.fmt = fmt
+        self.rows = 0
+        self._pending = []
+        self._pending_rows = 0
+        if fmt == 'parquet':
+            self._writer = pq.ParquetWriter(str(path), schema, compression='zstd')
+        else:
+            self._writer = pa.ipc.new_file(str(path), schema)
+
+    def write_batch(self, batch):
+        self.rows += batch.num_rows
+        if self.fmt != 'parquet':
+            self._writer.write_batch(batch)
+            return
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        if self._pending_rows >= PARQUET_ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._writer.write_table(pa.Table.from_batches(self._pending), row_group_size=self._pending_rows)
+            self._pending = []
+            self._pending_rows = 0
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def require_arrow(fmt):
+    """Exit with a hint when a columnar format is requested without pyarrow."""
+    if fmt in COLUMNAR_FORMATS and not ARROW_AVAILABLE:
+        logger.error(f"--format {fmt} requires pyarrow: pip install pyarrow")
+        sys.exit(1)
+
+
+def export_summary_columnar(db_path, output_path, fmt):
+    """
+    Export one row per postcode as Parquet or Arrow, streaming record batches.
+
+    Args:
+        db_path: Path to SQLite database
+        output_path: Output file
+        fmt: "parquet" or "arrow"
+
+    Returns:
+        (row_count, size_mb)
+    """
+    require_arrow(fmt)
+    logger.info(f"Exporting postcode summary from {db_path} as {fmt}...")
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+
+    try:
+        dictionaries = load_dictionaries(conn, ['woonplaats'])
+        builder = RecordBatchBuilder(
+            columnar_schema(False, dictionaries),
+            ['postcode', 'woonplaats', 'lat', 'lon', 'address_count'],
+            dictionaries
+        )
+        writer = ColumnarWriter(output_path, builder.schema, fmt)
+        cursor = conn.execute(
+            "SELECT postcode, woonplaats, lat, lon, COUNT(*) FROM unilabel "
+            "WHERE postcode != '' GROUP BY postcode ORDER BY postcode"
+        )
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_ROWS)
+            if not rows:
+                break
+            writer.write_batch(builder.build(rows))
+        writer.close()
+    finally:
+        conn.close()
+
+    size_mb = Path(output_path).stat().st_size / (1024 * 1024)
+    logger.info(f"✓ Export complete!")
+    logger.info(f"  Rows: {writer.rows:,}")
+    logger.info(f"  Size: {size_mb:.2f} MB")
+    logger.info(f"  File: {output_path}")
+    return writer.rows, size_mb
+
+
+def postcode_ranges(count):
+    """
+    Split the postcode keyspace (4-digit prefixes 0000-9999) into ranges.
+
+    A leading range holds the addresses without a postcode (NULL or ''),
+    which ORDER BY postcode puts first, and the last range is open-ended,
+    so together the ranges cover every row of unilabel.
+
+    Args:
+        count: Number of prefix ranges (1-10000)
+
+    Returns:
+        List of count + 1 (low, high) string bounds; a range holds
+        postcodes with low <= postcode < high. The leading range has
+        low '' (see range_condition()), the last has high None.
+    """
+    step = -(-10000 // count)
+    ranges = [("", "0000")]
+    for start in range(0, 10000, step):
+        end = start + step
+        ranges.append((f"{start:04d}", f"{end:04d}" if end < 10000 else None))
+    return ranges
+
+
+def range_condition(low, high):
+    """WHERE condition and parameters selecting one postcode range."""
+    if low == "":
+        return "(nums.postcode IS NULL OR nums.postcode < ?)", (high,)
+    if high is None:
+        return "nums.postcode >= ?", (low,)
+    return "nums.postcode >= ? AND nums.postcode < ?", (low, high)
+
+
+def range_part_path(parts_dir, low, suffix):
+    """Part file of the range starting at `low`."""
+    return parts_dir / f"part-{low or 'none'}{suffix}"
+
+
+def _open_part(path, compress):
+    """Open a part file for CSV writing (gzip member when compressing)."""
+    if compress:
+        return gzip.open(path, 'wt', newline='', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', newline='', encoding='utf-8')
+
+
+# Record batch builder of a worker process (columnar exports only)
+_worker_builder = None
+
+
+def _init_worker(schema, dictionaries):
+    """Process pool initializer: build the columnar record batch builder once per worker."""
+    global _worker_builder
+    if schema is not None:
+        _worker_builder = RecordBatchBuilder(schema, DETAILED_FIELDNAMES, dictionaries)
+
+
+def export_range(db_path, low, high, part_path, compress):
+    """
+    Export the addresses of one postcode range to a part file (worker process).
+
+    Opens its own read-only connection and walks the adridx index in
+    (postcode, huisnummer, huisletter, huistoevoeging) order, so no sort is
+    needed. The part is CSV, or an Arrow IPC file when the worker was
+    initialized for columnar output, written to a temporary name and renamed
+    when complete.
+
+    Args:
+        db_path: Path to SQLite database
+        low: Inclusive lower postcode bound ('' for the leading range)
+        high: Exclusive upper postcode bound (None for the last range)
+        part_path: Final path of the part file
+        compress: Gzip the part (CSV only)
+
+    Returns:
+        (low, rows, seconds)
+    """
+    start = time.time()
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+    tmp_path = Path(f"{part_path}.tmp")
+    rows = 0
+
+    try:
+        condition, params = range_condition(low, high)
+        cursor = conn.execute(DETAILED_RANGE_QUERY.format(condition=condition), params)
+        if _worker_builder is not None:
+            writer = ColumnarWriter(tmp_path, _worker_builder.schema, 'arrow')
+            while True:
+                batch = cursor.fetchmany(EXPORT_BATCH_ROWS)
+                if not batch:
+                    break
+                writer.write_batch(_worker_builder.build(batch))
+                rows += len(batch)
+            writer.close()
+        else:
+            with _open_part(tmp_path, compress) as part:
+                writer = csv.writer(part)
+                while True:
+                    batch = cursor.fetchmany(EXPORT_BATCH_ROWS)
+                    if not batch:
+                        break
+                    writer.writerows(batch)
+                    rows += len(batch)
+        tmp_path.replace(part_path)
+    finally:
+        conn.close()
+
+    return low, rows, time.time() - start
+
+
+def _load_checkpoint(checkpoint_path, expected):
+    """Finished ranges from a previous run with the same parameters ({low: rows})."""
+    if not checkpoint_path.exists():
+        return {}
+    try:
+        state = json.loads(checkpoint_path.read_text())
+    except (OSError, ValueError):
+        logger.warning(f"Ignoring unreadable checkpoint: {checkpoint_path}")
+        return {}
+    if any(state.get(key) != value for key, value in expected.items()):
+        logger.info("Checkpoint is for a different database or settings; starting over")
+        return {}
+    return state.get("done", {})
+
+
+def _save_checkpoint(checkpoint_path, expected, done):
+    """Atomically record the finished ranges."""
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({**expected, "done": done}, indent=2))
+    tmp_path.replace(checkpoint_path)
+
+
+def export_detailed_parallel(db_path, output_path, workers=None, ranges=DEFAULT_RANGES,
+                             compress=False, restart=False, fmt='csv'):
+    """
+    Export one row per address, split by postcode range over worker processes.
+
+    Each range is written to a part file next to the output; finished ranges
+    are recorded in a checkpoint, so an interrupted run resumes where it
+    stopped. When all ranges are done the parts are combined in postcode
+    order and removed: CSV parts are concatenated (gzip parts are gzip
+    members, so their concatenation is a valid .gz file); columnar parts are
+    Arrow IPC files whose record batches are streamed into the output.
+
+    Args:
+        db_path: Path to SQLite database
+        output_path: Output file (.csv, .csv.gz, .parquet or .arrow)
+        workers: Worker processes (default: CPU count)
+        ranges: Number of postcode prefix ranges
+        compress: Gzip the output (CSV only)
+        restart: Ignore an existing checkpoint
+        fmt: "csv", "parquet" or "arrow"
+
+    Returns:
+        (row_count, size_mb)
+    """
+    db_path = Path(db_path)
+    output_path = Path(output_path)
+    workers = workers or os.cpu_count() or 1
+    parts_dir = output_path.parent / f".{output_path.name}.parts"
+    checkpoint_path = parts_dir / "checkpoint.json"
+    columnar = fmt in COLUMNAR_FORMATS
+    suffix = ".arrow" if columnar else ".csv.gz" if compress else ".csv"
+    require_arrow(fmt)
+
+    stat = db_path.stat()
+    expected = {
+        "database": str(db_path.absolute()),
+        "database_fingerprint": f"{stat.st_size}:{stat.st_mtime_ns}",
+        "ranges": ranges,
+        "compress": compress,
+        "format": "arrow-parts" if columnar else "csv",
+    }
+
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    done = {} if restart else _load_checkpoint(checkpoint_path, expected)
+    all_ranges = postcode_ranges(ranges)
+    pending = [
+        (low, high) for low, high in all_ranges
+        if not (low in done and range_part_path(parts_dir, low, suffix).exists())
+    ]
+
+    logger.info(f"Exporting detailed address data from {db_path}")
+    logger.info(f"  {len(all_ranges)} postcode ranges, {len(all_ranges) - len(pending)} already done, "
+                f"{workers} workers")
+
+    schema = dictionaries = None
+    if columnar:
+        conn = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True)
+        dictionaries = load_dictionaries(conn, list(DICTIONARY_QUERIES))
+        conn.close()
+        schema = columnar_schema(True, dictionaries)
+
+    start = time.time()
+    rows_this_run = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(schema, dictionaries)) as pool:
+        futures = [
+            pool.submit(export_range, str(db_path), low, high, range_part_path(parts_dir, low, suffix), compress)
+            for low, high in pending
+        ]
+        for future in as_completed(futures):
+            low, rows, seconds = future.result()
+            done[low] = rows
+            _save_checkpoint(checkpoint_path, expected, done)
+
+            rows_this_run += rows
+            elapsed = time.time() - start
+            logger.info(
+                f"  [{len(done)}/{len(all_ranges)}] {low or 'no postcode'}: {rows:,} rows in {seconds:.1f}s, "
+                f"total {sum(done.values()):,} rows, {rows_this_run / elapsed:,.0f} rows/s"
+            )
+
+    part_paths = [range_part_path(parts_dir, low, suffix) for low, _ in all_ranges]
+    tmp_output = output_path.with_name(f"{output_path.name}.tmp")
+
+    if columnar:
+        # Stream the memory-mapped parts' record batches into one file
+        writer = ColumnarWriter(tmp_output, schema, fmt)
+        for part_path in part_paths:
+            with pa.memory_map(str(part_path)) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    writer.write_batch(reader.get_batch(i))
+        writer.close()
+    else:
+        # Concatenate parts in postcode order behind a header part
+        header_path = parts_dir / f"header{suffix}"
+        with _open_part(header_path, compress) as header:
+            csv.writer(header).writerow(DETAILED_FIELDNAMES)
+
+        with open(tmp_output, 'wb') as out:
+            for part_path in [header_path] + part_paths:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+    tmp_output.replace(output_path)
+    shutil.rmtree(parts_dir)
+
+    row_count = sum(done.values())
+    size_mb = output_path.stat().st_size / (1024 * 1024)
+    elapsed = time.time() - start
+
+    logger.info(f"✓ Export complete!")
+    logger.info(f"  Rows: {row_count:,}")
+    logger.info(f"  Size: {size_mb:.2f} MB")
+    logger.info(f"  Time: {elapsed:.1f}s ({rows_this_run / elapsed if elapsed else 0:,.0f} rows/s this run)")
+    logger.info(f"  File: {output_path}")
+
+    return row_count, size_mb
+
+
 def export_unique_cities(db_path, output_file):
     """Export list of unique cities with postcode count"""
     logger.info(f"Exporting unique cities from: {db_path}")
@@ -153,8 +650,73 @@ def export_unique_cities(db_path, output_file):
     return row_count
 
 
+def int_between(low, high=None):
+    """argparse type: an integer in [low, high] (no upper limit when high is None)."""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+        if number < low or (high is not None and number > high):
+            limit = f"between {low} and {high}" if high is not None else f"at least {low}"
+            raise argparse.ArgumentTypeError(f"must be {limit}, got {number}")
+        return number
+    return parse
+
+
+def parse_args():
+    """Command line options; without --db the interactive export runs."""
+    parser = argparse.ArgumentParser(description="Export postcodes to CSV")
+    parser.add_argument("--db", type=Path, help="Database to export (default: interactive sample/production export)")
+    parser.add_argument("--output", type=Path, help="Output file (default: in OUTPUT_DIR, named after the database)")
+    parser.add_argument("--detailed", action="store_true", help="One row per address instead of one per postcode")
+    parser.add_argument("--workers", type=int_between(1), help="Worker processes for --detailed (default: CPU count)")
+    parser.add_argument("--ranges", type=int_between(1, 10000), default=DEFAULT_RANGES,
+                        help=f"Postcode prefix ranges for --detailed, 1-10000 (default: {DEFAULT_RANGES})")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the --detailed output (csv only)")
+    parser.add_argument("--format", choices=("csv",) + COLUMNAR_FORMATS, default="csv",
+                        help="Output format; parquet and arrow need pyarrow (default: csv)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an interrupted --detailed run")
+    return parser.parse_args()
+
+
+def run_export(args):
+    """Export one database as requested on the command line."""
+    if not args.db.exists():
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    require_arrow(args.format)
+    kind = "detailed" if args.detailed else "summary"
+    if args.format in COLUMNAR_FORMATS:
+        suffix = f".{args.format}"
+    else:
+        suffix = ".csv.gz" if args.detailed and args.gzip else ".csv"
+    output_path = args.output or OUTPUT_DIR / f"postcodes-{args.db.stem}-{kind}{suffix}"
+
+    if args.detailed:
+        export_detailed_parallel(
+            args.db,
+            output_path,
+            workers=args.workers,
+            ranges=args.ranges,
+            compress=args.gzip and args.format == "csv",
+            restart=args.restart,
+            fmt=args.format
+        )
+    elif args.format in COLUMNAR_FORMATS:
+        export_summary_columnar(args.db, output_path, args.format)
+    else:
+        export_postcodes_to_csv(args.db, output_path)
+
+
 def main():
     """Main execution"""
+    args = parse_args()
+    if args.db:
+        run_export(args)
+        return
+
     logger.info("=" * 60)
     logger.info("Postcode CSV Exporter")
     logger.info("=" * 60)
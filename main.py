@@ -23,6 +23,7 @@ from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTEN
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.core.logging_config import setup_logging, get_logger
 from src.core.config import settings
+from src.db.connection import ADMIN_LANE, DatabasePool, DatabasePoolTimeout
 
 # Initialize logging system
 setup_logging(debug=settings.is_debug_mode, json_logs=settings.use_json_logs)
@@ -253,6 +254,9 @@ class PostcodeResponse(BaseModel):
 # Database configuration (use settings from config)
 DB_PATH = settings.get_db_path_for_env()
 
+# /api/db-stats runs full-table counts; cut them off instead of tying up the admin lane
+DB_STATS_DEADLINE_SECONDS = 30.0
+
 # Pure ASGI middleware for logging with correlation IDs (NOT BaseHTTPMiddleware!)
 class LoggingMiddleware:
     def __init__(self, app: ASGIApp) -> None:
@@ -357,18 +361,17 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle"""
     logger.info("application_startup", db_path=DB_PATH)
 
-    # Test database connection
+    # Open the lookup and admin query lanes (tests the connection)
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute("SELECT COUNT(*) FROM nums") as cursor:
-                count = await cursor.fetchone()
-                logger.info("database_connected", address_count=count[0], db_path=DB_PATH)
+        await DatabasePool.initialize(db_path=DB_PATH, cache_size=settings.db_cache_statements)
+        logger.info("database_connected", address_count=DatabasePool.get_address_count(), db_path=DB_PATH)
     except Exception as e:
         logger.error("database_connection_failed", error=str(e), db_path=DB_PATH)
         raise
 
     yield
 
+    await DatabasePool.close()
     logger.info("application_shutdown")
 
 # Create FastAPI app
@@ -388,8 +391,9 @@ async def health_check():
     try:
         # Test database connectivity
         query_start = time.time()
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute("SELECT 1")
+        async with DatabasePool.acquire() as db:
+            async with db.execute("SELECT 1") as cursor:
+                await cursor.fetchone()
         query_duration = time.time() - query_start
 
         # Record database health check metric
@@ -447,7 +451,7 @@ async def get_postcode(postcode: str):
     try:
         # Track database query time
         query_start = time.time()
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with DatabasePool.acquire() as db:
             async with db.execute(
                 "SELECT postcode, lat, lon, woonplaats FROM unilabel WHERE postcode = ? LIMIT 1",
                 (postcode,)
@@ -499,6 +503,19 @@ async def get_postcode(postcode: str):
     except HTTPException:
         # Re-raise HTTP exceptions (like 404)
         raise
+    except DatabasePoolTimeout as e:
+        # No free connection, or the query ran past its deadline
+        postcode_lookups_total.labels(
+            service="postcode-api",
+            status="busy"
+        ).inc()
+
+        logger.warning("database_busy", error=str(e), postcode=postcode)
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
     except aiosqlite.Error as e:
         # Record database error
         postcode_lookups_total.labels(
@@ -519,38 +536,37 @@ async def get_metrics():
 
 @app.get("/api/db-stats")
 async def get_db_stats():
-    """Get detailed database statistics"""
+    """Get detailed database statistics (full scans: admin lane, bounded by a deadline)"""
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with DatabasePool.acquire(ADMIN_LANE, deadline=DB_STATS_DEADLINE_SECONDS) as db:
             stats = {}
 
             # Count records in each table
             tables = ['nums', 'vbos', 'oprs', 'pnds', 'unilabel']
             for table in tables:
-                try:
-                    async with db.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
-                        count = await cursor.fetchone()
-                        stats[f'{table}_count'] = count[0]
-                except:
+                if DatabasePool.get_object_type(table) is None:
                     stats[f'{table}_count'] = 0
+                    continue
+                async with db.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+                    count = await cursor.fetchone()
+                    stats[f'{table}_count'] = count[0]
 
-            # Get unique postcodes count
-            try:
+            # Unique postcodes and cities (0 without the unilabel view)
+            stats['unique_postcodes'] = 0
+            stats['unique_cities'] = 0
+            if DatabasePool.get_object_type('unilabel') is not None:
                 async with db.execute("SELECT COUNT(DISTINCT postcode) FROM unilabel") as cursor:
                     count = await cursor.fetchone()
                     stats['unique_postcodes'] = count[0]
-            except:
-                stats['unique_postcodes'] = 0
 
-            # Get unique cities count
-            try:
                 async with db.execute("SELECT COUNT(DISTINCT woonplaats) FROM unilabel") as cursor:
                     count = await cursor.fetchone()
                     stats['unique_cities'] = count[0]
-            except:
-                stats['unique_cities'] = 0
 
             return stats
+    except DatabasePoolTimeout as e:
+        logger.warning("database_stats_busy", error=str(e), db_path=DB_PATH)
+        return JSONResponse(status_code=503, content={"error": str(e)}, headers={"Retry-After": "5"})
     except Exception as e:
         logger.error("database_stats_error", error=str(e), db_path=DB_PATH)
         return {"error": str(e)}
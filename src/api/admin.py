@@ -0,0 +1,91 @@
+"""
+Admin endpoints: dataset reload without restart.
+
+Disabled (404) unless ADMIN_TOKEN is set; requests must then send
+`Authorization: Bearer <ADMIN_TOKEN>`. Unlike /debug, these endpoints stay
+available in production mode.
+"""
+
+import hmac
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.db.reload import ReloadInProgress, ReloadRejected, reload_dataset, reload_state
+
+logger = get_logger(__name__)
+
+
+async def require_admin_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Check the admin bearer token.
+
+    Raises:
+        HTTPException 404: If no ADMIN_TOKEN is configured
+        HTTPException 401: If the token is missing or wrong
+    """
+    if not settings.admin_token:
+        raise HTTPException(404, "Not found")
+
+    expected = f"Bearer {settings.admin_token}".encode()
+    if authorization is None or not hmac.compare_digest(authorization.encode(), expected):
+        logger.warning("admin_token_rejected")
+        raise HTTPException(401, "Invalid or missing admin token", headers={"WWW-Authenticate": "Bearer"})
+
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_token)],
+    include_in_schema=bool(settings.admin_token)
+)
+
+
+@admin_router.post(
+    "/reload",
+    responses={
+        200: {"description": "New dataset validated and serving"},
+        401: {"description": "Invalid or missing admin token"},
+        409: {"description": "A reload is already running"},
+        422: {"description": "New dataset failed validation; the current one keeps serving"},
+        500: {"description": "New dataset could not be opened; the current one keeps serving"}
+    },
+    summary="Reload the dataset without restart"
+)
+async def reload(
+    db_path: Optional[str] = Query(
+        None, description="New database file (default: reopen the current path)"
+    )
+) -> Dict[str, Any]:
+    """
+    Open, validate and swap in a new database file.
+
+    Lookups keep being served from the current dataset until the new one has
+    passed validation; queries running at the swap finish on the old file.
+    Only the worker that receives the request reloads (see
+    RELOAD_WATCH_ENABLED for multi-worker deployments).
+
+    Returns:
+        Reload state (status, db_path, address_count, primed, duration_seconds)
+    """
+    try:
+        return await reload_dataset(db_path=db_path, trigger="admin")
+    except ReloadInProgress as e:
+        raise HTTPException(409, str(e))
+    except ReloadRejected as e:
+        raise HTTPException(422, str(e))
+    except Exception as e:
+        raise HTTPException(500, f"Dataset reload failed: {e}")
+
+
+@admin_router.get("/reload", summary="Status of the last dataset reload")
+async def reload_status() -> Dict[str, Any]:
+    """
+    Report the outcome of the last reload.
+
+    Returns:
+        Reload state (status, trigger, db_path, reloads, error, ...)
+    """
+    return reload_state.to_dict()
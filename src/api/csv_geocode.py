@@ -0,0 +1,325 @@
+"""
+Streaming bulk geocoding of CSV uploads: POST /geocode/csv.
+
+The request body is read incrementally while the enriched CSV streams back,
+so memory use is bounded by the batch size, not the file size:
+
+    upload chunks -> decode -> complete records -> csv.reader
+        -> repository.get_postcodes() per batch -> csv.writer -> response chunks
+
+Each batch is resolved with one get_postcodes() call (cache, then batched
+`IN` queries, or the in-memory engine). Three columns are appended to every
+row: lat, lon and woonplaats (empty when the postcode is invalid or unknown).
+
+Clients must read the response while uploading (full duplex), e.g.:
+
+    curl -T customers.csv -X POST -H "Content-Type: text/csv" \\
+        "http://localhost:7777/geocode/csv?delimiter=;" -o geocoded.csv
+"""
+
+import codecs
+import csv
+import io
+import time
+from collections import Counter
+from typing import AsyncIterator, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.api.routes import is_valid_postcode, normalize_postcode
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.db.repository import repository
+
+logger = get_logger(__name__)
+
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import geocode_csv_rows_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+csv_router = APIRouter(tags=["Postcode Lookup"])
+
+ALLOWED_DELIMITERS = {",", ";", "\t", "|"}
+APPENDED_COLUMNS = ["lat", "lon", "woonplaats"]
+EMPTY_COLUMNS = ("", "", "")
+
+
+class CsvFormatError(ValueError):
+    """Raised when the upload is not parseable as CSV within the configured limits."""
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse for handlers that keep reading the request body.
+
+    Starlette's StreamingResponse listens for disconnect by calling
+    `receive()` concurrently, which would swallow the body messages that
+    request.stream() is still waiting for. A disconnect surfaces instead as
+    ClientDisconnect from request.stream().
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
+
+
+class CsvRecordBuffer:
+    """
+    Turns arbitrary byte chunks into text holding only complete CSV records.
+
+    A record ends at a newline outside quotes; with RFC 4180 quoting (a quote
+    inside a field is doubled) that is a newline after an even number of
+    quote characters since the last record boundary.
+    """
+
+    def __init__(self, max_record_bytes: int):
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        self._pending = ""
+        self._max_record_bytes = max_record_bytes
+
+    def feed(self, data: bytes) -> str:
+        """Add a chunk; return the complete records it finishes (possibly "")."""
+        text = self._pending + self._decoder.decode(data)
+        complete, self._pending = self._split_complete(text)
+
+        if len(self._pending) > self._max_record_bytes:
+            raise CsvFormatError(
+                f"CSV record longer than {self._max_record_bytes} characters (unbalanced quotes?)"
+            )
+        return complete
+
+    def flush(self) -> str:
+        """Return what is left at end of input (a last record without newline)."""
+        text = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        return text
+
+    @staticmethod
+    def _split_complete(text: str) -> Tuple[str, str]:
+        end = text.rfind("\n") + 1
+        if end == 0:
+            return "", text
+
+        # Fast path: no quoted newline can straddle the last newline
+        if text.count('"', 0, end) % 2 == 0:
+            return text[:end], text[end:]
+
+        boundary = 0
+        quotes = 0
+        position = 0
+        for line in text[:end].split("\n")[:-1]:
+            quotes += line.count('"')
+            position += len(line) + 1
+            if quotes % 2 == 0:
+                boundary = position
+        return text[:boundary], text[boundary:]
+
+
+def resolve_postcode_column(header: List[str], column: Optional[str], has_header: bool) -> int:
+    """
+    Find the postcode column index.
+
+    Args:
+        header: First record of the file
+        column: Column name (matched case-insensitively) or zero-based index;
+            None means the column named "postcode", or column 0 without a header
+        has_header: Whether the first record is a header row
+
+    Raises:
+        CsvFormatError: If the column does not exist
+    """
+    if column is None:
+        column = "postcode" if has_header else "0"
+
+    if column.isdigit():
+        index = int(column)
+        if index >= len(header):
+            raise CsvFormatError(f"postcode_column {index} out of range: the file has {len(header)} columns")
+        return index
+
+    if not has_header:
+        raise CsvFormatError("postcode_column must be a column index when has_header=false")
+
+    names = [name.strip().lower() for name in header]
+    if column.strip().lower() not in names:
+        raise CsvFormatError(f"No column named {column!r} in the CSV header")
+    return names.index(column.strip().lower())
+
+
+async def geocode_rows(rows: List[List[str]], column: int) -> List[List[str]]:
+    """
+    Append lat, lon and woonplaats to each row, resolving postcodes in one batch.
+
+    Each distinct postcode value is normalized, looked up and formatted once
+    per batch; rows too short to hold the postcode column get empty values.
+    """
+    values = [row[column] if len(row) > column else "" for row in rows]
+    normalized = {value: normalize_postcode(value) for value in set(values)}
+    valid = [postcode for postcode in set(normalized.values()) if is_valid_postcode(postcode)]
+    found = await repository.get_postcodes(valid) if valid else {}
+
+    appended = {}
+    for value, postcode in normalized.items():
+        result = found.get(postcode)
+        if result is not None:
+            appended[value] = (str(result["lat"]), str(result["lon"]), result["woonplaats"])
+        else:
+            appended[value] = EMPTY_COLUMNS
+
+    for row, value in zip(rows, values):
+        row.extend(appended[value])
+
+    if METRICS_AVAILABLE:
+        found_count = invalid_count = 0
+        for value, count in Counter(values).items():
+            if appended[value] is not EMPTY_COLUMNS:
+                found_count += count
+            elif not is_valid_postcode(normalized[value]):
+                invalid_count += count
+        if found_count:
+            geocode_csv_rows_total.labels(result="found").inc(found_count)
+        if len(values) - found_count - invalid_count:
+            geocode_csv_rows_total.labels(result="not_found").inc(len(values) - found_count - invalid_count)
+        if invalid_count:
+            geocode_csv_rows_total.labels(result="invalid").inc(invalid_count)
+
+    return rows
+
+
+@csv_router.post(
+    "/geocode/csv",
+    responses={
+        200: {
+            "description": "Input CSV with lat, lon and woonplaats columns appended (streamed)",
+            "content": {"text/csv": {}}
+        },
+        400: {"description": "Invalid parameters, no postcode column, or empty upload"}
+    },
+    summary="Geocode a CSV file (streaming)"
+)
+async def geocode_csv(
+    request: Request,
+    postcode_column: Optional[str] = Query(
+        None, description='Postcode column name or zero-based index (default: "postcode")'
+    ),
+    delimiter: str = Query(",", description="Field delimiter: , ; | or a tab"),
+    has_header: bool = Query(True, description="First row is a header row")
+) -> DuplexStreamingResponse:
+    """
+    Geocode an uploaded CSV file of any size.
+
+    The body is the raw CSV (UTF-8, optional BOM), not a multipart form.
+    Rows are parsed as they arrive and written back in input order with
+    lat, lon and woonplaats appended; fields stay empty for invalid or
+    unknown postcodes. The header row (if any) gets the three column names.
+
+    Errors after streaming has started (a database failure, or a record
+    over GEOCODE_CSV_MAX_RECORD_BYTES) abort the response, so a truncated
+    download signals failure.
+
+    Raises:
+        HTTPException 400: Invalid delimiter, unknown postcode column or empty upload
+    """
+    if delimiter not in ALLOWED_DELIMITERS:
+        raise HTTPException(status_code=400, detail=f"Invalid delimiter: {delimiter!r}. Expected one of , ; | or tab")
+
+    chunks = request.stream()
+    buffer = CsvRecordBuffer(settings.geocode_csv_max_record_bytes)
+
+    # Read up to the first complete record before responding, so a bad
+    # postcode column is still a 400 rather than a broken stream
+    text = ""
+    try:
+        async for chunk in chunks:
+            text += buffer.feed(chunk)
+            if text:
+                break
+        else:
+            text += buffer.flush()
+
+        records = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+        if not records:
+            raise CsvFormatError("Empty CSV upload")
+        column = resolve_postcode_column(records[0], postcode_column, has_header)
+
+    except CsvFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info("geocode_csv_started", postcode_column=column, delimiter=delimiter, has_header=has_header)
+
+    return DuplexStreamingResponse(
+        _stream_geocoded(chunks, buffer, records, column, delimiter, has_header),
+        media_type="text/csv"
+    )
+
+
+async def _stream_geocoded(
+    chunks: AsyncIterator[bytes],
+    buffer: CsvRecordBuffer,
+    records: List[List[str]],
+    column: int,
+    delimiter: str,
+    has_header: bool
+) -> AsyncIterator[bytes]:
+    """Yield the enriched CSV, one batch of records per chunk."""
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=delimiter)
+    start = time.time()
+    rows_done = 0
+
+    if has_header:
+        writer.writerow(records.pop(0) + APPENDED_COLUMNS)
+
+    async def flush_batch(batch: List[List[str]]) -> bytes:
+        nonlocal rows_done
+        if batch:
+            writer.writerows(await geocode_rows(batch, column))
+            rows_done += len(batch)
+        data = out.getvalue().encode("utf-8")
+        out.seek(0)
+        out.truncate()
+        return data
+
+    try:
+        yield await flush_batch(records)
+
+        text = ""
+        ended = False
+        while not ended:
+            try:
+                chunk = await chunks.__anext__()
+                text += buffer.feed(chunk)
+            except StopAsyncIteration:
+                text += buffer.flush()
+                ended = True
+
+            # Parse in batches of at least GEOCODE_CSV_BATCH_BYTES: one
+            # repository call per batch, regardless of the client's chunking
+            if len(text) >= settings.geocode_csv_batch_bytes or (ended and text):
+                batch = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+                text = ""
+                yield await flush_batch(batch)
+
+    except Exception as e:
+        logger.error(
+            "geocode_csv_aborted",
+            rows=rows_done,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        raise
+
+    elapsed = time.time() - start
+    logger.info(
+        "geocode_csv_completed",
+        rows=rows_done,
+        duration_s=round(elapsed, 3),
+        rows_per_second=round(rows_done / elapsed) if elapsed > 0 else None
+    )
@@ -11,7 +11,11 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from src.core.config import settings
 from src.db.repository import repository
+from src.db.address_repository import address_repository
+from src.db.geo_repository import geo_repository
 from src.db.connection import DatabasePool
+from src.db.reload import reload_state
+from src.db.warmup import warmup_state
 from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -56,6 +60,8 @@ async def cache_statistics():
 
     return {
         "cache": stats,
+        "address_cache": address_repository.get_cache_stats(),
+        "warmup": warmup_state.to_dict(),
         "timestamp": datetime.utcnow().isoformat(),
         "cache_enabled": settings.enable_response_cache
     }
@@ -104,7 +110,8 @@ async def performance_metrics():
         },
         "database": {
             "connected": db_healthy,
-            "path": settings.db_path
+            "path": settings.db_path,
+            "pool": DatabasePool.get_stats()
         },
         "config": {
             "log_level": settings.log_level,
@@ -153,6 +160,7 @@ async def health_detailed():
         "database": {
             "connected": db_healthy,
             "pool_initialized": DatabasePool.is_initialized(),
+            "pool": DatabasePool.get_stats(),
             "path": settings.get_db_path_for_env()
         },
         "cache": {
@@ -246,12 +254,44 @@ async def get_configuration():
     return {
         "database": {
             "path": settings.db_path,
-            "cache_statements": settings.db_cache_statements
+            "cache_statements": settings.db_cache_statements,
+            "pool_size": settings.db_pool_size,
+            "pool_timeout_seconds": settings.db_pool_timeout_seconds,
+            "pool_max_waiters": settings.db_pool_max_waiters,
+            "query_deadline_seconds": settings.db_query_deadline_seconds,
+            "admin_pool_size": settings.db_admin_pool_size,
+            "admin_pool_timeout_seconds": settings.db_admin_pool_timeout_seconds,
+            "admin_pool_max_waiters": settings.db_admin_pool_max_waiters,
+            "admin_query_deadline_seconds": settings.db_admin_query_deadline_seconds,
+            "read_profile": settings.db_read_profile,
+            "immutable": settings.db_immutable,
+            "mmap_size_mb": settings.db_mmap_size_mb,
+            "page_cache_mb": settings.db_page_cache_mb,
+            "deep_check_enabled": settings.db_deep_check_enabled,
+            "postcode_source": settings.postcode_source,
+            "postcode_source_active": repository.source,
+            "lookup_engine": settings.lookup_engine,
+            "lookup_engine_active": repository.engine,
+            "binary_index_path": settings.binary_index_path,
+            "spatial_engine": settings.spatial_engine,
+            "spatial_engine_active": geo_repository.engine,
+            "spatial_index": geo_repository.get_index_stats()
         },
         "cache": {
             "enabled": settings.enable_response_cache,
             "max_size": settings.cache_max_size,
-            "ttl_seconds": settings.cache_ttl_seconds
+            "ttl_seconds": settings.cache_ttl_seconds,
+            "negative_enabled": settings.enable_negative_cache,
+            "negative_max_size": settings.negative_cache_max_size,
+            "negative_ttl_seconds": settings.negative_cache_ttl_seconds
+        },
+        "reload": {
+            "admin_enabled": bool(settings.admin_token),
+            "watch_enabled": settings.reload_watch_enabled,
+            "watch_interval_seconds": settings.reload_watch_interval_seconds,
+            "min_row_ratio": settings.reload_min_row_ratio,
+            "min_sample_hit_ratio": settings.reload_min_sample_hit_ratio,
+            "last": reload_state.to_dict()
         },
         "api": {
             "title": settings.api_title,
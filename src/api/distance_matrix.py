@@ -0,0 +1,97 @@
+"""
+Streaming encoders for POST /distance-matrix.
+
+The matrix is computed once as a NumPy array; these generators turn it into
+response chunks of about CHUNK_BYTES, so a large matrix is never held as one
+encoded string. Both are plain generators: Starlette iterates them in its
+threadpool, keeping the encoding work off the event loop.
+
+Binary format (all little-endian):
+- header:   magic b"PCDM", uint16 version, uint16 reserved, uint32 rows, uint32 cols
+- statuses: one uint8 per origin, then one per destination
+            (0 = found, 1 = not_found, 2 = invalid)
+- matrix:   rows x cols float32 distances in metres, row-major; NaN where the
+            origin or destination was not found or invalid
+"""
+
+import json
+import struct
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+MATRIX_MAGIC = b"PCDM"
+MATRIX_VERSION = 1
+MATRIX_HEADER = struct.Struct("<4sHHII")
+
+STATUS_CODES = {"found": 0, "not_found": 1, "invalid": 2}
+
+# Target size of one streamed chunk
+CHUNK_BYTES = 64 * 1024
+
+
+def _rows_per_chunk(cols: int, bytes_per_value: int) -> int:
+    """Matrix rows that fit in one chunk (at least one)."""
+    return max(1, CHUNK_BYTES // max(1, cols * bytes_per_value))
+
+
+def stream_json(
+    origins: List[Dict[str, str]],
+    destinations: List[Dict[str, str]],
+    matrix: np.ndarray
+) -> Iterator[bytes]:
+    """
+    Encode a distance matrix as JSON, a block of rows at a time.
+
+    Args:
+        origins: Per-origin {"query", "postcode", "status"} in input order
+        destinations: Per-destination items, same shape
+        matrix: float64 distances in metres, NaN where unresolved
+
+    Yields:
+        UTF-8 chunks of {"origins": [...], "destinations": [...], "unit": "m",
+        "distances": [[...], ...]} with distances rounded to 0.1 m and null
+        where unresolved
+    """
+    head = json.dumps({"origins": origins, "destinations": destinations, "unit": "m"})
+    yield (head[:-1] + ', "distances": [').encode()
+
+    rounded = np.round(matrix, 1)
+    step = _rows_per_chunk(matrix.shape[1], 8)
+
+    for start in range(0, len(rounded), step):
+        rows = []
+        for row in rounded[start:start + step]:
+            values = row.tolist()
+            for col in np.flatnonzero(np.isnan(row)):
+                values[col] = None
+            rows.append(json.dumps(values, separators=(",", ":")))
+        prefix = "," if start else ""
+        yield (prefix + ",".join(rows)).encode()
+
+    yield b"]}"
+
+
+def stream_binary(
+    origin_statuses: List[str],
+    destination_statuses: List[str],
+    matrix: np.ndarray
+) -> Iterator[bytes]:
+    """
+    Encode a distance matrix in the compact binary format (see module docstring).
+
+    Args:
+        origin_statuses: Per-origin status in input order
+        destination_statuses: Per-destination status in input order
+        matrix: float64 distances in metres, NaN where unresolved
+
+    Yields:
+        Header plus status bytes, then blocks of float32 rows
+    """
+    rows, cols = matrix.shape
+    statuses = bytes(STATUS_CODES[status] for status in origin_statuses + destination_statuses)
+    yield MATRIX_HEADER.pack(MATRIX_MAGIC, MATRIX_VERSION, 0, rows, cols) + statuses
+
+    step = _rows_per_chunk(cols, 4)
+    for start in range(0, rows, step):
+        yield matrix[start:start + step].astype("<f4").tobytes()
@@ -0,0 +1,136 @@
+"""
+Bulk export endpoints: the full postcode dataset as NDJSON or CSV.
+
+Responses carry a strong ETag and Last-Modified derived from the dataset
+(its dataset_meta checksum and BAG version), so clients can poll with
+If-None-Match / If-Modified-Since and only download again after a new BAG
+extract was ingested.
+"""
+
+import traceback
+from email.utils import parsedate_to_datetime
+from itertools import chain
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.api.routes import etag_matches
+from src.core.logging_config import get_logger
+from src.db.export import (
+    EXPORT_FORMATS,
+    current_bag_version,
+    export_validators,
+    iter_export,
+    try_acquire_export_slot
+)
+from src.db.repository import repository
+
+logger = get_logger(__name__)
+
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import export_requests_total
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+export_router = APIRouter(prefix="/export", tags=["Export"])
+
+EXPORT_RESPONSES = {
+    200: {"description": "All postcodes, ordered by postcode (streamed)"},
+    304: {"description": "Not modified since the client's copy (same dataset)"},
+    503: {"description": "Too many exports running; retry later"}
+}
+
+
+def _not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if request.headers.get("if-none-match") is not None:
+        # The export always exists for the current dataset, so "*" matches
+        return etag_matches(request, etag, exists=True)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def _export(request: Request, fmt: str) -> Response:
+    """Serve one export format with conditional request handling."""
+    source = repository.source
+    version_date = current_bag_version()
+    etag, last_modified = export_validators(fmt, source, version_date)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": "no-cache"
+    }
+
+    if _not_modified(request, etag, last_modified):
+        if METRICS_AVAILABLE:
+            export_requests_total.labels(format=fmt, result="not_modified").inc()
+        return Response(status_code=304, headers=headers)
+
+    if not try_acquire_export_slot():
+        if METRICS_AVAILABLE:
+            export_requests_total.labels(format=fmt, result="busy").inc()
+        logger.warning("export_rejected_busy", format=fmt)
+        raise HTTPException(
+            status_code=503,
+            detail="Too many exports running, please retry later",
+            headers={"Retry-After": "30"}
+        )
+
+    # The iterator owns the slot from here; advancing it once opens the
+    # database and runs the query, so failures are still a clean 500
+    rows = iter_export(fmt, source)
+    try:
+        first = await run_in_threadpool(next, rows)
+    except Exception as e:
+        rows.close()
+        logger.error(
+            "export_failed",
+            format=fmt,
+            source=source,
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(status_code=500, detail="Internal server error occurred")
+
+    if METRICS_AVAILABLE:
+        export_requests_total.labels(format=fmt, result="streamed").inc()
+    logger.info("export_started", format=fmt, source=source, etag=etag)
+
+    file_date = (version_date or "")[:10] or "current"
+    headers["Content-Disposition"] = f'attachment; filename="postcodes-{file_date}.{fmt}"'
+    return StreamingResponse(chain([first], rows), media_type=EXPORT_FORMATS[fmt], headers=headers)
+
+
+@export_router.get("/postcodes.ndjson", responses=EXPORT_RESPONSES, summary="Export all postcodes as NDJSON")
+async def export_postcodes_ndjson(request: Request) -> Response:
+    """
+    Stream every postcode as newline-delimited JSON.
+
+    One object per line: {"postcode", "woonplaats", "lat", "lon", "address_count"}.
+    Conditional requests (If-None-Match, If-Modified-Since) return 304 while
+    the BAG version is unchanged.
+    """
+    return await _export(request, "ndjson")
+
+
+@export_router.get("/postcodes.csv", responses=EXPORT_RESPONSES, summary="Export all postcodes as CSV")
+async def export_postcodes_csv(request: Request) -> Response:
+    """
+    Stream every postcode as CSV with a header row.
+
+    Columns: postcode, woonplaats, lat, lon, address_count. Conditional
+    requests (If-None-Match, If-Modified-Since) return 304 while the BAG
+    version is unchanged.
+    """
+    return await _export(request, "csv")
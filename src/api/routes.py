@@ -5,19 +5,47 @@ All endpoints are documented with OpenAPI schemas and include proper
 error handling with appropriate HTTP status codes.
 """
 
+import hashlib
 import traceback
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
-from src.models.responses import PostcodeResponse, HealthResponse, ErrorResponse
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from src.models.responses import (
+    PostcodeResponse,
+    HealthResponse,
+    ErrorResponse,
+    BatchLookupRequest,
+    BatchLookupResponse,
+    DistanceMatrixRequest,
+    AddressLookupResponse,
+    ReverseGeocodeResponse,
+    NearbyResponse,
+    VersionResponse
+)
 from src.db.repository import repository
-from src.db.connection import DatabasePool
+from src.db.address_repository import address_repository
+from src.db.geo_repository import geo_repository, SpatialIndexUnavailable
+from src.db.connection import DatabasePool, DatabasePoolTimeout
+from src.db.dataset_meta import CHECKSUM_KEY, COUNTED_TABLES, recorded_row_count
+from src.db.warmup import warmup_state
+from src.api.distance_matrix import stream_binary, stream_json
+from src.core.config import settings
+from src.core.geo import haversine_m_array
 from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 # Import Prometheus metrics (gracefully handle if not available)
 try:
-    from src.core.metrics import postcode_lookups_total
+    from src.core.metrics import (
+        postcode_lookups_total,
+        address_lookups_total,
+        distance_matrix_requests_total,
+        distance_matrix_cells
+    )
     METRICS_AVAILABLE = True
 except ImportError:
     METRICS_AVAILABLE = False
@@ -25,6 +53,34 @@ except ImportError:
 # Create API router
 router = APIRouter()
 
+# Encoded /version body and ETag, keyed by (dataset, source, engine, binary index)
+_version_cache: Optional[Tuple[Tuple[Optional[str], str, str, Optional[str]], bytes, str]] = None
+
+
+def normalize_postcode(postcode: str) -> str:
+    """Normalize postcode input: uppercase, no spaces."""
+    return postcode.upper().strip().replace(" ", "")
+
+
+def is_valid_postcode(postcode: str) -> bool:
+    """Check a normalized postcode is 4 digits followed by 2 letters."""
+    return len(postcode) == 6 and postcode[:4].isdigit() and postcode[4:].isalpha()
+
+
+def etag_matches(request: Request, etag: str, exists: bool = False) -> bool:
+    """
+    Check If-None-Match (a list of tags, possibly weak, or "*") against an ETag.
+
+    "*" matches any current representation, so it only counts when the
+    caller knows one exists; a postcode ETag is known before the lookup
+    has shown whether the postcode is there.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return (exists and "*" in tags) or etag in tags or f"W/{etag}" in tags
+
 
 @router.get(
     "/postcode/{postcode}",
@@ -45,12 +101,16 @@ router = APIRouter()
         500: {
             "description": "Internal server error",
             "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded",
+            "model": ErrorResponse
         }
     },
     summary="Lookup Dutch postcode",
     tags=["Postcode Lookup"]
 )
-async def get_postcode(postcode: str) -> PostcodeResponse:
+async def get_postcode(postcode: str, request: Request, response: Response) -> PostcodeResponse:
     """
     Get GPS coordinates and city name for a Dutch postcode.
 
@@ -65,6 +125,11 @@ async def get_postcode(postcode: str) -> PostcodeResponse:
     - Converts to uppercase
     - Validates format
 
+    Responses carry an ETag derived from the dataset version (see GET
+    /version); `If-None-Match` revalidation returns 304 without a lookup
+    until a new dataset is loaded. With CACHE_SERIALIZED_RESPONSES enabled,
+    the pre-encoded JSON body is sent directly.
+
     Returns:
         PostcodeResponse with coordinates and city name
 
@@ -72,12 +137,13 @@ async def get_postcode(postcode: str) -> PostcodeResponse:
         HTTPException 400: Invalid postcode format
         HTTPException 404: Postcode not found
         HTTPException 500: Database error
+        HTTPException 503: All database connections busy
     """
     # Normalize postcode: uppercase, no spaces
-    postcode = postcode.upper().strip().replace(" ", "")
+    postcode = normalize_postcode(postcode)
 
     # Validate postcode format
-    if len(postcode) != 6 or not (postcode[:4].isdigit() and postcode[4:].isalpha()):
+    if not is_valid_postcode(postcode):
         logger.warning("invalid_postcode_format", postcode=postcode)
 
         # Record invalid format metric
@@ -89,8 +155,16 @@ async def get_postcode(postcode: str) -> PostcodeResponse:
             detail=f"Invalid postcode format: {postcode}. Expected format: 1234AB (4 digits + 2 letters)"
         )
 
+    # Revalidation: the ETag only depends on the dataset, so no lookup is needed
+    etag = repository.etag(postcode)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     # Query database (with caching)
     try:
+        if repository.serialized_cache_enabled:
+            return await _get_postcode_serialized(postcode)
+
         result = await repository.get_postcode(postcode)
 
         if not result:
@@ -106,12 +180,21 @@ async def get_postcode(postcode: str) -> PostcodeResponse:
             woonplaats=result["woonplaats"]
         )
 
+        response.headers["ETag"] = etag
         return PostcodeResponse(**result)
 
     except HTTPException:
         # Re-raise HTTP exceptions (400, 404)
         raise
 
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", postcode=postcode, error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
     except Exception as e:
         logger.error(
             "database_error_postcode_lookup",
@@ -126,6 +209,800 @@ async def get_postcode(postcode: str) -> PostcodeResponse:
         )
 
 
+async def _get_postcode_serialized(postcode: str) -> Response:
+    """Serve a lookup from the serialized response cache as raw JSON bytes."""
+    cached = await repository.get_postcode_response(postcode)
+
+    if cached is None:
+        logger.info("postcode_not_found", postcode=postcode)
+        raise HTTPException(
+            status_code=404,
+            detail=f"Postcode {postcode} not found in database"
+        )
+
+    logger.info(
+        "postcode_lookup_successful",
+        postcode=postcode,
+        woonplaats=cached.woonplaats
+    )
+
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={"ETag": cached.etag}
+    )
+
+
+@router.get(
+    "/postcode/{postcode}/nearby",
+    response_model=NearbyResponse,
+    responses={
+        200: {
+            "description": "Postcodes within the radius (possibly none)",
+            "model": NearbyResponse
+        },
+        400: {
+            "description": "Invalid postcode, radius_km, offset or limit",
+            "model": ErrorResponse
+        },
+        404: {
+            "description": "Postcode not found",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded or no spatial index",
+            "model": ErrorResponse
+        }
+    },
+    summary="Postcodes within N km of a postcode",
+    tags=["Reverse Geocoding"]
+)
+async def get_postcode_nearby(
+    postcode: str,
+    radius_km: float = Query(..., description="Search radius in kilometres"),
+    offset: int = Query(0, description="Skip this many results (pagination)"),
+    limit: Optional[int] = Query(None, description="Results per page (default NEARBY_PAGE_SIZE)")
+) -> NearbyResponse:
+    """
+    Find all postcodes within a radius of a postcode's location.
+
+    The centre is the postcode's point as returned by GET /postcode/{postcode};
+    the postcode itself is part of the results. Each result carries the
+    location of the postcode's nearest address and the distance in metres.
+
+    Example: /postcode/3511AB/nearby?radius_km=5&limit=500
+
+    Returns:
+        NearbyResponse with one page of results, nearest first
+
+    Raises:
+        HTTPException 400: Invalid postcode, radius_km, offset or limit
+        HTTPException 404: Postcode not found
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy, or no geoindex
+    """
+    postcode = normalize_postcode(postcode)
+
+    if not is_valid_postcode(postcode):
+        logger.warning("invalid_postcode_format", postcode=postcode)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid postcode format: {postcode}. Expected format: 1234AB (4 digits + 2 letters)"
+        )
+    limit = _validate_nearby_params(radius_km, offset, limit)
+
+    try:
+        centre = await repository.get_postcode(postcode)
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", postcode=postcode, error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_postcode_lookup",
+            postcode=postcode,
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    if not centre:
+        logger.info("postcode_not_found", postcode=postcode)
+        raise HTTPException(
+            status_code=404,
+            detail=f"Postcode {postcode} not found in database"
+        )
+
+    return await _search_nearby(centre["lat"], centre["lon"], radius_km, offset, limit, postcode=postcode)
+
+
+@router.get(
+    "/postcode/{postcode}/{huisnummer}",
+    response_model=AddressLookupResponse,
+    responses={
+        200: {
+            "description": "Address(es) found",
+            "model": AddressLookupResponse
+        },
+        400: {
+            "description": "Invalid postcode, house number, letter or addition",
+            "model": ErrorResponse
+        },
+        404: {
+            "description": "No address with this postcode and house number",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded",
+            "model": ErrorResponse
+        }
+    },
+    summary="Lookup Dutch address (postcode + house number)",
+    tags=["Address Lookup"]
+)
+async def get_address(
+    postcode: str,
+    huisnummer: int,
+    huisletter: Optional[str] = None,
+    toevoeging: Optional[str] = None
+) -> AddressLookupResponse:
+    """
+    Get the addresses, with location, for a postcode and house number.
+
+    Examples:
+    - /postcode/3511AB/12             all addresses with number 12 (12, 12A, 12-2, ...)
+    - /postcode/3511AB/12?huisletter=A
+    - /postcode/3511AB/12?toevoeging=2
+    - /postcode/3511AB/12?huisletter=   only number 12 without a letter
+
+    Returns:
+        AddressLookupResponse with the matching addresses
+
+    Raises:
+        HTTPException 400: Invalid input
+        HTTPException 404: No matching address
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy
+    """
+    postcode = normalize_postcode(postcode)
+
+    error = None
+    if not is_valid_postcode(postcode):
+        error = f"Invalid postcode format: {postcode}. Expected format: 1234AB (4 digits + 2 letters)"
+    elif not 1 <= huisnummer <= 99999:
+        error = f"Invalid huisnummer: {huisnummer}. Expected 1-99999"
+    elif huisletter and not (len(huisletter) == 1 and huisletter.isalpha()):
+        error = f"Invalid huisletter: {huisletter}. Expected a single letter"
+    elif toevoeging and not (len(toevoeging) <= 4 and toevoeging.isalnum()):
+        error = f"Invalid toevoeging: {toevoeging}. Expected up to 4 letters or digits"
+
+    if error:
+        logger.warning("invalid_address_format", postcode=postcode, huisnummer=huisnummer)
+        if METRICS_AVAILABLE:
+            address_lookups_total.labels(result="invalid_format").inc()
+        raise HTTPException(status_code=400, detail=error)
+
+    try:
+        addresses = await address_repository.get_addresses(postcode, huisnummer, huisletter, toevoeging)
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", postcode=postcode, error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_address_lookup",
+            postcode=postcode,
+            huisnummer=huisnummer,
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    if not addresses:
+        logger.info("address_not_found", postcode=postcode, huisnummer=huisnummer)
+        raise HTTPException(
+            status_code=404,
+            detail=f"No address found for {postcode} {huisnummer}"
+        )
+
+    logger.info(
+        "address_lookup_successful",
+        postcode=postcode,
+        huisnummer=huisnummer,
+        addresses=len(addresses)
+    )
+
+    return AddressLookupResponse(postcode=postcode, huisnummer=huisnummer, addresses=addresses)
+
+
+@router.get(
+    "/reverse",
+    response_model=ReverseGeocodeResponse,
+    responses={
+        200: {
+            "description": "Nearest postcode(s) found",
+            "model": ReverseGeocodeResponse
+        },
+        400: {
+            "description": "Invalid limit",
+            "model": ErrorResponse
+        },
+        404: {
+            "description": "No postcode within the maximum search radius",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded or no spatial index",
+            "model": ErrorResponse
+        }
+    },
+    summary="Nearest postcode(s) to a GPS coordinate",
+    tags=["Reverse Geocoding"]
+)
+async def reverse_geocode(
+    lat: float = Query(..., ge=-90.0, le=90.0, description="Latitude (WGS84)"),
+    lon: float = Query(..., ge=-180.0, le=180.0, description="Longitude (WGS84)"),
+    limit: int = Query(1, description="Number of postcodes to return")
+) -> ReverseGeocodeResponse:
+    """
+    Find the postcode(s) nearest to a coordinate.
+
+    Each result carries the location of the postcode's nearest address and
+    the great-circle distance to it in metres. The search radius starts at
+    REVERSE_INITIAL_RADIUS_M and doubles until `limit` postcodes are found,
+    up to REVERSE_MAX_RADIUS_M.
+
+    Example: /reverse?lat=52.0907&lon=5.1214&limit=3
+
+    Returns:
+        ReverseGeocodeResponse with results nearest first
+
+    Raises:
+        HTTPException 400: limit outside 1..REVERSE_MAX_RESULTS
+        HTTPException 404: No postcode within the maximum radius
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy, or no geoindex
+    """
+    if not 1 <= limit <= settings.reverse_max_results:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid limit: {limit}. Expected 1-{settings.reverse_max_results}"
+        )
+
+    try:
+        results, radius = await geo_repository.nearest_postcodes(lat, lon, limit)
+
+    except SpatialIndexUnavailable as e:
+        logger.error("reverse_geocoding_unavailable", error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Reverse geocoding is not available for this database"
+        )
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", lat=lat, lon=lon, error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_reverse_lookup",
+            lat=lat,
+            lon=lon,
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    if not results:
+        logger.info("reverse_not_found", lat=lat, lon=lon, radius_m=radius)
+        raise HTTPException(
+            status_code=404,
+            detail=f"No postcode within {radius:.0f} m of {lat}, {lon}"
+        )
+
+    logger.info(
+        "reverse_lookup_successful",
+        lat=lat,
+        lon=lon,
+        postcode=results[0]["postcode"],
+        distance_m=results[0]["distance_m"],
+        radius_m=radius
+    )
+
+    return ReverseGeocodeResponse(lat=lat, lon=lon, radius_m=radius, results=results)
+
+
+@router.get(
+    "/nearby",
+    response_model=NearbyResponse,
+    responses={
+        200: {
+            "description": "Postcodes within the radius (possibly none)",
+            "model": NearbyResponse
+        },
+        400: {
+            "description": "Invalid radius_km, offset or limit",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded or no spatial index",
+            "model": ErrorResponse
+        }
+    },
+    summary="Postcodes within N km of a GPS coordinate",
+    tags=["Reverse Geocoding"]
+)
+async def get_nearby(
+    lat: float = Query(..., ge=-90.0, le=90.0, description="Latitude (WGS84)"),
+    lon: float = Query(..., ge=-180.0, le=180.0, description="Longitude (WGS84)"),
+    radius_km: float = Query(..., description="Search radius in kilometres"),
+    offset: int = Query(0, description="Skip this many results (pagination)"),
+    limit: Optional[int] = Query(None, description="Results per page (default NEARBY_PAGE_SIZE)")
+) -> NearbyResponse:
+    """
+    Find all postcodes within a radius of a coordinate.
+
+    Example: /nearby?lat=52.0907&lon=5.1214&radius_km=2&offset=100&limit=100
+
+    Returns:
+        NearbyResponse with one page of results, nearest first
+
+    Raises:
+        HTTPException 400: Invalid radius_km, offset or limit
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy, or no geoindex
+    """
+    limit = _validate_nearby_params(radius_km, offset, limit)
+    return await _search_nearby(lat, lon, radius_km, offset, limit)
+
+
+def _validate_nearby_params(radius_km: float, offset: int, limit: Optional[int]) -> int:
+    """Check radius search parameters against the settings; return the page size."""
+    if limit is None:
+        limit = settings.nearby_page_size
+
+    error = None
+    if not 0 < radius_km <= settings.nearby_max_radius_km:
+        error = f"Invalid radius_km: {radius_km}. Expected more than 0, at most {settings.nearby_max_radius_km}"
+    elif offset < 0:
+        error = f"Invalid offset: {offset}. Expected 0 or more"
+    elif not 1 <= limit <= settings.nearby_max_page_size:
+        error = f"Invalid limit: {limit}. Expected 1-{settings.nearby_max_page_size}"
+
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    return limit
+
+
+async def _search_nearby(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    offset: int,
+    limit: int,
+    postcode: Optional[str] = None
+) -> NearbyResponse:
+    """Run a radius search and return one page of it."""
+    try:
+        results, total = await geo_repository.postcodes_in_radius(
+            lat, lon, radius_km * 1000, settings.nearby_max_results
+        )
+
+    except SpatialIndexUnavailable as e:
+        logger.error("nearby_search_unavailable", error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Radius search is not available for this database"
+        )
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", lat=lat, lon=lon, error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_nearby_search",
+            lat=lat,
+            lon=lon,
+            radius_km=radius_km,
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    logger.info(
+        "nearby_search_successful",
+        postcode=postcode,
+        lat=lat,
+        lon=lon,
+        radius_km=radius_km,
+        total=total
+    )
+
+    return NearbyResponse(
+        postcode=postcode,
+        lat=lat,
+        lon=lon,
+        radius_km=radius_km,
+        total=len(results),
+        truncated=total > len(results),
+        offset=offset,
+        limit=limit,
+        results=results[offset:offset + limit]
+    )
+
+
+@router.post(
+    "/postcodes/batch",
+    response_model=BatchLookupResponse,
+    responses={
+        200: {
+            "description": "Batch processed; see per-item status",
+            "model": BatchLookupResponse
+        },
+        400: {
+            "description": "Too many postcodes in one request",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded",
+            "model": ErrorResponse
+        }
+    },
+    summary="Lookup many Dutch postcodes",
+    tags=["Postcode Lookup"]
+)
+async def get_postcodes_batch(request: BatchLookupRequest) -> JSONResponse:
+    """
+    Look up many postcodes in one request.
+
+    Results are returned in input order with a per-item status:
+    - found: coordinates and city name included
+    - not_found: valid format, but not in the database
+    - invalid: not 4 digits + 2 letters after normalization
+
+    Cached postcodes are answered from the cache; all misses are resolved
+    with batched database queries rather than one query per postcode.
+
+    Raises:
+        HTTPException 400: More than BATCH_MAX_POSTCODES postcodes submitted
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy
+    """
+    if len(request.postcodes) > settings.batch_max_postcodes:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many postcodes: {len(request.postcodes)}. "
+                   f"Maximum per request is {settings.batch_max_postcodes}"
+        )
+
+    normalized = [normalize_postcode(query) for query in request.postcodes]
+    valid = [postcode for postcode in normalized if is_valid_postcode(postcode)]
+    invalid_count = len(normalized) - len(valid)
+
+    if METRICS_AVAILABLE and invalid_count:
+        postcode_lookups_total.labels(result="invalid_format").inc(invalid_count)
+
+    try:
+        found = await repository.get_postcodes(valid) if valid else {}
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", postcode_count=len(valid), error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_batch_lookup",
+            postcode_count=len(valid),
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    # Build plain dicts: response is already in its final shape, so skip
+    # per-item model construction and re-validation for large batches
+    results = []
+    found_count = 0
+    for query, postcode in zip(request.postcodes, normalized):
+        item = {"query": query, "postcode": postcode, "status": "invalid"}
+        if is_valid_postcode(postcode):
+            result = found.get(postcode)
+            if result is None:
+                item["status"] = "not_found"
+            else:
+                item.update(result)
+                item["status"] = "found"
+                found_count += 1
+        results.append(item)
+
+    logger.info(
+        "postcode_batch_lookup_completed",
+        requested=len(results),
+        found=found_count,
+        invalid=invalid_count
+    )
+
+    return JSONResponse(content={
+        "results": results,
+        "found": found_count,
+        "not_found": len(results) - found_count - invalid_count,
+        "invalid": invalid_count
+    })
+
+
+@router.post(
+    "/distance-matrix",
+    responses={
+        200: {
+            "description": "Distance matrix in metres (streamed)",
+            "content": {
+                "application/json": {},
+                "application/octet-stream": {}
+            }
+        },
+        400: {
+            "description": "Too many origins, destinations or matrix cells",
+            "model": ErrorResponse
+        },
+        500: {
+            "description": "Internal server error",
+            "model": ErrorResponse
+        },
+        503: {
+            "description": "Database connection pool exhausted or query deadline exceeded",
+            "model": ErrorResponse
+        }
+    },
+    summary="Great-circle distances between many postcodes",
+    tags=["Postcode Lookup"]
+)
+async def get_distance_matrix(request: DistanceMatrixRequest) -> StreamingResponse:
+    """
+    Compute the great-circle distance from every origin to every destination.
+
+    All postcodes are resolved with one batched lookup and the matrix is
+    computed in a single vectorized pass over the postcode points.
+
+    Output (`format`):
+    - json: {"origins": [...], "destinations": [...], "unit": "m",
+      "distances": [[...], ...]}; each origin/destination carries its query,
+      normalized postcode and status (found, not_found, invalid); distances
+      are rounded to 0.1 m, null where either side was not found
+    - binary: header, status bytes and a float32 row-major matrix with NaN
+      for unresolved pairs (layout in src/api/distance_matrix.py)
+
+    Raises:
+        HTTPException 400: More than the configured origins, destinations or cells
+        HTTPException 500: Database error
+        HTTPException 503: All database connections busy
+    """
+    destinations = request.destinations if request.destinations is not None else request.origins
+    cells = len(request.origins) * len(destinations)
+
+    error = None
+    if len(request.origins) > settings.distance_matrix_max_origins:
+        error = f"Too many origins: {len(request.origins)}. Maximum is {settings.distance_matrix_max_origins}"
+    elif len(destinations) > settings.distance_matrix_max_destinations:
+        error = (f"Too many destinations: {len(destinations)}. "
+                 f"Maximum is {settings.distance_matrix_max_destinations}")
+    elif cells > settings.distance_matrix_max_cells:
+        error = f"Matrix too large: {cells} cells. Maximum is {settings.distance_matrix_max_cells}"
+
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    origin_postcodes = [normalize_postcode(query) for query in request.origins]
+    destination_postcodes = [normalize_postcode(query) for query in destinations]
+    valid = [
+        postcode for postcode in origin_postcodes + destination_postcodes
+        if is_valid_postcode(postcode)
+    ]
+
+    try:
+        found = await repository.get_postcodes(valid) if valid else {}
+
+    except DatabasePoolTimeout as e:
+        logger.warning("database_pool_exhausted", postcode_count=len(valid), error=str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="Service busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    except Exception as e:
+        logger.error(
+            "database_error_distance_matrix",
+            postcode_count=len(valid),
+            error=str(e),
+            error_type=type(e).__name__,
+            stack_trace=traceback.format_exc()
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error occurred"
+        )
+
+    origin_items, origin_lats, origin_lons = _matrix_axis(request.origins, origin_postcodes, found)
+    destination_items, destination_lats, destination_lons = _matrix_axis(
+        destinations, destination_postcodes, found
+    )
+
+    # One broadcast haversine over all pairs; NaN coordinates give NaN distances
+    matrix = await run_in_threadpool(
+        haversine_m_array,
+        origin_lats[:, None], origin_lons[:, None],
+        destination_lats[None, :], destination_lons[None, :]
+    )
+
+    if METRICS_AVAILABLE:
+        distance_matrix_requests_total.labels(format=request.format).inc()
+        distance_matrix_cells.observe(cells)
+
+    logger.info(
+        "distance_matrix_computed",
+        origins=len(origin_items),
+        destinations=len(destination_items),
+        resolved=len([result for result in found.values() if result]),
+        format=request.format
+    )
+
+    if request.format == "binary":
+        return StreamingResponse(
+            stream_binary(
+                [item["status"] for item in origin_items],
+                [item["status"] for item in destination_items],
+                matrix
+            ),
+            media_type="application/octet-stream"
+        )
+
+    return StreamingResponse(
+        stream_json(origin_items, destination_items, matrix),
+        media_type="application/json"
+    )
+
+
+def _matrix_axis(
+    queries: List[str],
+    postcodes: List[str],
+    found: Dict[str, Optional[Dict]]
+) -> Tuple[List[Dict[str, str]], np.ndarray, np.ndarray]:
+    """Per-item status plus lat/lon arrays (NaN when unresolved) for one matrix axis."""
+    items = []
+    lats = np.full(len(postcodes), np.nan)
+    lons = np.full(len(postcodes), np.nan)
+
+    for i, (query, postcode) in enumerate(zip(queries, postcodes)):
+        status = "invalid"
+        if is_valid_postcode(postcode):
+            result = found.get(postcode)
+            status = "not_found" if result is None else "found"
+            if result is not None:
+                lats[i] = result["lat"]
+                lons[i] = result["lon"]
+        items.append({"query": query, "postcode": postcode, "status": status})
+
+    return items, lats, lons
+
+
+@router.get(
+    "/version",
+    response_model=VersionResponse,
+    responses={
+        200: {"description": "Dataset currently served"},
+        304: {"description": "Same dataset as the client's copy"}
+    },
+    summary="Dataset version",
+    tags=["Health"]
+)
+async def dataset_version(request: Request) -> Response:
+    """
+    Report the BAG version and ingest metadata of the dataset served.
+
+    The body is built from dataset_meta once per dataset (and source,
+    engine and binary file) and then sent as stored bytes, so polling this
+    endpoint is as cheap as a liveness probe. Clients can compare `dataset` (or revalidate
+    with If-None-Match) to find out when a new BAG extract went live; lookup
+    ETags change at the same moment.
+
+    Returns:
+        VersionResponse
+    """
+    global _version_cache
+
+    index = repository.get_index_stats() if repository.engine == "mmap" else None
+    key = (DatabasePool.dataset_fingerprint(), repository.source, repository.engine, index and index["sha256"])
+    if _version_cache is None or _version_cache[0] != key:
+        meta = DatabasePool.get_dataset_meta()
+        body = VersionResponse(
+            dataset=key[0],
+            bag_version=meta.get("bag_version") or None,
+            built_at=meta.get("built_at") or None,
+            postcodes=int(meta["postcodes"]) if meta.get("postcodes", "").isdigit() else None,
+            postcodes_sha256=meta.get(CHECKSUM_KEY),
+            row_counts={
+                table: count for table in COUNTED_TABLES
+                if (count := recorded_row_count(meta, table)) is not None
+            },
+            address_count=DatabasePool.get_address_count(),
+            source=key[1],
+            engine=key[2],
+            index={
+                name: index[name] for name in ("bag_version", "sha256", "built_at")
+            } if index else None,
+            api_version=settings.api_version
+        ).model_dump_json().encode("utf-8")
+        _version_cache = (key, body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+    _, body, etag = _version_cache
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, etag, exists=True):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -214,7 +1091,8 @@ async def readiness_probe() -> JSONResponse:
     Kubernetes readiness probe endpoint.
 
     Returns 200 if the service is ready to accept traffic.
-    Checks database connectivity.
+    Checks database connectivity, and cache warm-up progress when
+    READINESS_WAIT_FOR_WARMUP is enabled.
 
     Use this for:
     - Kubernetes readinessProbe
@@ -229,6 +1107,12 @@ async def readiness_probe() -> JSONResponse:
             content={"status": "not_ready", "database": "disconnected"}
         )
 
+    if settings.readiness_wait_for_warmup and not warmup_state.finished:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "database": "connected", "warmup": warmup_state.status}
+        )
+
     return JSONResponse(
         status_code=200,
         content={"status": "ready", "database": "connected"}
@@ -20,11 +20,83 @@ class Settings(BaseSettings):
     # Database Configuration
     db_path: str = "/opt/postcode/geodata/bag.sqlite"
     db_cache_statements: int = 100
+    db_pool_size: int = 4                # Read-only connections (one worker thread each)
+    db_pool_timeout_seconds: float = 5.0  # Max wait for a free connection
+    db_pool_max_waiters: int = 1000      # Requests allowed to queue for a connection
+    db_query_deadline_seconds: float = 5.0  # Lookup queries are interrupted after this long (0 = no deadline)
+    db_admin_pool_size: int = 1          # Admin lane: index loads, warm-up top-N, dataset checks
+    db_admin_pool_timeout_seconds: float = 60.0  # Max wait for a free admin connection
+    db_admin_pool_max_waiters: int = 16  # Heavy queries allowed to queue on the admin lane
+    db_admin_query_deadline_seconds: float = 600.0  # Admin queries are interrupted after this long (0 = no deadline)
+    db_read_profile: str = "tuned"       # tuned (settings below), default (mode=ro, SQLite defaults)
+    db_immutable: bool = True            # tuned: open with immutable=1 (no locking); replace the file by rename, never in place
+    db_mmap_size_mb: int = 2000          # tuned: PRAGMA mmap_size (SQLite caps it at its compile-time maximum, ~2 GB)
+    db_page_cache_mb: int = 16           # tuned: PRAGMA cache_size per connection
+    db_deep_check_enabled: bool = False  # After startup, recount tables in the background and compare with dataset_meta
+    postcode_source: str = "auto"        # auto, postcode_geo (materialized table), unilabel (view)
+    lookup_engine: str = "sqlite"        # sqlite, memory (load all postcodes into RAM at startup), mmap (binary index file)
+    binary_index_path: str = "/opt/postcode/geodata/postcodes.bin"  # Written by build-postcode-index.py
 
     # Performance & Caching
     enable_response_cache: bool = True
     cache_max_size: int = 10000
     cache_ttl_seconds: int = 86400  # 24 hours
+    cache_serialized_responses: bool = True  # Cache final JSON bytes + ETag, skip model/encoding on hits
+    enable_negative_cache: bool = True   # Cache not-found postcodes
+    negative_cache_max_size: int = 50000
+    negative_cache_ttl_seconds: int = 3600  # 1 hour
+    batch_max_postcodes: int = 1000  # Max postcodes per POST /postcodes/batch
+    distance_matrix_max_origins: int = 1000        # Max origins per POST /distance-matrix
+    distance_matrix_max_destinations: int = 5000   # Max destinations per POST /distance-matrix
+    distance_matrix_max_cells: int = 1000000       # Max origins x destinations (~8 MB JSON, 4 MB binary)
+    geocode_csv_batch_bytes: int = 262144          # POST /geocode/csv: parse and look up per ~256 KB of input
+    geocode_csv_max_record_bytes: int = 1000000    # Abort uploads with a longer record (unbalanced quotes)
+    address_cache_max_size: int = 50000  # Cached postcode + house number lookups
+    address_cache_ttl_seconds: int = 86400  # 24 hours
+
+    # Reverse Geocoding (geoindex R-tree)
+    reverse_initial_radius_m: float = 250.0  # First search radius; doubles until enough postcodes are found
+    reverse_max_radius_m: float = 5000.0     # Give up beyond this radius
+    reverse_max_results: int = 10            # Max ?limit= for GET /reverse
+    spatial_engine: str = "rtree"            # rtree (geoindex in SQLite), memory (NumPy grid over postcode points)
+    spatial_grid_cell_m: float = 500.0       # Grid cell edge for the memory spatial engine
+
+    # Radius search (GET /nearby, /postcode/{postcode}/nearby)
+    nearby_max_radius_km: float = 10.0       # Largest ?radius_km=
+    nearby_max_results: int = 10000          # Results beyond this many (nearest first) are dropped
+    nearby_page_size: int = 100              # Default ?limit= per page
+    nearby_max_page_size: int = 1000         # Max ?limit= per page
+
+    # Bulk export (GET /export/postcodes.ndjson, /export/postcodes.csv)
+    bag_version_file: str = "/opt/postcode/current-bag-version.json"  # ETag/Last-Modified source
+    export_max_concurrent: int = 2       # Exports streaming at once; more get 503
+    export_batch_rows: int = 5000        # Rows per fetchmany() and response chunk
+
+    # Dataset reload (swap in a new BAG database without restart)
+    admin_token: str = ""                # Bearer token for /admin endpoints; empty disables them
+    reload_watch_enabled: bool = False   # Reload when the database (or binary index) file is replaced
+    reload_watch_interval_seconds: float = 30.0  # File check interval; a change must be stable for one interval
+    reload_min_row_ratio: float = 0.9    # Reject a database with fewer addresses than this x the current one
+    reload_min_sample_hit_ratio: float = 0.95  # Share of sampled postcodes that must resolve in the new database
+    reload_sample_size: int = 100        # Postcodes sampled from the new database when the cache is empty
+    reload_drain_timeout_seconds: float = 30.0  # Wait for queries on the old database before closing it
+
+    # Cache Warm-up (background, at startup)
+    cache_warmup_sources: List[str] = []  # Any of: file, snapshot, top (e.g. '["snapshot","top"]')
+    cache_warmup_file: str = "/opt/postcode/hot-postcodes.txt"  # One postcode per line
+    cache_snapshot_file: str = "/opt/postcode/cache-keys.txt"   # Written at shutdown when "snapshot" is a source
+    cache_warmup_top_n: int = 10000      # Postcodes with most addresses, for the "top" source
+    cache_warmup_concurrency: int = 2    # Batch queries in flight during warm-up
+    readiness_wait_for_warmup: bool = False  # /health/ready returns 503 until warm-up finishes
+
+    # Shared Cache (one cache for all uvicorn workers on a host)
+    shared_cache_enabled: bool = False
+    shared_cache_path: str = "/dev/shm/postcode-api-cache"  # mmap'd file; tmpfs keeps it in RAM
+    shared_cache_slots: int = 262144     # Hash table slots (power of two, 88 bytes each)
+
+    # Cache Snapshot (restore cache contents across restarts)
+    cache_persist_enabled: bool = False  # Dump cache at shutdown, reload it at startup
+    cache_persist_path: str = "/opt/postcode/cache-snapshot.bin"  # Binary snapshot file
 
     # API Configuration
     api_title: str = "Dutch Postcode Geocoding API"
@@ -37,7 +109,7 @@ class Settings(BaseSettings):
     cors_enabled: bool = True
     cors_origins: List[str] = ["*"]
     cors_allow_credentials: bool = False
-    cors_allow_methods: List[str] = ["GET", "HEAD", "OPTIONS"]
+    cors_allow_methods: List[str] = ["GET", "HEAD", "OPTIONS", "POST"]
     cors_allow_headers: List[str] = ["*"]
 
     # Logging Configuration
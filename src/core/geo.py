@@ -0,0 +1,48 @@
+"""
+Great-circle distance helpers for WGS84 coordinates.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8  # Mean Earth radius (IUGG)
+METERS_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_M / 180
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in metres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def haversine_m_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Vectorized haversine distance in metres.
+
+    Arguments are scalars or NumPy arrays and broadcast against each other,
+    e.g. lat1[:, None] with lat2[None, :] gives a full distance matrix.
+    """
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box(lat: float, lon: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """
+    Lat/lon box that contains every point within `radius_m` of (lat, lon).
+
+    Returns:
+        (min_lat, max_lat, min_lon, max_lon)
+    """
+    dlat = radius_m / METERS_PER_DEGREE_LAT
+    dlon = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
@@ -45,6 +45,96 @@ postcode_lookup_duration_seconds = Histogram(
 )
 
 
+# ============================================================================
+# Address Lookup Metrics
+# ============================================================================
+
+address_lookups_total = Counter(
+    'address_lookups_total',
+    'Total postcode + house number lookup requests by result',
+    ['result']  # Values: 'found', 'not_found', 'invalid_format'
+)
+
+address_lookup_duration_seconds = Histogram(
+    'address_lookup_duration_seconds',
+    'Address lookup duration in seconds including cache and database time',
+    ['result'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+
+# ============================================================================
+# Reverse Geocoding Metrics
+# ============================================================================
+
+reverse_lookups_total = Counter(
+    'reverse_lookups_total',
+    'Total reverse geocoding (coordinate to postcode) requests by result',
+    ['result']  # Values: 'found', 'not_found'
+)
+
+reverse_lookup_duration_seconds = Histogram(
+    'reverse_lookup_duration_seconds',
+    'Reverse geocoding duration in seconds including all radius steps',
+    ['result'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+reverse_search_radius_meters = Histogram(
+    'reverse_search_radius_meters',
+    'Final search radius of reverse geocoding requests',
+    buckets=(125, 250, 500, 1000, 2000, 4000, 8000, 16000)
+)
+
+nearby_searches_total = Counter(
+    'nearby_searches_total',
+    'Total radius searches (postcodes within N km) by result',
+    ['result']  # Values: 'found', 'not_found'
+)
+
+nearby_search_duration_seconds = Histogram(
+    'nearby_search_duration_seconds',
+    'Radius search duration in seconds (bounding box query and distance pass)',
+    ['result'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+nearby_results = Histogram(
+    'nearby_results',
+    'Number of postcodes within the radius per search (before pagination)',
+    buckets=(1, 10, 50, 100, 500, 1000, 2500, 5000, 10000)
+)
+
+
+# ============================================================================
+# Distance Matrix Metrics
+# ============================================================================
+
+distance_matrix_requests_total = Counter(
+    'distance_matrix_requests_total',
+    'Total distance matrix requests by output format',
+    ['format']  # Values: 'json', 'binary'
+)
+
+distance_matrix_cells = Histogram(
+    'distance_matrix_cells',
+    'Origins x destinations per distance matrix request',
+    buckets=(100, 1000, 10000, 50000, 100000, 250000, 500000, 1000000)
+)
+
+export_requests_total = Counter(
+    'export_requests_total',
+    'Total bulk export requests by format and result',
+    ['format', 'result']  # result: 'streamed', 'not_modified', 'busy'
+)
+
+geocode_csv_rows_total = Counter(
+    'geocode_csv_rows_total',
+    'Total rows geocoded through POST /geocode/csv by result',
+    ['result']  # Values: 'found', 'not_found', 'invalid'
+)
+
+
 # ============================================================================
 # Cache Metrics
 # ============================================================================
@@ -52,7 +142,7 @@ postcode_lookup_duration_seconds = Histogram(
 cache_operations_total = Counter(
     'cache_operations_total',
     'Total cache operations by result',
-    ['operation']  # Values: 'hit', 'miss'
+    ['operation']  # Values: 'hit', 'miss', 'serialized_hit', 'shared_hit', 'address_hit', 'address_miss'
 )
 
 cache_hit_ratio = Gauge(
@@ -65,6 +155,22 @@ cache_size_current = Gauge(
     'Current number of entries in cache'
 )
 
+cache_coalesced_requests_total = Counter(
+    'cache_coalesced_requests_total',
+    'Cache misses that awaited an in-flight query for the same postcode instead of querying'
+)
+
+negative_cache_operations_total = Counter(
+    'negative_cache_operations_total',
+    'Total negative (not-found) cache lookups by result',
+    ['operation']  # Values: 'hit', 'miss'
+)
+
+negative_cache_size_current = Gauge(
+    'negative_cache_size_current',
+    'Current number of not-found postcodes in the negative cache'
+)
+
 cache_size_max = Gauge(
     'cache_size_max',
     'Maximum cache size configured'
@@ -89,6 +195,65 @@ database_query_duration_seconds = Histogram(
 )
 
 
+# ============================================================================
+# Connection Pool Metrics
+# ============================================================================
+
+db_pool_connections_in_use = Gauge(
+    'db_pool_connections_in_use',
+    'Number of pooled database connections currently leased, by query lane',
+    ['lane']
+)
+
+db_pool_waiters_current = Gauge(
+    'db_pool_waiters_current',
+    'Queue depth: requests waiting for a pooled database connection, by query lane',
+    ['lane']
+)
+
+db_pool_lease_wait_seconds = Histogram(
+    'db_pool_lease_wait_seconds',
+    'Time spent waiting for a pooled database connection when none was idle',
+    ['lane'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+db_pool_lease_timeouts_total = Counter(
+    'db_pool_lease_timeouts_total',
+    'Total lease requests rejected because the lane was exhausted',
+    ['lane']
+)
+
+db_pool_connections_replaced_total = Counter(
+    'db_pool_connections_replaced_total',
+    'Total pooled connections replaced after failing a health probe',
+    ['lane']
+)
+
+db_query_deadline_exceeded_total = Counter(
+    'db_query_deadline_exceeded_total',
+    'Total queries interrupted because they ran past their deadline, by query lane',
+    ['lane']
+)
+
+
+# ============================================================================
+# Dataset Reload Metrics
+# ============================================================================
+
+dataset_reloads_total = Counter(
+    'dataset_reloads_total',
+    'Total dataset reloads (database swaps without restart) by trigger and result',
+    ['trigger', 'result']  # trigger: 'admin', 'watch'; result: 'success', 'rejected', 'failed'
+)
+
+dataset_reload_duration_seconds = Histogram(
+    'dataset_reload_duration_seconds',
+    'Time to open, validate and swap in a new dataset',
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
+
 # ============================================================================
 # Application Info
 # ============================================================================
@@ -108,6 +273,8 @@ def normalize_endpoint(path: str) -> str:
     Normalize endpoint path to prevent label cardinality explosion.
 
     Converts dynamic paths like /postcode/1012AB to /postcode/{postcode}
+    (and /postcode/1012AB/12 to /postcode/{postcode}/{huisnummer},
+    /postcode/1012AB/nearby to /postcode/{postcode}/nearby)
     to avoid creating unlimited unique metric labels.
 
     Args:
@@ -117,6 +284,10 @@ def normalize_endpoint(path: str) -> str:
         Normalized path with parameters replaced
     """
     if path.startswith('/postcode/'):
+        if path.count('/') > 2:
+            if path.endswith('/nearby'):
+                return '/postcode/{postcode}/nearby'
+            return '/postcode/{postcode}/{huisnummer}'
         return '/postcode/{postcode}'
     return path
 
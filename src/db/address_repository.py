@@ -0,0 +1,228 @@
+"""
+Address-level (postcode + house number) lookups.
+
+Lookups go straight to the `adridx` index on
+nums(postcode, huisnummer, huisletter, huistoevoeging) and join only the
+tables needed for a location: vbo_num, vbos and oprs. The alllabel view used
+by bagserv adds vbo_pnd and pnds (bouwjaar) on top of that, two extra joins
+per address that this API does not return.
+
+Results have their own cache, separate from the postcode cache: the address
+key space is ~20x larger, so it must not evict hot postcodes.
+"""
+
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.core.middleware import track_performance
+from src.db.cache_snapshot import ExpiringCache
+from src.db.connection import DatabasePool
+
+logger = get_logger(__name__)
+
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import (
+        address_lookups_total,
+        address_lookup_duration_seconds,
+        cache_operations_total,
+        database_queries_total,
+        database_query_duration_seconds
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# {filters} takes the optional huisletter / huistoevoeging conditions.
+# Planner: SEARCH nums USING INDEX adridx (postcode=? AND huisnummer=?)
+ADDRESS_QUERY = (
+    "SELECT nums.postcode, nums.huisnummer, nums.huisletter, nums.huistoevoeging, "
+    "oprs.naam, nums.woonplaats, vbos.lat, vbos.lon, vbos.x, vbos.y, "
+    "vbos.oppervlakte, vbos.gebruiksdoelen, nums.status "
+    "FROM nums "
+    "JOIN vbo_num ON vbo_num.num = nums.id "
+    "JOIN vbos ON vbos.id = vbo_num.vbo "
+    "JOIN oprs ON oprs.id = nums.ligtAanRef "
+    "WHERE nums.postcode = ? AND nums.huisnummer = ?{filters} "
+    "AND nums.status != 'Naamgeving ingetrokken' "
+    "ORDER BY nums.huisletter, nums.huistoevoeging"
+)
+
+AddressKey = Tuple[str, int, Optional[str], Optional[str]]
+
+
+class AddressRepository:
+    """
+    Repository for postcode + house number lookups with its own cache.
+
+    Not-found addresses are cached as empty results, so repeated lookups of
+    a non-existent house number do not reach SQLite either.
+    """
+
+    def __init__(self, cache_enabled: bool = None, cache_size: int = None, cache_ttl: int = None):
+        """
+        Initialize repository with optional cache configuration.
+
+        Args:
+            cache_enabled: Enable/disable caching (default: from settings)
+            cache_size: Maximum number of cached lookups (default: from settings)
+            cache_ttl: Cache time-to-live in seconds (default: from settings)
+        """
+        self.cache_enabled = cache_enabled if cache_enabled is not None else settings.enable_response_cache
+        self.cache_size = cache_size if cache_size is not None else settings.address_cache_max_size
+        self.cache_ttl = cache_ttl if cache_ttl is not None else settings.address_cache_ttl_seconds
+
+        self._cache = ExpiringCache(maxsize=self.cache_size, ttl=self.cache_ttl) if self.cache_enabled else None
+
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    async def get_addresses(
+        self,
+        postcode: str,
+        huisnummer: int,
+        huisletter: Optional[str] = None,
+        huistoevoeging: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up the addresses for a postcode and house number.
+
+        Args:
+            postcode: Normalized Dutch postcode (e.g., "3511AB")
+            huisnummer: House number
+            huisletter: Only return this house letter ("" = addresses without one)
+            huistoevoeging: Only return this addition ("" = addresses without one)
+
+        Returns:
+            Address dicts ordered by letter and addition; empty if none match
+        """
+        lookup_start = time.time()
+        key: AddressKey = (
+            postcode,
+            huisnummer,
+            huisletter.upper() if huisletter is not None else None,
+            huistoevoeging.upper() if huistoevoeging is not None else None
+        )
+
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache_hits += 1
+                if METRICS_AVAILABLE:
+                    cache_operations_total.labels(operation="address_hit").inc()
+                self._record_outcome(cached, lookup_start)
+                return list(cached)
+
+            self._cache_misses += 1
+            if METRICS_AVAILABLE:
+                cache_operations_total.labels(operation="address_miss").inc()
+
+        addresses = await self._query_addresses(*key)
+
+        if self._cache is not None:
+            self._cache[key] = tuple(addresses)
+
+        self._record_outcome(addresses, lookup_start)
+        return addresses
+
+    async def _query_addresses(
+        self,
+        postcode: str,
+        huisnummer: int,
+        huisletter: Optional[str],
+        huistoevoeging: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Query matching addresses from the database."""
+        filters = ""
+        params: List[Any] = [postcode, huisnummer]
+        if huisletter is not None:
+            filters += " AND nums.huisletter = ? COLLATE NOCASE"
+            params.append(huisletter)
+        if huistoevoeging is not None:
+            filters += " AND nums.huistoevoeging = ? COLLATE NOCASE"
+            params.append(huistoevoeging)
+
+        try:
+            db_start = time.time()
+
+            async with track_performance("database_address_query"):
+                async with DatabasePool.acquire() as conn:
+                    async with conn.execute(ADDRESS_QUERY.format(filters=filters), params) as cursor:
+                        rows = await cursor.fetchall()
+
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation="address_lookup", status="success").inc()
+                database_query_duration_seconds.labels(operation="address_lookup").observe(time.time() - db_start)
+
+        except Exception as e:
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation="address_lookup", status="error").inc()
+
+            logger.error(
+                "database_address_query_failed",
+                postcode=postcode,
+                huisnummer=huisnummer,
+                error=str(e),
+                error_type=type(e).__name__,
+                stack_trace=traceback.format_exc()
+            )
+            raise
+
+        return [
+            {
+                "postcode": row[0],
+                "huisnummer": row[1],
+                "huisletter": row[2] or "",
+                "huistoevoeging": row[3] or "",
+                "straat": row[4],
+                "woonplaats": row[5],
+                "lat": row[6],
+                "lon": row[7],
+                "rd_x": row[8],
+                "rd_y": row[9],
+                "oppervlakte": row[10],
+                "gebruiksdoelen": row[11],
+                "status": row[12]
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _record_outcome(addresses, lookup_start: float) -> None:
+        """Count a lookup as found / not found in the address metrics."""
+        if not METRICS_AVAILABLE:
+            return
+        outcome = "found" if addresses else "not_found"
+        address_lookups_total.labels(result=outcome).inc()
+        address_lookup_duration_seconds.labels(result=outcome).observe(time.time() - lookup_start)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get address cache statistics."""
+        total_requests = self._cache_hits + self._cache_misses
+        stats = {
+            "enabled": self.cache_enabled,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": round(self._cache_hits / total_requests, 3) if total_requests > 0 else 0.0
+        }
+        if self._cache is not None:
+            stats.update({
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "ttl_seconds": self.cache_ttl
+            })
+        return stats
+
+    def clear_cache(self) -> None:
+        """Clear all cached address lookups (call whenever the dataset changes)."""
+        if self._cache is not None:
+            self._cache.clear()
+            logger.info("address_cache_cleared")
+
+
+# Global address repository instance
+address_repository = AddressRepository()
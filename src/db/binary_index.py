@@ -0,0 +1,280 @@
+"""
+Precomputed binary postcode file, memory-mapped by the API.
+
+build-postcode-index.py writes one postcode -> (lat, lon, woonplaats) file
+per BAG build (~6 MB for the full dataset). The API maps it read-only
+instead of bulk-loading rows from SQLite: all uvicorn workers share the same
+pages through the page cache, and a lookup is a binary search over the
+mapped keys with no per-row deserialization.
+
+Layout (all little-endian, sections in this order):
+- header (96 bytes): magic, format version, flags, postcode count,
+  city count, city string bytes, build time, BAG version date (ASCII,
+  NUL-padded), sha256 of everything after the header
+- keys:     uint32 packed postcodes, sorted (see memory_index.pack_postcode)
+- coords:   float32 lat, lon pairs (~0.5 m resolution)
+- city_ids: uint16 (uint32 with FLAG_WIDE_CITY_IDS) index per postcode
+- offsets:  uint32 start of each city name in the string table, plus the end
+- strings:  UTF-8 city names
+"""
+
+import hashlib
+import mmap
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.core.logging_config import get_logger
+from src.db.memory_index import pack_postcode
+
+logger = get_logger(__name__)
+
+BINARY_INDEX_MAGIC = b"PCBI"
+BINARY_INDEX_VERSION = 1
+
+# magic, version, flags, postcodes, cities, string bytes, built_at, bag version, sha256
+HEADER = struct.Struct("<4sHHIIIQ32s32s")
+HEADER_SIZE = 96
+
+FLAG_WIDE_CITY_IDS = 1
+
+# Coordinates are stored as float32; round on read so values do not show
+# float32 noise digits
+COORD_DECIMALS = 6
+
+
+def _packed(typecode: str, values) -> bytes:
+    """Little-endian bytes of an array of `typecode` values."""
+    data = array(typecode, values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_binary_index(
+    path: str,
+    rows: Iterable,
+    bag_version: str = "",
+    built_at: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Write a binary postcode file from (postcode, lat, lon, woonplaats) rows.
+
+    Rows with malformed postcodes or missing coordinates are skipped;
+    duplicates keep the first occurrence. The file is written under a
+    temporary name and renamed, so a running API never maps a partial file.
+
+    Args:
+        path: Output file
+        rows: Iterable of (postcode, lat, lon, woonplaats)
+        bag_version: BAG version date the data was built from
+        built_at: Build time as epoch seconds (default: now)
+
+    Returns:
+        Summary: postcodes, cities, size_bytes, sha256
+    """
+    entries = {}
+    cities: Dict[str, int] = {}
+    for postcode, lat, lon, woonplaats in rows:
+        key = pack_postcode(postcode or "")
+        if key is None or lat is None or lon is None or key in entries:
+            continue
+        entries[key] = (lat, lon, cities.setdefault(woonplaats or "", len(cities)))
+
+    keys = sorted(entries)
+    names = [name.encode("utf-8") for name in cities]
+    wide = len(names) > 0xFFFF
+
+    offsets = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    body = b"".join([
+        _packed("I", keys),
+        _packed("f", (value for key in keys for value in entries[key][:2])),
+        _packed("I" if wide else "H", (entries[key][2] for key in keys)),
+        _packed("I", offsets),
+        b"".join(names),
+    ])
+    digest = hashlib.sha256(body).digest()
+
+    header = HEADER.pack(
+        BINARY_INDEX_MAGIC,
+        BINARY_INDEX_VERSION,
+        FLAG_WIDE_CITY_IDS if wide else 0,
+        len(keys),
+        len(names),
+        offsets[-1],
+        int(built_at if built_at is not None else time.time()),
+        bag_version.encode("ascii")[:32],
+        digest
+    ).ljust(HEADER_SIZE, b"\0")
+
+    file_path = Path(path)
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    tmp_path.replace(file_path)
+
+    return {
+        "postcodes": len(keys),
+        "cities": len(names),
+        "size_bytes": HEADER_SIZE + len(body),
+        "sha256": digest.hex()
+    }
+
+
+class BinaryPostcodeIndex:
+    """
+    Read-only postcode table served from a memory-mapped binary file.
+
+    Same lookup interface as PostcodeIndex, so the repository can attach
+    either one.
+
+    Usage:
+        >>> index = BinaryPostcodeIndex.open("/opt/postcode/geodata/postcodes.bin")
+        >>> index.get("3511AB")
+        {'postcode': '3511AB', 'lat': 52.096064, 'lon': 5.115926, 'woonplaats': 'Utrecht'}
+    """
+
+    engine = "mmap"
+
+    def __init__(self, path: str, mm: mmap.mmap, header: tuple):
+        _, self.format_version, flags, count, city_count, string_bytes, built_at, bag_version, digest = header
+        self.path = path
+        self.built_at = built_at
+        self.bag_version = bag_version.rstrip(b"\0").decode("ascii")
+        self.sha256 = digest.hex()
+        self.load_seconds = 0.0
+        self._mm = mm
+
+        id_format = "I" if flags & FLAG_WIDE_CITY_IDS else "H"
+        id_size = struct.calcsize(id_format)
+
+        view = memoryview(mm)
+        offset = HEADER_SIZE
+        self.keys = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        self.coords = view[offset:offset + 8 * count].cast("f")
+        offset += 8 * count
+        self.city_ids = view[offset:offset + id_size * count].cast(id_format)
+        offset += id_size * count
+        city_offsets = view[offset:offset + 4 * (city_count + 1)].cast("I")
+        offset += 4 * (city_count + 1)
+
+        # A few thousand names: decoded once rather than per lookup
+        strings = bytes(view[offset:offset + string_bytes])
+        self.cities = [
+            strings[city_offsets[i]:city_offsets[i + 1]].decode("utf-8")
+            for i in range(city_count)
+        ]
+        city_offsets.release()
+
+    @classmethod
+    def open(cls, path: str, verify: bool = True) -> "BinaryPostcodeIndex":
+        """
+        Map a binary postcode file.
+
+        Args:
+            path: File written by write_binary_index()
+            verify: Check the sha256 of the data sections
+
+        Returns:
+            Mapped index with `load_seconds` set
+
+        Raises:
+            RuntimeError: If the file is truncated, corrupt or has an
+                incompatible layout
+        """
+        start = time.perf_counter()
+
+        if sys.byteorder != "little":
+            raise RuntimeError("Binary postcode files can only be mapped on little-endian hosts")
+
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(mm) < HEADER_SIZE:
+                raise RuntimeError(f"Binary postcode file {path} is truncated")
+            header = HEADER.unpack_from(mm, 0)
+            magic, version, flags, count, city_count, string_bytes = header[:6]
+            id_size = 4 if flags & FLAG_WIDE_CITY_IDS else 2
+            expected_size = (
+                HEADER_SIZE + count * (4 + 8 + id_size) + 4 * (city_count + 1) + string_bytes
+            )
+
+            if magic != BINARY_INDEX_MAGIC or version != BINARY_INDEX_VERSION:
+                raise RuntimeError(
+                    f"Binary postcode file {path} has an incompatible layout. "
+                    "Rebuild it with build-postcode-index.py."
+                )
+            if len(mm) != expected_size:
+                raise RuntimeError(
+                    f"Binary postcode file {path} is {len(mm)} bytes, expected {expected_size}"
+                )
+            if verify and hashlib.sha256(mm[HEADER_SIZE:]).digest() != header[8]:
+                raise RuntimeError(f"Binary postcode file {path} failed its checksum")
+
+            index = cls(path, mm, header)
+        except Exception:
+            mm.close()
+            raise
+
+        index.load_seconds = time.perf_counter() - start
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _position(self, postcode: str) -> int:
+        """Row number for a postcode, or -1 if absent."""
+        key = pack_postcode(postcode)
+        if key is None:
+            return -1
+        pos = bisect_left(self.keys, key)
+        if pos < len(self.keys) and self.keys[pos] == key:
+            return pos
+        return -1
+
+    def get(self, postcode: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a normalized postcode.
+
+        Returns:
+            Dictionary in the same shape as PostcodeRepository results, or None
+        """
+        pos = self._position(postcode)
+        if pos < 0:
+            return None
+        return {
+            "postcode": postcode,
+            "lat": round(self.coords[2 * pos], COORD_DECIMALS),
+            "lon": round(self.coords[2 * pos + 1], COORD_DECIMALS),
+            "woonplaats": self.cities[self.city_ids[pos]]
+        }
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        for view in (self.keys, self.coords, self.city_ids):
+            view.release()
+        self._mm.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get file and index statistics."""
+        return {
+            "path": self.path,
+            "postcodes": len(self),
+            "cities": len(self.cities),
+            "file_mb": round(len(self._mm) / (1024 * 1024), 2),
+            "bag_version": self.bag_version or None,
+            "built_at": datetime.fromtimestamp(self.built_at, tz=timezone.utc).isoformat(),
+            "sha256": self.sha256,
+            "load_seconds": round(self.load_seconds, 3)
+        }
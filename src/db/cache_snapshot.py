@@ -0,0 +1,247 @@
+"""
+Persistent cache snapshot.
+
+At shutdown the repository cache is written to a compact binary file; the
+next process reloads it at startup, so a rolling restart keeps its hit rate
+instead of sending every request to SQLite again. Entries keep their absolute
+(wall-clock) expiry time, so a restored entry lives exactly as long as it
+would have in the old process.
+
+File layout (little-endian):
+- header:   magic, format version, written_at, fingerprint length,
+            city count, found count, missing count
+- fingerprint: UTF-8 dataset identity; a snapshot of another dataset is ignored
+- cities:   length-prefixed UTF-8 woonplaats names (string table)
+- found:    fixed-size records (packed postcode, expires_at, lat, lon, city id)
+- missing:  fixed-size records (packed postcode, expires_at)
+"""
+
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from cachetools import Cache, TLRUCache
+
+from src.core.logging_config import get_logger
+from src.db.memory_index import pack_postcode, unpack_postcode
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MAGIC = b"PCCACHE\0"
+SNAPSHOT_VERSION = 1
+
+HEADER = struct.Struct("<8sHdIIII")
+CITY_LENGTH = struct.Struct("<H")
+FOUND_RECORD = struct.Struct("<IdddI")
+MISSING_RECORD = struct.Struct("<Id")
+
+
+class ExpiringCache(TLRUCache):
+    """
+    LRU cache with a fixed TTL that can list and restore entries with their
+    expiry time.
+
+    Uses the wall clock (time.time) rather than the monotonic clock, so expiry
+    times stay meaningful in another process.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttu=self._time_to_use, timer=time.time)
+        self.ttl = ttl
+        self._expires: Dict[Any, float] = {}
+        self._next_expiry: Optional[float] = None
+        self._last_set: Tuple[float, float] = (0.0, 0.0)
+
+    def _time_to_use(self, key: Any, value: Any, now: float) -> float:
+        expires = now + self.ttl
+        if self._next_expiry is not None:
+            # Never extend an entry beyond the currently configured TTL
+            expires = min(self._next_expiry, expires)
+        self._last_set = (now, expires)
+        return expires
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        now, expires = self._last_set
+        if now < expires:  # TLRUCache skips already-expired items
+            self._expires[key] = expires
+
+    def __delitem__(self, key: Any) -> None:
+        self._expires.pop(key, None)
+        super().__delitem__(key)
+
+    def expire(self, time: Optional[float] = None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._expires.pop(key, None)
+        return expired
+
+    def set_with_expiry(self, key: Any, value: Any, expires_at: float) -> None:
+        """Store an entry that expires at `expires_at` (epoch seconds) instead of now + ttl."""
+        self._next_expiry = expires_at
+        try:
+            self[key] = value
+        finally:
+            self._next_expiry = None
+
+    def entries(self) -> List[Tuple[Any, Any, float]]:
+        """
+        List live entries without touching their LRU position.
+
+        Returns:
+            (key, value, expires_at) tuples, soonest expiry first
+        """
+        now = self.timer()
+        return [
+            (key, Cache.__getitem__(self, key), expires)
+            for key, expires in sorted(self._expires.items(), key=lambda item: item[1])
+            if now < expires
+        ]
+
+
+class CacheSnapshot(NamedTuple):
+    """Cache contents read back from a snapshot file."""
+    found: List[Tuple[Dict[str, Any], float]]  # (postcode data, expires_at)
+    missing: List[Tuple[str, float]]           # (postcode, expires_at)
+
+
+def write_snapshot(
+    path: str,
+    fingerprint: str,
+    found: List[Tuple[str, Dict[str, Any], float]],
+    missing: List[Tuple[str, float]]
+) -> int:
+    """
+    Write cache entries to a snapshot file (atomically, via a temporary file).
+
+    Args:
+        path: Snapshot file path
+        fingerprint: Dataset identity the entries belong to
+        found: (postcode, data, expires_at) entries of the positive cache
+        missing: (postcode, expires_at) entries of the negative cache
+
+    Returns:
+        Number of entries written
+    """
+    city_table: Dict[str, int] = {}
+    found_records = bytearray()
+    for postcode, result, expires_at in found:
+        key = pack_postcode(postcode)
+        if key is None:
+            continue
+        city_id = city_table.setdefault(result["woonplaats"], len(city_table))
+        found_records += FOUND_RECORD.pack(key, expires_at, result["lat"], result["lon"], city_id)
+
+    missing_records = bytearray()
+    for postcode, expires_at in missing:
+        key = pack_postcode(postcode)
+        if key is not None:
+            missing_records += MISSING_RECORD.pack(key, expires_at)
+
+    cities = bytearray()
+    for city in city_table:
+        encoded = city.encode("utf-8")
+        cities += CITY_LENGTH.pack(len(encoded)) + encoded
+
+    encoded_fingerprint = fingerprint.encode("utf-8")
+    found_count = len(found_records) // FOUND_RECORD.size
+    missing_count = len(missing_records) // MISSING_RECORD.size
+    header = HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        time.time(),
+        len(encoded_fingerprint),
+        len(city_table),
+        found_count,
+        missing_count
+    )
+
+    file_path = Path(path)
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    tmp_path.write_bytes(b"".join((header, encoded_fingerprint, cities, found_records, missing_records)))
+    tmp_path.replace(file_path)
+
+    return found_count + missing_count
+
+
+def read_snapshot(path: str, fingerprint: str) -> Optional[CacheSnapshot]:
+    """
+    Read a snapshot file written by write_snapshot().
+
+    Entries that have expired since the snapshot was written are dropped.
+
+    Args:
+        path: Snapshot file path
+        fingerprint: Identity of the dataset currently served
+
+    Returns:
+        CacheSnapshot, or None if the file is missing, unreadable, or belongs
+        to another dataset
+    """
+    file_path = Path(path)
+    if not file_path.exists():
+        logger.info("cache_snapshot_missing", path=path)
+        return None
+
+    data = file_path.read_bytes()
+
+    try:
+        magic, version, written_at, fingerprint_len, city_count, found_count, missing_count = (
+            HEADER.unpack_from(data, 0)
+        )
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            logger.warning("cache_snapshot_unsupported", path=path, version=version)
+            return None
+
+        offset = HEADER.size
+        stored_fingerprint = data[offset:offset + fingerprint_len].decode("utf-8")
+        offset += fingerprint_len
+        if stored_fingerprint != fingerprint:
+            logger.info(
+                "cache_snapshot_stale",
+                path=path,
+                snapshot_dataset=stored_fingerprint,
+                current_dataset=fingerprint
+            )
+            return None
+
+        cities = []
+        for _ in range(city_count):
+            (length,) = CITY_LENGTH.unpack_from(data, offset)
+            offset += CITY_LENGTH.size
+            cities.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+
+        found_end = offset + found_count * FOUND_RECORD.size
+        missing_end = found_end + missing_count * MISSING_RECORD.size
+        if missing_end != len(data):
+            raise ValueError(f"expected {missing_end} bytes, file has {len(data)}")
+
+        now = time.time()
+        found = []
+        for key, expires_at, lat, lon, city_id in FOUND_RECORD.iter_unpack(data[offset:found_end]):
+            if expires_at > now:
+                found.append((
+                    {"postcode": unpack_postcode(key), "lat": lat, "lon": lon, "woonplaats": cities[city_id]},
+                    expires_at
+                ))
+
+        missing = [
+            (unpack_postcode(key), expires_at)
+            for key, expires_at in MISSING_RECORD.iter_unpack(data[found_end:missing_end])
+            if expires_at > now
+        ]
+
+    except (struct.error, UnicodeDecodeError, IndexError, ValueError) as e:
+        logger.warning("cache_snapshot_corrupt", path=path, error=str(e))
+        return None
+
+    logger.debug(
+        "cache_snapshot_read",
+        path=path,
+        age_seconds=round(now - written_at, 1),
+        found=len(found),
+        missing=len(missing)
+    )
+    return CacheSnapshot(found=found, missing=missing)
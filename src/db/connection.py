@@ -1,115 +1,916 @@
 """
 Database connection pool management.
 
-Singleton pattern for efficient SQLite connection reuse across requests.
-This significantly improves performance by avoiding connection overhead.
+Pools of read-only SQLite connections shared across requests.
+aiosqlite runs every connection on its own worker thread, so a pool of N
+connections lets N cache misses hit SQLite in parallel instead of queueing
+behind a single connection.
+
+Queries run in lanes, each its own pool (worker threads), concurrency cap,
+wait queue and query deadline:
+- lookup: postcode, address and coordinate lookups (many, fast, short deadline)
+- admin:  index loads, warm-up top-N, dataset checks (few, heavy, long deadline)
+A slow admin query therefore never holds a thread that a lookup waits for.
+
+Every connection is opened with the configured read profile (see
+read_profile()): the database is never written, so the tuned profile opens
+it immutable and sizes mmap and page cache for reads.
 """
 
+import asyncio
+import math
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
 import aiosqlite
-from typing import Optional
 from src.core.config import settings
 from src.core.logging_config import get_logger
+from src.db.dataset_meta import CHECKSUM_KEY, COUNTED_TABLES, META_QUERY, META_TABLE, recorded_row_count
 
 logger = get_logger(__name__)
 
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import (
+        db_pool_connections_in_use,
+        db_pool_waiters_current,
+        db_pool_lease_wait_seconds,
+        db_pool_lease_timeouts_total,
+        db_pool_connections_replaced_total,
+        db_query_deadline_exceeded_total
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Query lanes
+LOOKUP_LANE = "lookup"
+ADMIN_LANE = "admin"
+
+# SQLite VM instructions between deadline checks (~0.5 ms of query work)
+DEADLINE_CHECK_OPS = 10000
+
+
+class DatabasePoolTimeout(RuntimeError):
+    """Raised when no pooled connection can be leased within the configured timeout."""
+
+
+class QueryDeadlineExceeded(DatabasePoolTimeout):
+    """Raised when a query is interrupted because it ran past its deadline."""
+
+
+class QueryDeadline:
+    """
+    SQLite progress handler that interrupts a connection's query at a deadline.
+
+    Installed once per connection and called from its worker thread every
+    DEADLINE_CHECK_OPS instructions; the pool arms it for each lease.
+    A non-zero return makes SQLite abort the statement ("interrupted").
+    """
+
+    __slots__ = ("expires",)
+
+    def __init__(self):
+        self.expires = math.inf  # time.monotonic() deadline; inf when not leased
+
+    def __call__(self) -> int:
+        return time.monotonic() > self.expires
+
+
+# Read profiles for DB_READ_PROFILE
+READ_PROFILES = ("default", "tuned")
+
+# PRAGMAs reported as effective values when a pool opens
+REPORTED_PRAGMAS = ("journal_mode", "page_size", "mmap_size", "cache_size", "temp_store", "query_only")
+
+
+def read_only_uri(db_path: str, immutable: bool = False) -> str:
+    """
+    Build a SQLite URI that opens the database file read-only.
+
+    Args:
+        db_path: Path to SQLite database file
+        immutable: Also promise SQLite that nobody changes the file, which
+            skips file locking and change detection on every read
+
+    Returns:
+        URI suitable for sqlite3.connect(..., uri=True)
+    """
+    uri = f"{Path(db_path).absolute().as_uri()}?mode=ro"
+    return f"{uri}&immutable=1" if immutable else uri
+
+
+def read_profile(profile: str) -> Tuple[bool, List[str]]:
+    """
+    Resolve a read profile into connection options.
+
+    - default: read-only open with SQLite's defaults
+    - tuned:   immutable open (DB_IMMUTABLE), mmap_size and cache_size from
+               settings, in-memory temp store, query_only
+
+    Args:
+        profile: "default" or "tuned"
+
+    Returns:
+        (immutable, PRAGMA statements to run on each new connection)
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile == "default":
+        return False, []
+    if profile == "tuned":
+        return settings.db_immutable, [
+            f"PRAGMA mmap_size = {settings.db_mmap_size_mb * 1024 * 1024}",
+            f"PRAGMA cache_size = -{settings.db_page_cache_mb * 1024}",  # Negative: KiB, not pages
+            "PRAGMA temp_store = MEMORY",
+            "PRAGMA query_only = 1"
+        ]
+    raise ValueError(
+        f"Unknown read profile '{profile}'. Expected one of: {', '.join(READ_PROFILES)}"
+    )
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of read-only aiosqlite connections (one query lane).
+
+    Connections are leased with `lease()` and returned automatically when the
+    context exits. Callers that find no idle connection wait in a bounded
+    queue; the wait is cut off after `timeout` seconds. Queries that run
+    longer than the lease deadline are interrupted by SQLite.
+
+    Health checks:
+    - A connection that raised a database error while leased is probed with
+      `SELECT 1` on return and replaced if the probe fails
+    - `health_check()` probes every idle connection and replaces broken ones
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int,
+        timeout: float,
+        max_waiters: int,
+        cache_size: int = 100,
+        lane: str = LOOKUP_LANE,
+        deadline: float = 0.0,
+        profile: str = "default"
+    ):
+        """
+        Configure the pool (connections are opened by `open()`).
+
+        Args:
+            db_path: Path to SQLite database file
+            size: Number of connections to keep open
+            timeout: Maximum seconds to wait for a free connection
+            max_waiters: Maximum number of callers allowed to wait at once
+            cache_size: Number of prepared statements to cache per connection
+            lane: Query lane name, for logs and metrics
+            deadline: Default seconds a lease may run queries (0 = no deadline)
+            profile: Read profile applied to every connection (see read_profile())
+
+        Raises:
+            ValueError: If the read profile is unknown
+        """
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.max_waiters = max_waiters
+        self.cache_size = cache_size
+        self.lane = lane
+        self.deadline = deadline
+        self.profile = profile
+        self.immutable, self._pragmas = read_profile(profile)
+
+        # immutable=1 ignores a WAL file: only safe once the WAL is checkpointed
+        wal = Path(f"{db_path}-wal")
+        if self.immutable and wal.exists() and wal.stat().st_size > 0:
+            logger.warning("database_wal_pending", db_path=db_path, lane=lane, immutable=False)
+            self.immutable = False
+
+        self._idle: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._connections: List[aiosqlite.Connection] = []
+        self._deadlines: Dict[aiosqlite.Connection, QueryDeadline] = {}
+        self._in_use = 0
+        self._waiters = 0
+        self._leases_total = 0
+        self._timeouts_total = 0
+        self._replaced_total = 0
+        self._deadlines_exceeded_total = 0
+        self._closed = False
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a single read-only connection with its read profile and deadline handler."""
+        conn = await aiosqlite.connect(
+            read_only_uri(self.db_path, self.immutable),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.cache_size
+        )
+        deadline = QueryDeadline()
+        try:
+            for pragma in self._pragmas:
+                await conn.execute(pragma)
+            await conn.set_progress_handler(deadline, DEADLINE_CHECK_OPS)
+        except Exception:
+            await conn.close()
+            raise
+        self._deadlines[conn] = deadline
+        return conn
+
+    async def open(self) -> None:
+        """
+        Open all pooled connections.
+
+        Raises:
+            sqlite3.Error: If any connection cannot be opened
+        """
+        try:
+            for _ in range(self.size):
+                conn = await self._connect()
+                self._connections.append(conn)
+                self._idle.put_nowait(conn)
+        except Exception:
+            await self.close()
+            raise
+
+    async def effective_settings(self) -> Dict[str, Any]:
+        """
+        Read back the settings SQLite actually applied on a pooled connection.
+
+        Returns:
+            {"profile", "immutable", <REPORTED_PRAGMAS>...}
+        """
+        values: Dict[str, Any] = {"profile": self.profile, "immutable": self.immutable}
+        async with self.lease() as conn:
+            for pragma in REPORTED_PRAGMAS:
+                async with conn.execute(f"PRAGMA {pragma}") as cursor:
+                    row = await cursor.fetchone()
+                    values[pragma] = row[0] if row else None
+        return values
+
+    @asynccontextmanager
+    async def lease(self, deadline: Optional[float] = None) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Lease a connection for the duration of the `async with` block.
+
+        Args:
+            deadline: Seconds the queries in this block may run in total,
+                counted once a connection is leased (default: the lane's
+                deadline; 0 = no deadline)
+
+        Raises:
+            DatabasePoolTimeout: If the wait queue is full or no connection
+                becomes available within the timeout
+            QueryDeadlineExceeded: If a query was interrupted at the deadline
+        """
+        deadline = self.deadline if deadline is None else deadline
+        conn = await self._acquire()
+        clock = self._deadlines[conn]
+        if deadline > 0:
+            clock.expires = time.monotonic() + deadline
+
+        failed = False
+        try:
+            yield conn
+        except sqlite3.OperationalError as e:
+            failed = True
+            if time.monotonic() > clock.expires and "interrupted" in str(e):
+                self._record_deadline(deadline)
+                raise QueryDeadlineExceeded(
+                    f"Database query exceeded its {deadline}s deadline ({self.lane} lane)"
+                ) from e
+            raise
+        except (sqlite3.Error, ValueError):
+            # ValueError: aiosqlite raises it when the connection was closed
+            failed = True
+            raise
+        finally:
+            clock.expires = math.inf
+            await self._release(conn, check=failed)
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        """Take an idle connection, waiting up to `timeout` seconds."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        try:
+            conn = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            conn = await self._wait_for_connection()
+
+        self._in_use += 1
+        self._leases_total += 1
+        if METRICS_AVAILABLE:
+            db_pool_connections_in_use.labels(lane=self.lane).inc()
+        return conn
+
+    async def _wait_for_connection(self) -> aiosqlite.Connection:
+        """Slow path of `_acquire`: queue up behind other waiters."""
+        if self._waiters >= self.max_waiters:
+            self._record_timeout()
+            raise DatabasePoolTimeout(
+                f"Database pool wait queue full ({self.max_waiters} waiters)"
+            )
+
+        self._waiters += 1
+        if METRICS_AVAILABLE:
+            db_pool_waiters_current.labels(lane=self.lane).inc()
+
+        wait_start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(self._idle.get(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._record_timeout()
+            raise DatabasePoolTimeout(
+                f"No database connection available within {self.timeout}s"
+            )
+        finally:
+            self._waiters -= 1
+            if METRICS_AVAILABLE:
+                db_pool_waiters_current.labels(lane=self.lane).dec()
+                db_pool_lease_wait_seconds.labels(lane=self.lane).observe(time.perf_counter() - wait_start)
+
+    def _record_timeout(self) -> None:
+        self._timeouts_total += 1
+        logger.warning(
+            "database_pool_lease_timeout",
+            lane=self.lane,
+            pool_size=self.size,
+            in_use=self._in_use,
+            waiters=self._waiters
+        )
+        if METRICS_AVAILABLE:
+            db_pool_lease_timeouts_total.labels(lane=self.lane).inc()
+
+    def _record_deadline(self, deadline: float) -> None:
+        self._deadlines_exceeded_total += 1
+        logger.warning("database_query_deadline_exceeded", lane=self.lane, deadline_seconds=deadline)
+        if METRICS_AVAILABLE:
+            db_query_deadline_exceeded_total.labels(lane=self.lane).inc()
+
+    async def _release(self, conn: aiosqlite.Connection, check: bool = False) -> None:
+        """Return a connection to the idle queue, replacing it if it is broken."""
+        self._in_use -= 1
+        if METRICS_AVAILABLE:
+            db_pool_connections_in_use.labels(lane=self.lane).dec()
+
+        if self._closed:
+            self._deadlines.pop(conn, None)
+            await conn.close()
+            return
+
+        if check and not await self._probe(conn):
+            try:
+                conn = await self._replace(conn)
+            except Exception as e:
+                # Keep the slot; the next failing lease will retry the replacement
+                logger.error("database_connection_replace_failed", error=str(e))
+
+        self._idle.put_nowait(conn)
+
+    @staticmethod
+    async def _probe(conn: aiosqlite.Connection) -> bool:
+        """Run a trivial query to verify that a connection still works."""
+        try:
+            async with conn.execute("SELECT 1") as cursor:
+                await cursor.fetchone()
+            return True
+        except Exception as e:
+            logger.warning("database_connection_probe_failed", error=str(e))
+            return False
+
+    async def _replace(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        """Close a broken connection and open a fresh one in its place."""
+        try:
+            await conn.close()
+        except Exception as e:
+            logger.warning("database_connection_close_failed", error=str(e))
+
+        new_conn = await self._connect()
+        self._deadlines.pop(conn, None)
+        self._connections = [new_conn if c is conn else c for c in self._connections]
+        self._replaced_total += 1
+        logger.warning("database_connection_replaced", db_path=self.db_path, lane=self.lane)
+        if METRICS_AVAILABLE:
+            db_pool_connections_replaced_total.labels(lane=self.lane).inc()
+        return new_conn
+
+    async def health_check(self) -> bool:
+        """
+        Probe every idle connection, replacing any that fail.
+
+        Connections currently leased are skipped; they are checked on return
+        if their query failed.
+
+        Returns:
+            True if at least one connection is usable, False otherwise
+        """
+        # One connection at a time, returned right after its probe, so
+        # lookups arriving during /health never find the whole pool taken
+        healthy = self._in_use > 0
+        for _ in range(self._idle.qsize()):
+            try:
+                conn = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                if not await self._probe(conn):
+                    conn = await self._replace(conn)
+                    if not await self._probe(conn):
+                        continue
+                healthy = True
+            except Exception as e:
+                logger.error("database_connection_replace_failed", error=str(e))
+            finally:
+                if self._closed:
+                    self._deadlines.pop(conn, None)
+                    await conn.close()
+                else:
+                    self._idle.put_nowait(conn)
+
+        return healthy
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        Wait for leased connections and queued waiters to finish, then close.
+
+        Used on a pool that no longer receives new leases (after a dataset
+        swap), so in-flight queries complete on the database they started on.
+
+        Args:
+            timeout: Maximum seconds to wait before closing anyway
+
+        Returns:
+            True if the pool was idle when it was closed
+        """
+        deadline = time.monotonic() + timeout
+        while (self._in_use or self._waiters) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        drained = not (self._in_use or self._waiters)
+        await self.close()
+        return drained
+
+    async def close(self) -> None:
+        """Close all connections. Leased connections close on return."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            await conn.close()
+        self._connections = []
+        self._deadlines = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool utilisation counters."""
+        return {
+            "lane": self.lane,
+            "size": self.size,
+            "in_use": self._in_use,
+            "idle": self._idle.qsize(),
+            "waiters": self._waiters,
+            "max_waiters": self.max_waiters,
+            "timeout_seconds": self.timeout,
+            "deadline_seconds": self.deadline,
+            "leases_total": self._leases_total,
+            "timeouts_total": self._timeouts_total,
+            "deadlines_exceeded_total": self._deadlines_exceeded_total,
+            "replaced_total": self._replaced_total
+        }
+
 
 class DatabasePool:
     """
-    Singleton connection pool for SQLite database.
+    Singleton access point for the read-only SQLite connection pools.
 
     Performance benefits:
-    - Reuses single connection across all requests (50-70% faster)
-    - Caches prepared statements (configurable cache size)
-    - WAL mode for better concurrency
+    - N connections on N worker threads serve cache misses in parallel
+    - Heavy queries run in a separate admin lane, so lookups never queue behind them
+    - Caches prepared statements per connection (configurable cache size)
+    - Bounded wait queue with timeout instead of unbounded queueing
+    - Per-lease query deadline instead of queries running unbounded
     - Single initialization at startup
+
+    Usage:
+        async with DatabasePool.acquire() as conn:
+            async with conn.execute("SELECT ...") as cursor:
+                row = await cursor.fetchone()
+
+        async with DatabasePool.acquire(ADMIN_LANE) as conn:
+            ...  # Full-table scans, GROUP BY over all postcodes
     """
 
-    _connection: Optional[aiosqlite.Connection] = None
+    _lanes: Dict[str, ConnectionPool] = {}
     _db_path: Optional[str] = None
+    _schema: Dict[str, str] = {}
+    _address_count: Optional[int] = None
+    _meta: Dict[str, str] = {}
+    _fingerprint: Optional[str] = None
+    _deep_check: Dict[str, Any] = {}
+    _read_settings: Dict[str, Any] = {}
 
     @classmethod
-    async def initialize(cls, db_path: str, cache_size: int = 100) -> None:
+    async def initialize(
+        cls,
+        db_path: str,
+        cache_size: int = 100,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_waiters: Optional[int] = None
+    ) -> None:
         """
-        Initialize database connection pool.
+        Initialize the lookup and admin connection pools.
 
         Args:
             db_path: Path to SQLite database file
-            cache_size: Number of prepared statements to cache
+            cache_size: Number of prepared statements to cache per connection
+            pool_size: Number of lookup connections (default: from settings)
+            timeout: Lookup lease timeout in seconds (default: from settings)
+            max_waiters: Maximum queued lookup leases (default: from settings)
 
         Raises:
             RuntimeError: If database file doesn't exist or connection fails
         """
-        if cls._connection is not None:
+        if cls._lanes:
             logger.warning("database_pool_already_initialized")
             return
 
-        cls._db_path = db_path
-        logger.info("database_pool_initializing", db_path=db_path, cache_size=cache_size)
-
-        try:
-            # Create connection with optimizations
-            cls._connection = await aiosqlite.connect(
-                db_path,
-                check_same_thread=False,
-                cached_statements=cache_size
+        lanes = {
+            LOOKUP_LANE: ConnectionPool(
+                db_path=db_path,
+                size=pool_size if pool_size is not None else settings.db_pool_size,
+                timeout=timeout if timeout is not None else settings.db_pool_timeout_seconds,
+                max_waiters=max_waiters if max_waiters is not None else settings.db_pool_max_waiters,
+                cache_size=cache_size,
+                lane=LOOKUP_LANE,
+                deadline=settings.db_query_deadline_seconds,
+                profile=settings.db_read_profile.lower()
+            ),
+            ADMIN_LANE: ConnectionPool(
+                db_path=db_path,
+                size=settings.db_admin_pool_size,
+                timeout=settings.db_admin_pool_timeout_seconds,
+                max_waiters=settings.db_admin_pool_max_waiters,
+                cache_size=cache_size,
+                lane=ADMIN_LANE,
+                deadline=settings.db_admin_query_deadline_seconds,
+                profile=settings.db_read_profile.lower()
             )
+        }
+        logger.info(
+            "database_pool_initializing",
+            db_path=db_path,
+            cache_size=cache_size,
+            lanes={
+                name: {"size": pool.size, "timeout_seconds": pool.timeout, "deadline_seconds": pool.deadline}
+                for name, pool in lanes.items()
+            }
+        )
 
-            # Enable WAL mode for better concurrency (allows concurrent reads)
-            await cls._connection.execute("PRAGMA journal_mode=WAL")
-
-            # Verify connection with a test query
-            async with cls._connection.execute("SELECT COUNT(*) FROM nums") as cursor:
-                result = await cursor.fetchone()
-                address_count = result[0] if result else 0
+        try:
+            await cls._open_lanes(lanes)
+            address_count, schema, meta = await cls._inspect(lanes[ADMIN_LANE])
 
-            logger.info("database_pool_initialized", address_count=address_count, db_path=db_path)
+            cls._lanes = lanes
+            cls._schema = schema
+            cls._db_path = db_path
+            cls._address_count = address_count
+            cls._meta = meta
+            cls._fingerprint = cls._identify(db_path, meta)
+            cls._read_settings = await lanes[LOOKUP_LANE].effective_settings()
+            logger.info(
+                "database_pool_initialized",
+                address_count=address_count,
+                db_path=db_path,
+                pool_size=lanes[LOOKUP_LANE].size,
+                admin_pool_size=lanes[ADMIN_LANE].size,
+                bag_version=meta.get("bag_version") or None,
+                dataset=cls._fingerprint,
+                counted_from="dataset_meta" if meta else "nums"
+            )
+            cls._report_read_settings()
 
         except Exception as e:
             logger.error("database_pool_initialization_failed", error=str(e), db_path=db_path)
-            cls._connection = None
+            await cls.close_lanes(lanes)
             raise RuntimeError(f"Database initialization failed: {e}")
 
     @classmethod
-    async def get_connection(cls) -> aiosqlite.Connection:
+    def _report_read_settings(cls) -> None:
+        """Log the effective read profile, warning when SQLite capped mmap_size."""
+        logger.info("database_read_profile", **cls._read_settings)
+
+        requested = settings.db_mmap_size_mb * 1024 * 1024
+        effective = cls._read_settings.get("mmap_size") or 0
+        if cls._read_settings["profile"] == "tuned" and effective < requested:
+            logger.warning(
+                "database_mmap_size_capped",
+                requested_bytes=requested,
+                effective_bytes=effective
+            )
+
+    @staticmethod
+    async def _open_lanes(lanes: Dict[str, ConnectionPool]) -> None:
+        """Open every lane, closing all of them if one fails."""
+        try:
+            for pool in lanes.values():
+                await pool.open()
+        except Exception:
+            await DatabasePool.close_lanes(lanes)
+            raise
+
+    @staticmethod
+    async def close_lanes(lanes: Dict[str, ConnectionPool]) -> None:
+        """Close a set of lane pools (e.g. prepared ones that are discarded)."""
+        for pool in lanes.values():
+            await pool.close()
+
+    @staticmethod
+    async def _inspect(pool: ConnectionPool) -> Tuple[int, Dict[str, str], Dict[str, str]]:
         """
-        Get database connection from pool.
+        Verify an opened pool and read its schema and dataset metadata.
+
+        The address count comes from the dataset_meta table written at
+        ingest (write-dataset-meta.py); `nums` is then only probed for one
+        row. Without metadata the rows are counted, which scans a whole
+        index on large databases.
 
         Returns:
-            Active SQLite connection
+            (address_count, {name: "table" | "view"}, dataset metadata or {})
+        """
+        async with pool.lease() as conn:
+            # Record which tables/views exist so callers can pick a query path
+            async with conn.execute(
+                "SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view')"
+            ) as cursor:
+                schema = {row[0]: row[1] for row in await cursor.fetchall()}
+
+            meta: Dict[str, str] = {}
+            if schema.get(META_TABLE) == "table":
+                async with conn.execute(META_QUERY) as cursor:
+                    meta = {row[0]: row[1] for row in await cursor.fetchall()}
+
+            address_count = recorded_row_count(meta, "nums")
+            if address_count is not None:
+                async with conn.execute("SELECT 1 FROM nums LIMIT 1") as cursor:
+                    await cursor.fetchone()
+            else:
+                logger.warning("dataset_meta_missing", db_path=pool.db_path, fallback="count")
+                meta = {}
+                async with conn.execute("SELECT COUNT(*) FROM nums") as cursor:
+                    result = await cursor.fetchone()
+                    address_count = result[0] if result else 0
+
+        return address_count, schema, meta
+
+    @classmethod
+    async def prepare(
+        cls,
+        db_path: str
+    ) -> Tuple[Dict[str, ConnectionPool], int, Dict[str, str], Dict[str, str]]:
+        """
+        Open and inspect lane pools for another database file, without serving them.
+
+        Each lane gets the same size, timeout, deadline, statement cache and
+        read profile as the active one. Pass the result to swap() to start serving it, or
+        discard it with close_lanes().
+
+        Args:
+            db_path: Path to the new SQLite database file
+
+        Returns:
+            (lanes, address_count, schema, dataset metadata)
 
         Raises:
-            RuntimeError: If pool not initialized
+            RuntimeError: If the pool is not initialized
+            sqlite3.Error: If the file cannot be opened or queried
+        """
+        lanes = {
+            name: ConnectionPool(
+                db_path=db_path,
+                size=active.size,
+                timeout=active.timeout,
+                max_waiters=active.max_waiters,
+                cache_size=active.cache_size,
+                lane=name,
+                deadline=active.deadline,
+                profile=active.profile
+            )
+            for name, active in cls._get_lanes().items()
+        }
+        await cls._open_lanes(lanes)
+        try:
+            address_count, schema, meta = await cls._inspect(lanes[ADMIN_LANE])
+        except Exception:
+            await cls.close_lanes(lanes)
+            raise
+        return lanes, address_count, schema, meta
+
+    @classmethod
+    def swap(
+        cls,
+        lanes: Dict[str, ConnectionPool],
+        address_count: int,
+        schema: Dict[str, str],
+        meta: Dict[str, str]
+    ) -> Dict[str, ConnectionPool]:
+        """
+        Serve lane pools returned by prepare() from now on.
+
+        New leases go to the new pools at once; leases already taken finish
+        on the old ones. The caller drains and closes the returned pools.
+
+        Returns:
+            The previously active lane pools
         """
-        if cls._connection is None:
+        old_lanes = cls._get_lanes()
+        cls._lanes = lanes
+        cls._schema = schema
+        cls._db_path = lanes[LOOKUP_LANE].db_path
+        cls._address_count = address_count
+        cls._meta = meta
+        cls._fingerprint = cls._identify(cls._db_path, meta)
+        cls._deep_check = {}
+        logger.info(
+            "database_pool_swapped",
+            db_path=cls._db_path,
+            previous_db_path=old_lanes[LOOKUP_LANE].db_path,
+            address_count=address_count,
+            dataset=cls._fingerprint
+        )
+        return old_lanes
+
+    @classmethod
+    def _get_lanes(cls) -> Dict[str, ConnectionPool]:
+        if not cls._lanes:
             raise RuntimeError(
                 "Database pool not initialized. Call DatabasePool.initialize() first."
             )
-        return cls._connection
+        return cls._lanes
+
+    @classmethod
+    def acquire(cls, lane: str = LOOKUP_LANE, deadline: Optional[float] = None):
+        """
+        Lease a connection from one of the query lanes.
+
+        Args:
+            lane: LOOKUP_LANE for request-path queries, ADMIN_LANE for heavy ones
+            deadline: Seconds the queries may run (default: the lane's deadline;
+                0 = no deadline)
+
+        Returns:
+            Async context manager yielding an aiosqlite connection
+
+        Raises:
+            RuntimeError: If pool not initialized
+            DatabasePoolTimeout: If no connection is available in time
+            QueryDeadlineExceeded: If a query runs past the deadline
+        """
+        return cls._get_lanes()[lane].lease(deadline)
 
     @classmethod
     async def close(cls) -> None:
         """
-        Close database connection pool.
+        Close all database connection pools.
 
         Should be called during application shutdown.
         """
-        if cls._connection is not None:
+        if cls._lanes:
             logger.info("database_pool_closing")
-            await cls._connection.close()
-            cls._connection = None
+            await cls.close_lanes(cls._lanes)
+            cls._lanes = {}
             cls._db_path = None
+            cls._schema = {}
+            cls._address_count = None
+            cls._meta = {}
+            cls._fingerprint = None
+            cls._deep_check = {}
+            cls._read_settings = {}
         else:
             logger.warning("database_pool_already_closed")
 
     @classmethod
     def is_initialized(cls) -> bool:
         """Check if database pool is initialized"""
-        return cls._connection is not None
+        return bool(cls._lanes)
+
+    @classmethod
+    def get_object_type(cls, name: str) -> Optional[str]:
+        """
+        Look up a schema object recorded at initialization.
+
+        Args:
+            name: Table or view name
+
+        Returns:
+            "table", "view", or None if the database has no such object
+        """
+        return cls._schema.get(name)
+
+    @classmethod
+    def get_db_path(cls) -> Optional[str]:
+        """Path of the database file currently served, or None if not initialized"""
+        return cls._db_path
+
+    @classmethod
+    def get_address_count(cls) -> Optional[int]:
+        """Address rows of the current database (from dataset_meta, or counted at open)"""
+        return cls._address_count
+
+    @classmethod
+    def get_dataset_meta(cls) -> Dict[str, str]:
+        """dataset_meta of the current database ({} if it has none)"""
+        return dict(cls._meta)
+
+    @classmethod
+    async def deep_check(cls) -> Dict[str, Any]:
+        """
+        Recount the tables recorded in dataset_meta and compare.
+
+        Meant to run in the background after startup (DB_DEEP_CHECK_ENABLED):
+        each table is counted in its own admin-lane lease without deadline,
+        so other admin queries get the lane in between. A mismatch is
+        logged as an error; the database keeps serving.
+
+        Returns:
+            {"status": "passed" | "failed" | "skipped" | "error", "mismatches", "duration_seconds"}
+        """
+        db_path, meta = cls._db_path, cls._meta
+        if not meta:
+            cls._deep_check = {"status": "skipped", "reason": "no dataset_meta"}
+            logger.warning("dataset_deep_check_skipped", db_path=db_path, reason="no dataset_meta")
+            return cls._deep_check
+
+        start = time.perf_counter()
+        mismatches: Dict[str, Dict[str, int]] = {}
+        try:
+            for table in COUNTED_TABLES:
+                recorded = recorded_row_count(meta, table)
+                if recorded is None or cls.get_object_type(table) != "table":
+                    continue
+                async with cls.acquire(ADMIN_LANE, deadline=0) as conn:
+                    async with conn.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+                        actual = (await cursor.fetchone())[0]
+                if cls._db_path != db_path:
+                    return {"status": "skipped", "reason": "dataset reloaded during check"}
+                if actual != recorded:
+                    mismatches[table] = {"recorded": recorded, "actual": actual}
+        except Exception as e:
+            cls._deep_check = {"status": "error", "error": str(e)}
+            logger.error("dataset_deep_check_error", db_path=db_path, error=str(e))
+            return cls._deep_check
+
+        cls._deep_check = {
+            "status": "failed" if mismatches else "passed",
+            "mismatches": mismatches,
+            "duration_seconds": round(time.perf_counter() - start, 3)
+        }
+        if mismatches:
+            logger.error("dataset_deep_check_failed", db_path=db_path, mismatches=mismatches)
+        else:
+            logger.info(
+                "dataset_deep_check_passed",
+                db_path=db_path,
+                duration_seconds=cls._deep_check["duration_seconds"]
+            )
+        return cls._deep_check
+
+    @staticmethod
+    def _identify(db_path: str, meta: Dict[str, str]) -> str:
+        """Fingerprint of a database: its recorded checksum, else file size and mtime."""
+        checksum = meta.get(CHECKSUM_KEY)
+        if checksum:
+            return f"{meta.get('bag_version') or 'unversioned'}:{checksum[:16]}"
+        stat = Path(db_path).stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    @classmethod
+    def dataset_fingerprint(cls) -> Optional[str]:
+        """
+        Identify the dataset currently served.
+
+        "<bag_version>:<checksum prefix>" when dataset_meta records a postcode
+        checksum, so copies of the same build share caches and ETags;
+        otherwise the database file's size and modification time. Fixed when
+        the database is opened or swapped in.
+
+        Returns:
+            Fingerprint string, or None if the pool is not initialized
+        """
+        return cls._fingerprint
 
     @classmethod
     async def health_check(cls) -> bool:
         """
-        Perform health check on database connection.
+        Perform health check on the lookup lane's pooled connections.
 
         Returns:
             True if database is accessible, False otherwise
@@ -118,10 +919,24 @@ class DatabasePool:
             if not cls.is_initialized():
                 return False
 
-            conn = await cls.get_connection()
-            await conn.execute("SELECT 1")
-            return True
+            return await cls._get_lanes()[LOOKUP_LANE].health_check()
 
         except Exception as e:
             logger.error("database_health_check_failed", error=str(e))
             return False
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Get per-lane pool utilisation statistics (empty if not initialized)."""
+        if not cls._lanes:
+            return {"initialized": False}
+        return {
+            "initialized": True,
+            "db_path": cls._db_path,
+            "address_count": cls._address_count,
+            "dataset": cls._fingerprint,
+            "dataset_meta": cls._meta,
+            "deep_check": cls._deep_check,
+            "read_profile": cls._read_settings,
+            "lanes": {name: pool.get_stats() for name, pool in cls._lanes.items()}
+        }
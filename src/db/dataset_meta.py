@@ -0,0 +1,134 @@
+"""
+Dataset metadata: facts about a BAG database recorded once at ingest.
+
+write-dataset-meta.py stores them in a small key/value table inside the
+database itself, so the API can size-check a database at startup (and at
+dataset reload) with one primary key scan instead of counting millions of
+address rows. Keys:
+
+- schema_version:   layout of this table (META_SCHEMA_VERSION)
+- bag_version:      BAG extract date (version_date in current-bag-version.json)
+- built_at:         when the metadata was written (UTC, ISO 8601)
+- rows_<table>:     row count of each table in COUNTED_TABLES that exists
+- postcodes:        distinct non-empty postcodes
+- postcodes_source: table the checksum was taken from (postcode_geo or unilabel)
+- postcodes_sha256: SHA-256 of every served postcode row, in postcode order
+
+The checksum identifies the dataset's content: it seeds the cache
+namespace and the HTTP ETags (DatabasePool.dataset_fingerprint()) and is
+reported by GET /version. The deep check (DB_DEEP_CHECK_ENABLED) recounts the tables after startup
+and reports any difference.
+"""
+
+import hashlib
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+META_TABLE = "dataset_meta"
+META_SCHEMA_VERSION = 1
+
+# Tables whose row counts are recorded (those missing from a database are skipped)
+COUNTED_TABLES = ("nums", "vbos", "oprs", "vbo_num", "postcode_geo")
+
+META_QUERY = f"SELECT key, value FROM {META_TABLE}"
+
+CREATE_META_TABLE = (
+    f"CREATE TABLE IF NOT EXISTS {META_TABLE} ("
+    "key TEXT PRIMARY KEY, value TEXT NOT NULL"
+    ") WITHOUT ROWID"
+)
+
+POSTCODE_COUNT_QUERY = "SELECT COUNT(DISTINCT postcode) FROM nums WHERE postcode != ''"
+
+CHECKSUM_KEY = "postcodes_sha256"
+CHECKSUM_SOURCE_KEY = "postcodes_source"
+
+
+def row_count_key(table: str) -> str:
+    """Metadata key holding the row count of a table."""
+    return f"rows_{table}"
+
+
+def recorded_row_count(meta: Dict[str, str], table: str) -> Optional[int]:
+    """
+    Row count of a table as recorded at ingest.
+
+    Returns:
+        The count, or None if the metadata does not record it
+    """
+    value = meta.get(row_count_key(table))
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def postcode_checksum(conn: sqlite3.Connection, query: str) -> str:
+    """
+    SHA-256 over the postcode rows a lookup source serves.
+
+    Each (postcode, lat, lon, woonplaats) row is hashed as one tab-separated
+    line, so any changed coordinate or city name changes the checksum.
+
+    Args:
+        conn: Connection to the BAG database
+        query: Row query of the source, ordered by postcode (memory_index.LOAD_QUERIES)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for postcode, lat, lon, woonplaats in conn.execute(query):
+        digest.update(f"{postcode}\t{lat!r}\t{lon!r}\t{woonplaats}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_dataset_meta(
+    conn: sqlite3.Connection,
+    bag_version: str = "",
+    built_at: Optional[datetime] = None,
+    checksum_source: Optional[str] = None,
+    checksum_query: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Count the dataset and (re)write its metadata table.
+
+    Runs the full counts (and the checksum) once, at ingest, on a writable database that is
+    not being served.
+
+    Args:
+        conn: Writable connection to the BAG database
+        bag_version: BAG extract date ("" if unknown)
+        built_at: Timestamp to record (default: now)
+        checksum_source: Lookup source to checksum (None: no checksum)
+        checksum_query: Row query of that source (see postcode_checksum())
+
+    Returns:
+        The metadata written
+    """
+    built_at = built_at or datetime.now(timezone.utc)
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+
+    meta = {
+        "schema_version": str(META_SCHEMA_VERSION),
+        "bag_version": bag_version,
+        "built_at": built_at.isoformat(timespec="seconds").replace("+00:00", "Z"),
+    }
+    for table in COUNTED_TABLES:
+        if table in existing:
+            meta[row_count_key(table)] = str(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+    if "nums" in existing:
+        meta["postcodes"] = str(conn.execute(POSTCODE_COUNT_QUERY).fetchone()[0])
+    if checksum_source and checksum_query:
+        meta[CHECKSUM_SOURCE_KEY] = checksum_source
+        meta[CHECKSUM_KEY] = postcode_checksum(conn, checksum_query)
+
+    with conn:
+        conn.execute(CREATE_META_TABLE)
+        conn.execute(f"DELETE FROM {META_TABLE}")
+        conn.executemany(f"INSERT INTO {META_TABLE} (key, value) VALUES (?, ?)", meta.items())
+
+    return meta
@@ -0,0 +1,197 @@
+"""
+Bulk export of the postcode dataset (one row per postcode).
+
+Exports stream from their own read-only sqlite3 connection, never from the
+lookup pool, so a full-table scan cannot hold a pooled connection for
+minutes. The row iterator is synchronous: Starlette runs each step
+(`fetchmany()` plus formatting one batch) in its threadpool, keeping the
+event loop free for lookups. A semaphore caps concurrent exports.
+
+Validators for HTTP caching come from the database's dataset_meta (its
+postcode checksum and BAG version), else from current-bag-version.json
+(written by bag-update-checker.py when a new BAG extract is ingested): the
+export of a given dataset, source and format is byte-identical, so it gets a
+strong ETag and the version date as Last-Modified.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.db.connection import DatabasePool, read_only_uri
+from src.db.dataset_meta import CHECKSUM_KEY
+
+logger = get_logger(__name__)
+
+# Bump when the exported columns or encoding change (invalidates ETags)
+EXPORT_LAYOUT_VERSION = 1
+
+EXPORT_COLUMNS = ["postcode", "woonplaats", "lat", "lon", "address_count"]
+
+EXPORT_QUERIES = {
+    "postcode_geo": (
+        "SELECT postcode, woonplaats, lat, lon, address_count FROM postcode_geo ORDER BY postcode"
+    ),
+    "unilabel": (
+        "SELECT postcode, woonplaats, lat, lon, COUNT(*) FROM unilabel "
+        "WHERE postcode != '' AND lat IS NOT NULL AND lon IS NOT NULL "
+        "GROUP BY postcode ORDER BY postcode"
+    ),
+}
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Concurrent exports; acquired by the request handler and released by the
+# row iterator, possibly on another thread
+_export_slots = threading.BoundedSemaphore(settings.export_max_concurrent)
+
+
+def read_bag_version(path: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Read the BAG version file written by bag-update-checker.py.
+
+    Args:
+        path: Version file (default: settings.bag_version_file)
+
+    Returns:
+        Parsed JSON, or None if the file is missing or unreadable
+    """
+    version_file = Path(path or settings.bag_version_file)
+    try:
+        return json.loads(version_file.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("bag_version_file_unreadable", path=str(version_file), error=str(e))
+        return None
+
+
+def current_bag_version() -> Optional[str]:
+    """
+    BAG version date of the dataset served.
+
+    Taken from the database's dataset_meta, which travels with the file;
+    databases without it fall back to the version file.
+
+    Returns:
+        Version date, or None if neither records one
+    """
+    version_date = DatabasePool.get_dataset_meta().get("bag_version")
+    if version_date:
+        return version_date
+    version = read_bag_version()
+    return version.get("version_date") if version else None
+
+
+def export_validators(fmt: str, source: str, version_date: Optional[str]) -> Tuple[str, str]:
+    """
+    Strong ETag and Last-Modified for an export.
+
+    The ETag is seeded with the dataset fingerprint when dataset_meta
+    records a postcode checksum, else with the BAG version date, else with
+    the database file fingerprint (size, mtime). Last-Modified is the
+    version date, or the file's mtime without one.
+
+    Args:
+        fmt: Export format ("ndjson" or "csv")
+        source: Lookup source the rows come from
+        version_date: BAG version date of the dataset (see current_bag_version())
+
+    Returns:
+        (etag, last_modified) as HTTP header values
+    """
+    if DatabasePool.get_dataset_meta().get(CHECKSUM_KEY) or not version_date:
+        seed = DatabasePool.dataset_fingerprint() or ""
+    else:
+        seed = version_date
+
+    if version_date:
+        modified = datetime.fromisoformat(version_date.replace("Z", "+00:00"))
+    else:
+        mtime = Path(DatabasePool.get_db_path()).stat().st_mtime
+        modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+    digest = hashlib.sha256(f"{seed}|{source}|{fmt}|{EXPORT_LAYOUT_VERSION}".encode()).hexdigest()
+    return f'"{digest[:32]}"', format_datetime(modified.astimezone(timezone.utc), usegmt=True)
+
+
+def try_acquire_export_slot() -> bool:
+    """Reserve an export slot without waiting; False if all are in use."""
+    return _export_slots.acquire(blocking=False)
+
+
+def release_export_slot() -> None:
+    """Return a slot reserved with try_acquire_export_slot()."""
+    _export_slots.release()
+
+
+def iter_export(fmt: str, source: str, batch_rows: int = None) -> Iterator[bytes]:
+    """
+    Stream all postcodes as NDJSON or CSV.
+
+    Owns one export slot (reserved by the caller) and releases it when the
+    iterator finishes or is closed. The first chunk is the CSV header (empty
+    for NDJSON), so a caller can advance the iterator once to open the
+    database before committing to a response.
+
+    Args:
+        fmt: "ndjson" or "csv"
+        source: "postcode_geo" or "unilabel"
+        batch_rows: Rows per fetchmany() and per chunk (default: settings.export_batch_rows)
+
+    Yields:
+        UTF-8 encoded chunks
+    """
+    batch_rows = batch_rows or settings.export_batch_rows
+    conn = None
+    rows_total = 0
+    completed = False
+
+    try:
+        conn = sqlite3.connect(read_only_uri(DatabasePool.get_db_path()), uri=True, check_same_thread=False)
+        cursor = conn.execute(EXPORT_QUERIES[source])
+
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if fmt == "csv":
+            writer.writerow(EXPORT_COLUMNS)
+        yield out.getvalue().encode("utf-8")
+
+        while True:
+            rows = cursor.fetchmany(batch_rows)
+            if not rows:
+                break
+            rows_total += len(rows)
+
+            if fmt == "csv":
+                out.seek(0)
+                out.truncate()
+                writer.writerows(rows)
+                yield out.getvalue().encode("utf-8")
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+                    for row in rows
+                ).encode("utf-8")
+
+        completed = True
+        logger.info("export_completed", format=fmt, source=source, rows=rows_total)
+
+    finally:
+        if conn is not None:
+            conn.close()
+        release_export_slot()
+        if not completed:
+            logger.warning("export_aborted", format=fmt, source=source, rows=rows_total)
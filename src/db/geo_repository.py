@@ -0,0 +1,373 @@
+"""
+Reverse geocoding: nearest postcode(s) to a WGS84 point.
+
+Uses the SQLite R*-tree `geoindex` built by bagconv-source/geo-queries
+(one point per verblijfsobject). A lookup selects the addresses inside a
+bounding box around the point, computes exact great-circle distances, and
+keeps the nearest address per postcode.
+
+The search radius adapts: it starts small (dense city centres have hundreds
+of addresses within 250 m) and doubles until enough postcodes are found
+within the radius, up to a configured maximum for rural areas and points
+off the coast.
+
+Radius searches (all postcodes within N km) use the same bounding box
+prefilter, but let SQLite reduce the addresses to one row per postcode (the
+address nearest in a local flat projection) before exact distances are
+computed in one vectorized NumPy pass.
+
+With an in-memory SpatialIndex attached (SPATIAL_ENGINE=memory), lookups
+use its grid over one point per postcode instead of SQLite; distances are
+then measured to the postcode's point rather than its nearest address.
+"""
+
+import math
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.geo import bounding_box, haversine_m, haversine_m_array
+from src.core.logging_config import get_logger
+from src.core.middleware import track_performance
+from src.db.connection import DatabasePool
+from src.db.spatial_index import SpatialIndex
+
+logger = get_logger(__name__)
+
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import (
+        reverse_lookups_total,
+        reverse_lookup_duration_seconds,
+        reverse_search_radius_meters,
+        nearby_searches_total,
+        nearby_search_duration_seconds,
+        nearby_results,
+        database_queries_total,
+        database_query_duration_seconds
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+
+# Points are stored as zero-size boxes, so min = max = the coordinate
+# (R-tree coordinates are 32-bit floats: ~0.5 m precision, fine for distances).
+# Planner: SCAN geoindex VIRTUAL TABLE INDEX (R-tree range on minLat..maxLon)
+REVERSE_QUERY = (
+    "SELECT nums.postcode, nums.woonplaats, geoindex.minLat, geoindex.minLon "
+    "FROM geoindex "
+    "JOIN vbo_num ON vbo_num.vbo = geoindex.vbo_id "
+    "JOIN nums ON nums.id = vbo_num.num "
+    "WHERE geoindex.minLat >= ? AND geoindex.maxLat <= ? "
+    "AND geoindex.minLon >= ? AND geoindex.maxLon <= ? "
+    "AND nums.postcode != '' AND nums.status != 'Naamgeving ingetrokken'"
+)
+
+# Nearest address per postcode inside a bounding box. The MIN() aggregate is a
+# squared flat-earth distance (longitude scaled by cos^2(lat)); SQLite fills
+# the bare columns from the row that has the minimum. Exact great-circle
+# distances are computed afterwards on the one point left per postcode.
+NEARBY_QUERY = (
+    "SELECT nums.postcode, nums.woonplaats, geoindex.minLat, geoindex.minLon, "
+    "MIN((geoindex.minLat - ?1) * (geoindex.minLat - ?1) "
+    "+ (geoindex.minLon - ?2) * (geoindex.minLon - ?2) * ?3) "
+    "FROM geoindex "
+    "JOIN vbo_num ON vbo_num.vbo = geoindex.vbo_id "
+    "JOIN nums ON nums.id = vbo_num.num "
+    "WHERE geoindex.minLat >= ?4 AND geoindex.maxLat <= ?5 "
+    "AND geoindex.minLon >= ?6 AND geoindex.maxLon <= ?7 "
+    "AND nums.postcode != '' AND nums.status != 'Naamgeving ingetrokken' "
+    "GROUP BY nums.postcode"
+)
+
+
+class SpatialIndexUnavailable(RuntimeError):
+    """Raised when the database has no geoindex R-tree."""
+
+
+class GeoRepository:
+    """
+    Repository for coordinate-based lookups.
+
+    Usage:
+        >>> await geo_repository.nearest_postcodes(52.0907, 5.1214, limit=3)
+        ([{'postcode': '3511AB', 'woonplaats': 'Utrecht', 'lat': ..., 'lon': ..., 'distance_m': 41.2}, ...], 250.0)
+    """
+
+    def __init__(self, initial_radius_m: float = None, max_radius_m: float = None):
+        """
+        Args:
+            initial_radius_m: First search radius (default: from settings)
+            max_radius_m: Largest search radius (default: from settings)
+        """
+        self.initial_radius_m = (
+            initial_radius_m if initial_radius_m is not None else settings.reverse_initial_radius_m
+        )
+        self.max_radius_m = max_radius_m if max_radius_m is not None else settings.reverse_max_radius_m
+
+        # Optional in-memory engine; when attached, lookups bypass the R-tree
+        self._index: Optional[SpatialIndex] = None
+
+    @property
+    def engine(self) -> str:
+        """Active spatial engine: "memory" or "rtree"."""
+        return "memory" if self._index is not None else "rtree"
+
+    def attach_index(self, index: Optional[SpatialIndex]) -> None:
+        """
+        Serve coordinate lookups from an in-memory spatial index.
+
+        Args:
+            index: Loaded SpatialIndex, or None to fall back to the R-tree
+        """
+        self._index = index
+        logger.info("spatial_engine_configured", engine=self.engine)
+
+    def get_index_stats(self) -> Optional[Dict[str, Any]]:
+        """Stats of the attached in-memory index, or None on the R-tree engine."""
+        return self._index.get_stats() if self._index is not None else None
+
+    def is_available(self) -> bool:
+        """True if coordinate lookups can be served (index attached or geoindex present)."""
+        return self._index is not None or DatabasePool.get_object_type("geoindex") == "table"
+
+    async def nearest_postcodes(
+        self,
+        lat: float,
+        lon: float,
+        limit: int = 1
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Find the postcodes nearest to a point.
+
+        Args:
+            lat: Latitude (WGS84)
+            lon: Longitude (WGS84)
+            limit: Number of postcodes to return
+
+        Returns:
+            (results, radius_m): up to `limit` postcodes, nearest first, each
+            with the location of its nearest address and the distance to it
+            in metres; and the search radius that produced them. Fewer
+            results (or none) mean fewer postcodes lie within max_radius_m.
+
+        Raises:
+            SpatialIndexUnavailable: If no index is attached and the database has no geoindex
+        """
+        if not self.is_available():
+            raise SpatialIndexUnavailable(
+                "Database has no geoindex R-tree. Run bagconv-source/geo-queries against the database."
+            )
+
+        lookup_start = time.time()
+
+        if self._index is not None:
+            positions, distances, radius = self._index.nearest(lat, lon, limit, self.max_radius_m)
+            results = [self._index.result(p, d) for p, d in zip(positions, distances)]
+            self._record_outcome(results, radius, lookup_start)
+            return results, radius
+
+        radius = min(self.initial_radius_m, self.max_radius_m)
+
+        while True:
+            nearest = await self._postcodes_within(lat, lon, radius)
+            if len(nearest) >= limit or radius >= self.max_radius_m:
+                break
+            radius = min(radius * 2, self.max_radius_m)
+
+        results = [
+            {
+                **result,
+                "lat": round(result["lat"], 6),
+                "lon": round(result["lon"], 6),
+                "distance_m": round(result["distance_m"], 1)
+            }
+            for result in sorted(nearest.values(), key=lambda result: result["distance_m"])[:limit]
+        ]
+
+        self._record_outcome(results, radius, lookup_start)
+        return results, radius
+
+    async def postcodes_in_radius(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: float,
+        max_results: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Find all postcodes within a radius of a point.
+
+        Args:
+            lat: Latitude (WGS84)
+            lon: Longitude (WGS84)
+            radius_m: Search radius in metres
+            max_results: Keep at most this many postcodes (the nearest)
+
+        Returns:
+            (results, total): postcodes nearest first, each with the location
+            of its nearest address (or its point on the memory engine) and
+            the distance in metres; and the number of postcodes in the
+            radius before the max_results cap.
+
+        Raises:
+            SpatialIndexUnavailable: If no index is attached and the database has no geoindex
+        """
+        if not self.is_available():
+            raise SpatialIndexUnavailable(
+                "Database has no geoindex R-tree. Run bagconv-source/geo-queries against the database."
+            )
+
+        search_start = time.time()
+
+        if self._index is not None:
+            positions, distances = self._index.within(lat, lon, radius_m)
+            total = len(positions)
+            results = [
+                self._index.result(p, d)
+                for p, d in zip(positions[:max_results], distances[:max_results])
+            ]
+        else:
+            min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+            lon_scale = math.cos(math.radians(lat)) ** 2
+            rows = await self._fetch_rows(
+                "nearby",
+                NEARBY_QUERY,
+                (lat, lon, lon_scale, min_lat, max_lat, min_lon, max_lon),
+                lat=lat,
+                lon=lon,
+                radius_m=radius_m
+            )
+            results, total = self._rank_by_distance(lat, lon, radius_m, rows, max_results)
+
+        if METRICS_AVAILABLE:
+            outcome = "found" if results else "not_found"
+            nearby_searches_total.labels(result=outcome).inc()
+            nearby_search_duration_seconds.labels(result=outcome).observe(time.time() - search_start)
+            nearby_results.observe(total)
+
+        return results, total
+
+    @staticmethod
+    def _rank_by_distance(
+        lat: float,
+        lon: float,
+        radius_m: float,
+        rows: List[tuple],
+        max_results: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Exact distances for (postcode, woonplaats, lat, lon, ...) rows; keep those within the radius."""
+        if not rows:
+            return [], 0
+
+        lats = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+        lons = np.fromiter((row[3] for row in rows), dtype=np.float64, count=len(rows))
+        distances = haversine_m_array(lat, lon, lats, lons)
+
+        # The box corners lie beyond the radius
+        inside = np.flatnonzero(distances <= radius_m)
+        order = inside[np.argsort(distances[inside], kind="stable")]
+
+        results = [
+            {
+                "postcode": rows[i][0],
+                "woonplaats": rows[i][1],
+                "lat": round(rows[i][2], 6),
+                "lon": round(rows[i][3], 6),
+                "distance_m": round(float(distances[i]), 1)
+            }
+            for i in order[:max_results]
+        ]
+        return results, len(order)
+
+    @staticmethod
+    def _record_outcome(results: List[Dict[str, Any]], radius: float, lookup_start: float) -> None:
+        """Count a lookup as found / not found in the reverse geocoding metrics."""
+        if not METRICS_AVAILABLE:
+            return
+        outcome = "found" if results else "not_found"
+        reverse_lookups_total.labels(result=outcome).inc()
+        reverse_lookup_duration_seconds.labels(result=outcome).observe(time.time() - lookup_start)
+        reverse_search_radius_meters.observe(radius)
+
+    async def _postcodes_within(self, lat: float, lon: float, radius_m: float) -> Dict[str, Dict[str, Any]]:
+        """Nearest address per postcode, for postcodes with an address within `radius_m`."""
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+        rows = await self._fetch_rows(
+            "reverse",
+            REVERSE_QUERY,
+            (min_lat, max_lat, min_lon, max_lon),
+            lat=lat,
+            lon=lon,
+            radius_m=radius_m
+        )
+
+        # The box also holds points beyond the radius (its corners); those are
+        # dropped, since a nearer postcode may lie just outside the box
+        nearest: Dict[str, Dict[str, Any]] = {}
+        for postcode, woonplaats, point_lat, point_lon in rows:
+            distance = haversine_m(lat, lon, point_lat, point_lon)
+            if distance > radius_m:
+                continue
+            best = nearest.get(postcode)
+            if best is None or distance < best["distance_m"]:
+                nearest[postcode] = {
+                    "postcode": postcode,
+                    "woonplaats": woonplaats,
+                    "lat": point_lat,
+                    "lon": point_lon,
+                    "distance_m": distance
+                }
+
+        return nearest
+
+    @staticmethod
+    async def _fetch_rows(kind: str, query: str, params: tuple, **context) -> List[tuple]:
+        """
+        Run a spatial query on a pooled connection, with metrics and error logging.
+
+        Args:
+            kind: Query kind for metric labels and log events ("reverse", "nearby")
+            query: SQL statement
+            params: Statement parameters
+            **context: Extra fields for the failure log event
+
+        Returns:
+            All result rows
+        """
+        operation = f"{kind}_lookup"
+
+        try:
+            db_start = time.time()
+
+            async with track_performance(f"database_{kind}_query"):
+                async with DatabasePool.acquire() as conn:
+                    async with conn.execute(query, params) as cursor:
+                        rows = await cursor.fetchall()
+
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation=operation, status="success").inc()
+                database_query_duration_seconds.labels(operation=operation).observe(time.time() - db_start)
+
+            return rows
+
+        except Exception as e:
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation=operation, status="error").inc()
+
+            logger.error(
+                f"database_{kind}_query_failed",
+                **context,
+                error=str(e),
+                error_type=type(e).__name__,
+                stack_trace=traceback.format_exc()
+            )
+            raise
+
+
+# Global geo repository instance
+geo_repository = GeoRepository()
@@ -0,0 +1,215 @@
+"""
+Compact in-memory postcode index.
+
+The postcode -> (lat, lon, woonplaats) dataset is ~500k rows, small enough to
+keep entirely in RAM. Loaded once at startup, it answers lookups with a binary
+search in the event loop: no SQL, no worker thread hop.
+
+Layout (parallel arrays, sorted by key):
+- keys:     uint32 packed postcodes (4 digits x 26 x 26, see pack_postcode)
+- lats:     float64 latitudes
+- lons:     float64 longitudes
+- city_ids: index into the interned woonplaats string table
+"""
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from src.db.connection import ADMIN_LANE, ConnectionPool, DatabasePool
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Query used to bulk-load one row per postcode, ordered by postcode
+LOAD_QUERIES = {
+    "postcode_geo": "SELECT postcode, lat, lon, woonplaats FROM postcode_geo ORDER BY postcode",
+    "unilabel": (
+        "SELECT postcode, lat, lon, woonplaats FROM unilabel "
+        "WHERE postcode != '' GROUP BY postcode ORDER BY postcode"
+    ),
+}
+
+LOAD_BATCH_SIZE = 5000
+
+
+def pack_postcode(postcode: str) -> Optional[int]:
+    """
+    Pack a normalized postcode into a 32-bit integer.
+
+    "1234AB" -> 1234 * 676 + 0 * 26 + 1. Keys sort in the same order as the
+    postcode strings.
+
+    Args:
+        postcode: Normalized Dutch postcode (e.g., "3511AB")
+
+    Returns:
+        Packed key, or None if the postcode is not 4 digits + 2 letters A-Z
+    """
+    if len(postcode) != 6 or not postcode[:4].isdigit():
+        return None
+    l1 = ord(postcode[4]) - 65
+    l2 = ord(postcode[5]) - 65
+    if not (0 <= l1 < 26 and 0 <= l2 < 26):
+        return None
+    return int(postcode[:4]) * 676 + l1 * 26 + l2
+
+
+def unpack_postcode(key: int) -> str:
+    """Inverse of pack_postcode."""
+    digits, letters = divmod(key, 676)
+    l1, l2 = divmod(letters, 26)
+    return f"{digits:04d}{chr(65 + l1)}{chr(65 + l2)}"
+
+
+class PostcodeIndex:
+    """
+    Read-only in-memory postcode table.
+
+    Usage:
+        >>> index = await PostcodeIndex.load("postcode_geo")
+        >>> index.get("3511AB")
+        {'postcode': '3511AB', 'lat': 52.096065, 'lon': 5.115926, 'woonplaats': 'Utrecht'}
+    """
+
+    engine = "memory"
+
+    def __init__(
+        self,
+        keys: array,
+        lats: array,
+        lons: array,
+        city_ids: array,
+        cities: List[str]
+    ):
+        self.keys = keys
+        self.lats = lats
+        self.lons = lons
+        self.city_ids = city_ids
+        self.cities = cities
+        self.load_seconds = 0.0
+
+    @classmethod
+    def from_rows(cls, rows) -> "PostcodeIndex":
+        """
+        Build an index from (postcode, lat, lon, woonplaats) rows.
+
+        Rows with malformed postcodes or missing coordinates are skipped.
+        Rows do not need to be sorted; duplicates keep the first occurrence.
+        """
+        entries = []
+        city_table: Dict[str, int] = {}
+        cities: List[str] = []
+
+        for postcode, lat, lon, woonplaats in rows:
+            key = pack_postcode(postcode or "")
+            if key is None or lat is None or lon is None:
+                continue
+            city_id = city_table.get(woonplaats)
+            if city_id is None:
+                city_id = len(cities)
+                city_table[woonplaats] = city_id
+                cities.append(woonplaats)
+            entries.append((key, lat, lon, city_id))
+
+        entries.sort(key=lambda entry: entry[0])
+        return cls._from_sorted(entries, cities)
+
+    @classmethod
+    def _from_sorted(cls, entries, cities: List[str]) -> "PostcodeIndex":
+        keys = array("I")
+        lats = array("d")
+        lons = array("d")
+        city_ids = array("H" if len(cities) <= 0xFFFF else "I")
+
+        last_key = -1
+        for key, lat, lon, city_id in entries:
+            if key == last_key:
+                continue
+            keys.append(key)
+            lats.append(lat)
+            lons.append(lon)
+            city_ids.append(city_id)
+            last_key = key
+
+        return cls(keys, lats, lons, city_ids, cities)
+
+    @classmethod
+    async def load(cls, source: str, pool: Optional[ConnectionPool] = None) -> "PostcodeIndex":
+        """
+        Bulk-load all postcodes through the admin query lane.
+
+        Args:
+            source: Data source name ("postcode_geo" or "unilabel")
+            pool: Admin lane pool to read from instead of the active one (dataset reload)
+
+        Returns:
+            Loaded index with `load_seconds` set
+        """
+        start = time.perf_counter()
+        rows = []
+
+        async with (pool.lease() if pool is not None else DatabasePool.acquire(ADMIN_LANE)) as conn:
+            async with conn.execute(LOAD_QUERIES[source]) as cursor:
+                while True:
+                    batch = await cursor.fetchmany(LOAD_BATCH_SIZE)
+                    if not batch:
+                        break
+                    rows.extend(batch)
+
+        index = cls.from_rows(rows)
+        index.load_seconds = time.perf_counter() - start
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _position(self, postcode: str) -> int:
+        """Row number for a postcode, or -1 if absent."""
+        key = pack_postcode(postcode)
+        if key is None:
+            return -1
+        pos = bisect_left(self.keys, key)
+        if pos < len(self.keys) and self.keys[pos] == key:
+            return pos
+        return -1
+
+    def get(self, postcode: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a normalized postcode.
+
+        Returns:
+            Dictionary in the same shape as PostcodeRepository results, or None
+        """
+        pos = self._position(postcode)
+        if pos < 0:
+            return None
+        return {
+            "postcode": postcode,
+            "lat": self.lats[pos],
+            "lon": self.lons[pos],
+            "woonplaats": self.cities[self.city_ids[pos]]
+        }
+
+    def close(self) -> None:
+        """Nothing to release; the arrays are garbage collected."""
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the arrays and the city string table."""
+        arrays = sum(
+            arr.buffer_info()[1] * arr.itemsize
+            for arr in (self.keys, self.lats, self.lons, self.city_ids)
+        )
+        strings = sys.getsizeof(self.cities) + sum(sys.getsizeof(c) for c in self.cities)
+        return arrays + strings
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            "postcodes": len(self),
+            "cities": len(self.cities),
+            "memory_mb": round(self.memory_bytes() / (1024 * 1024), 2),
+            "load_seconds": round(self.load_seconds, 3)
+        }
@@ -0,0 +1,350 @@
+"""
+Dataset reload: serve a new BAG database without restarting the API.
+
+A reload runs on the event loop next to live traffic:
+
+1. prepare:  open the lane pools on the new file and inspect it
+2. validate: required tables, address count against the current dataset,
+             and a sample of postcodes (the cached hot set, or a sample of
+             the new file) that must resolve in the new database
+3. preload:  rebuild the in-memory / mmap lookup index and the in-memory
+             spatial index, when those engines are active
+4. swap:     in one step without awaiting: new pools, source, indexes, and
+             caches cleared and primed with the hot set resolved in step 2
+5. drain:    queries already running finish on the old pools, which are then
+             closed in the background
+
+Steps 1-3 query the new file on its admin lane.
+
+Any failure before the swap leaves the current dataset serving. Triggered by
+POST /admin/reload or by watch_dataset() (RELOAD_WATCH_ENABLED), which
+reloads when the database file is replaced: build the new file next to the
+old one and rename it into place. Each uvicorn worker reloads on its own;
+with several workers use the watcher so all of them pick up the new file.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.db.address_repository import address_repository
+from src.db.binary_index import BinaryPostcodeIndex
+from src.db.connection import ADMIN_LANE, ConnectionPool, DatabasePool
+from src.db.geo_repository import geo_repository
+from src.db.memory_index import PostcodeIndex
+from src.db.repository import BATCH_CHUNK_SIZE, BATCH_QUERIES, repository
+from src.db.spatial_index import SpatialIndex
+
+logger = get_logger(__name__)
+
+# Import Prometheus metrics (gracefully handle if not available)
+try:
+    from src.core.metrics import dataset_reloads_total, dataset_reload_duration_seconds
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+# Objects every lookup path needs
+REQUIRED_OBJECTS = ("nums", "unilabel")
+
+# Postcodes checked in a new database when the cache holds none
+SAMPLE_QUERY = "SELECT DISTINCT postcode FROM nums WHERE postcode != '' LIMIT ?"
+
+
+class ReloadRejected(ValueError):
+    """Raised when a new dataset fails validation; the current one keeps serving."""
+
+
+class ReloadInProgress(RuntimeError):
+    """Raised when a reload is requested while another one is running."""
+
+
+class ReloadState:
+    """Outcome of the last dataset reload, exposed to the admin and debug endpoints."""
+
+    def __init__(self):
+        self.status = "idle"  # idle, running, complete, rejected, failed
+        self.trigger: Optional[str] = None
+        self.db_path: Optional[str] = None
+        self.address_count: Optional[int] = None
+        self.primed = 0
+        self.reloads = 0
+        self.duration_seconds = 0.0
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "trigger": self.trigger,
+            "db_path": self.db_path,
+            "address_count": self.address_count,
+            "primed": self.primed,
+            "reloads": self.reloads,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "error": self.error
+        }
+
+
+# Global reload state
+reload_state = ReloadState()
+
+_reload_lock = asyncio.Lock()
+
+# Background work started by reloads: draining old pools, deep checks
+# (keeps the tasks referenced until they finish)
+_background: Set[asyncio.Task] = set()
+
+
+async def _fetch_postcodes(
+    pool: ConnectionPool,
+    source: str,
+    postcodes: List[str]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Resolve postcodes against a pool that is not serving yet."""
+    found: Dict[str, Dict[str, Any]] = {}
+
+    async with pool.lease() as conn:
+        for i in range(0, len(postcodes), BATCH_CHUNK_SIZE):
+            chunk = postcodes[i:i + BATCH_CHUNK_SIZE]
+            query = BATCH_QUERIES[source].format(placeholders=",".join("?" * len(chunk)))
+            async with conn.execute(query, chunk) as cursor:
+                for row in await cursor.fetchall():
+                    found[row[0]] = {"postcode": row[0], "lat": row[1], "lon": row[2], "woonplaats": row[3]}
+
+    return {postcode: found.get(postcode) for postcode in postcodes}
+
+
+async def _validate(
+    pool: ConnectionPool,
+    address_count: int,
+    schema: Dict[str, str]
+) -> Tuple[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    Check a prepared dataset before it is swapped in.
+
+    Returns:
+        (source, hot set resolved in the new database for priming the cache)
+
+    Raises:
+        ReloadRejected: If the dataset is incomplete or does not match the
+            current one closely enough
+    """
+    missing = [name for name in REQUIRED_OBJECTS if name not in schema]
+    if missing:
+        raise ReloadRejected(f"New database has no {', '.join(missing)}")
+
+    current = DatabasePool.get_address_count()
+    if address_count == 0 or (current and address_count < current * settings.reload_min_row_ratio):
+        raise ReloadRejected(
+            f"New database has {address_count:,} addresses, the current one {current or 0:,} "
+            f"(minimum ratio {settings.reload_min_row_ratio})"
+        )
+
+    try:
+        source = repository.resolve_source(
+            settings.postcode_source.lower(),
+            schema.get("postcode_geo") == "table"
+        )
+    except (ValueError, RuntimeError) as e:
+        raise ReloadRejected(str(e))
+
+    hot = repository.get_cached_postcodes()
+    if hot:
+        sample = hot
+    else:
+        async with pool.lease() as conn:
+            async with conn.execute(SAMPLE_QUERY, (settings.reload_sample_size,)) as cursor:
+                sample = [row[0] for row in await cursor.fetchall()]
+
+    results = await _fetch_postcodes(pool, source, sample)
+    found = sum(1 for result in results.values() if result is not None)
+    if not sample or found / len(sample) < settings.reload_min_sample_hit_ratio:
+        raise ReloadRejected(
+            f"Only {found} of {len(sample)} sampled postcodes resolve in the new database "
+            f"(minimum ratio {settings.reload_min_sample_hit_ratio})"
+        )
+
+    return source, results if hot else {}
+
+
+async def _retire(lanes: Dict[str, ConnectionPool]) -> None:
+    """Drain and close the lane pools that were swapped out."""
+    drained = await asyncio.gather(
+        *(pool.drain(settings.reload_drain_timeout_seconds) for pool in lanes.values())
+    )
+    logger.info("database_pool_retired", db_path=lanes[ADMIN_LANE].db_path, drained=all(drained))
+
+
+def _record(trigger: str, result: str, start: float) -> None:
+    reload_state.duration_seconds = time.perf_counter() - start
+    if METRICS_AVAILABLE:
+        dataset_reloads_total.labels(trigger=trigger, result=result).inc()
+        if result == "success":
+            dataset_reload_duration_seconds.observe(reload_state.duration_seconds)
+
+
+async def reload_dataset(db_path: str = None, trigger: str = "admin") -> Dict[str, Any]:
+    """
+    Validate a database file and swap it in for the one being served.
+
+    Args:
+        db_path: New database file (default: reopen the current path, e.g.
+            after a new build was renamed into place)
+        trigger: What started the reload ("admin" or "watch"), for logs and metrics
+
+    Returns:
+        Reload state after the swap (see ReloadState)
+
+    Raises:
+        ReloadInProgress: If another reload is running
+        ReloadRejected: If the new dataset failed validation
+        Exception: If opening or preloading the new dataset failed
+    """
+    if _reload_lock.locked():
+        raise ReloadInProgress("A dataset reload is already running")
+
+    async with _reload_lock:
+        db_path = db_path or DatabasePool.get_db_path()
+        start = time.perf_counter()
+        reload_state.status = "running"
+        reload_state.trigger = trigger
+        reload_state.db_path = db_path
+        reload_state.error = None
+        logger.info("dataset_reload_started", db_path=db_path, trigger=trigger)
+
+        lanes = None
+        try:
+            if not Path(db_path).is_file():
+                raise ReloadRejected(f"Database file not found: {db_path}")
+
+            lanes, address_count, schema, meta = await DatabasePool.prepare(db_path)
+            pool = lanes[ADMIN_LANE]
+            source, hot = await _validate(pool, address_count, schema)
+
+            # Build replacement indexes for the engines in use before swapping
+            lookup_index = None
+            if repository.engine == "memory":
+                lookup_index = await PostcodeIndex.load(source, pool=pool)
+            elif repository.engine == "mmap":
+                lookup_index = BinaryPostcodeIndex.open(settings.binary_index_path)
+
+            spatial_index = None
+            if geo_repository.engine == "memory":
+                spatial_index = await SpatialIndex.load(source, settings.spatial_grid_cell_m, pool=pool)
+
+        except Exception as e:
+            if lanes is not None:
+                await DatabasePool.close_lanes(lanes)
+            result = "rejected" if isinstance(e, ReloadRejected) else "failed"
+            reload_state.status = result
+            reload_state.error = str(e)
+            _record(trigger, result, start)
+            logger.error(
+                "dataset_reload_failed",
+                db_path=db_path,
+                trigger=trigger,
+                result=result,
+                error=str(e),
+                error_type=type(e).__name__
+            )
+            raise
+
+        # Swap: no awaits from here on, so no request sees a half-switched state
+        old_lanes = DatabasePool.swap(lanes, address_count, schema, meta)
+        repository.configure_source(source)
+        if lookup_index is not None:
+            repository.attach_index(lookup_index)  # Also clears the caches
+        else:
+            repository.clear_cache()
+        if spatial_index is not None:
+            geo_repository.attach_index(spatial_index)
+        address_repository.clear_cache()
+        primed = repository.prime_cache(hot) if repository.engine == "sqlite" else 0
+
+        tasks = [asyncio.create_task(_retire(old_lanes))]
+        if settings.db_deep_check_enabled:
+            tasks.append(asyncio.create_task(DatabasePool.deep_check()))
+        for task in tasks:
+            _background.add(task)
+            task.add_done_callback(_background.discard)
+
+        reload_state.status = "complete"
+        reload_state.address_count = address_count
+        reload_state.primed = primed
+        reload_state.reloads += 1
+        _record(trigger, "success", start)
+        logger.info(
+            "dataset_reload_complete",
+            db_path=db_path,
+            trigger=trigger,
+            source=source,
+            address_count=address_count,
+            engine=repository.engine,
+            primed=primed,
+            duration_seconds=round(reload_state.duration_seconds, 3)
+        )
+        return reload_state.to_dict()
+
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """(inode, size, mtime) of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _watched_signature() -> Tuple[Optional[Tuple[int, int, int]], ...]:
+    """Signatures of the files a reload would pick up."""
+    paths = [DatabasePool.get_db_path()]
+    if repository.engine == "mmap":
+        paths.append(settings.binary_index_path)
+    return tuple(_file_signature(path) for path in paths)
+
+
+async def watch_dataset(interval: float = None) -> None:
+    """
+    Reload when the served database file (or binary index) is replaced.
+
+    Intended to run as a background task started from lifespan. A change
+    must be stable for one interval before it is picked up, so a file that
+    is still being written is not opened. A rejected or failed reload is not
+    retried until the files change again.
+
+    Args:
+        interval: Seconds between checks (default: settings.reload_watch_interval_seconds)
+    """
+    interval = interval or settings.reload_watch_interval_seconds
+    current = _watched_signature()
+    reloads = reload_state.reloads
+    pending = None
+    logger.info("dataset_watch_started", db_path=DatabasePool.get_db_path(), interval_seconds=interval)
+
+    while True:
+        await asyncio.sleep(interval)
+        signature = _watched_signature()
+
+        # Reloaded through the admin endpoint meanwhile: watch the new files
+        if reload_state.reloads != reloads:
+            current, reloads, pending = signature, reload_state.reloads, None
+            continue
+
+        if signature == current or None in signature:
+            pending = None
+            continue
+        if signature != pending:
+            pending = signature
+            continue
+
+        current, pending = signature, None
+        logger.info("dataset_change_detected", db_path=DatabasePool.get_db_path())
+        try:
+            await reload_dataset(trigger="watch")
+        except Exception:
+            pass  # Logged by reload_dataset; the current dataset keeps serving
+        reloads = reload_state.reloads
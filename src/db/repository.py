@@ -6,11 +6,18 @@ for optimal performance. Postcode data is relatively static, making it
 ideal for aggressive caching.
 """
 
+import asyncio
+import hashlib
 import traceback
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Union
 from cachetools import TTLCache
+from src.db.cache_snapshot import ExpiringCache, read_snapshot, write_snapshot
 from src.db.connection import DatabasePool
+from src.db.binary_index import BinaryPostcodeIndex
+from src.db.memory_index import PostcodeIndex
+from src.db.shared_cache import SharedPostcodeCache
+from src.models.responses import PostcodeResponse
 from src.core.config import settings
 from src.core.middleware import track_performance
 from src.core.logging_config import get_logger
@@ -24,6 +31,9 @@ try:
         cache_operations_total,
         cache_hit_ratio,
         cache_size_current,
+        cache_coalesced_requests_total,
+        negative_cache_operations_total,
+        negative_cache_size_current,
         database_queries_total,
         database_query_duration_seconds,
         postcode_lookups_total,
@@ -34,6 +44,34 @@ except ImportError:
     METRICS_AVAILABLE = False
 
 
+# Single-postcode lookup query per data source
+LOOKUP_QUERIES = {
+    # Materialized table (create-postcode-geo-table.sql): single primary key probe
+    "postcode_geo": "SELECT postcode, lat, lon, woonplaats FROM postcode_geo WHERE postcode = ?",
+    # Raw BAG view: joins nums, oprs, vbos and vbo_num per lookup
+    "unilabel": "SELECT postcode, lat, lon, woonplaats FROM unilabel WHERE postcode = ? LIMIT 1",
+}
+
+# Multi-postcode lookup query per data source ({placeholders} is filled per chunk)
+BATCH_QUERIES = {
+    "postcode_geo": "SELECT postcode, lat, lon, woonplaats FROM postcode_geo WHERE postcode IN ({placeholders})",
+    "unilabel": (
+        "SELECT postcode, lat, lon, woonplaats FROM unilabel "
+        "WHERE postcode IN ({placeholders}) GROUP BY postcode"
+    ),
+}
+
+# Postcodes per IN (...) query; stays below SQLite's historic 999 variable limit
+BATCH_CHUNK_SIZE = 500
+
+
+class CachedResponse(NamedTuple):
+    """Final JSON body of a postcode lookup, ready to send as-is."""
+    body: bytes
+    etag: str
+    woonplaats: str
+
+
 class PostcodeRepository:
     """
     Repository for postcode data with intelligent caching.
@@ -43,6 +81,12 @@ class PostcodeRepository:
     - Cache hit logging for monitoring
     - Automatic cache miss handling
     - Thread-safe cache implementation
+    - Single-flight: concurrent misses for one postcode share one query
+    - Negative cache: not-found postcodes skip SQLite until their TTL expires
+    - Serialized cache: final JSON bytes + ETag per postcode for raw responses
+    - Cache snapshot: entries survive restarts with their remaining TTL
+    - Shared cache (optional): one mmap'd cache for all uvicorn workers, between
+      the per-worker cache and SQLite
 
     Cache benefits:
     - 90%+ faster for cached postcodes (~1ms vs ~50ms)
@@ -54,7 +98,10 @@ class PostcodeRepository:
         self,
         cache_enabled: bool = None,
         cache_size: int = None,
-        cache_ttl: int = None
+        cache_ttl: int = None,
+        negative_cache_enabled: bool = None,
+        negative_cache_size: int = None,
+        negative_cache_ttl: int = None
     ):
         """
         Initialize repository with optional cache configuration.
@@ -63,6 +110,9 @@ class PostcodeRepository:
             cache_enabled: Enable/disable caching (default: from settings)
             cache_size: Maximum number of cached postcodes (default: from settings)
             cache_ttl: Cache time-to-live in seconds (default: from settings)
+            negative_cache_enabled: Cache not-found postcodes (default: from settings)
+            negative_cache_size: Maximum number of cached not-found postcodes (default: from settings)
+            negative_cache_ttl: Not-found cache time-to-live in seconds (default: from settings)
         """
         self.cache_enabled = cache_enabled if cache_enabled is not None else settings.enable_response_cache
         self.cache_size = cache_size if cache_size is not None else settings.cache_max_size
@@ -70,20 +120,179 @@ class PostcodeRepository:
 
         # Initialize cache
         if self.cache_enabled:
-            self._cache = TTLCache(maxsize=self.cache_size, ttl=self.cache_ttl)
+            self._cache = ExpiringCache(maxsize=self.cache_size, ttl=self.cache_ttl)
             logger.info("response_cache_enabled", max_size=self.cache_size, ttl_seconds=self.cache_ttl)
         else:
             self._cache = None
             logger.info("response_cache_disabled")
 
+        # Initialize negative cache (postcodes known to be absent)
+        self.negative_cache_enabled = (
+            negative_cache_enabled if negative_cache_enabled is not None else settings.enable_negative_cache
+        )
+        self.negative_cache_size = (
+            negative_cache_size if negative_cache_size is not None else settings.negative_cache_max_size
+        )
+        self.negative_cache_ttl = (
+            negative_cache_ttl if negative_cache_ttl is not None else settings.negative_cache_ttl_seconds
+        )
+
+        if self.negative_cache_enabled:
+            self._negative_cache = ExpiringCache(maxsize=self.negative_cache_size, ttl=self.negative_cache_ttl)
+            logger.info(
+                "negative_cache_enabled",
+                max_size=self.negative_cache_size,
+                ttl_seconds=self.negative_cache_ttl
+            )
+        else:
+            self._negative_cache = None
+
+        # Serialized response cache: postcode -> CachedResponse (same size/TTL as the data cache)
+        self.serialized_cache_enabled = self.cache_enabled and settings.cache_serialized_responses
+        if self.serialized_cache_enabled:
+            self._response_cache = TTLCache(maxsize=self.cache_size, ttl=self.cache_ttl)
+        else:
+            self._response_cache = None
+
         # Cache statistics
+        self._response_hits = 0
         self._cache_hits = 0
         self._cache_misses = 0
+        self._coalesced = 0
+        self._negative_hits = 0
+        self._negative_misses = 0
+        self._restored = 0
+
+        # Single-flight: postcode -> task querying it, shared by concurrent misses
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Bumped by clear_cache(); results of queries started under an older
+        # generation (e.g. on the database before a reload) are not cached
+        self._generation = 0
+
+        # Data source, resolved against the database schema by configure_source()
+        self.source = "unilabel"
+        self._lookup_query = LOOKUP_QUERIES[self.source]
+
+        # Optional in-memory or mmap engine; when attached, lookups bypass cache and SQLite
+        self._index: Optional[Union[PostcodeIndex, BinaryPostcodeIndex]] = None
+
+        # Optional cross-worker cache, consulted after a per-worker cache miss
+        self._shared: Optional[SharedPostcodeCache] = None
+
+    def configure_source(self, source: str = None) -> str:
+        """
+        Select the table used for postcode lookups.
+
+        Must be called after DatabasePool.initialize(), which records the schema.
+
+        Args:
+            source: "auto", "postcode_geo" or "unilabel" (default: from settings).
+                "auto" uses the materialized postcode_geo table when the database
+                has one and falls back to the unilabel view otherwise.
+
+        Returns:
+            The source that was selected
+
+        Raises:
+            ValueError: If the source name is unknown
+            RuntimeError: If postcode_geo is requested but not materialized
+        """
+        requested = (source or settings.postcode_source).lower()
+        resolved = self.resolve_source(requested, DatabasePool.get_object_type("postcode_geo") == "table")
+
+        self.source = resolved
+        self._lookup_query = LOOKUP_QUERIES[resolved]
+        logger.info("postcode_source_configured", requested=requested, source=resolved)
+        return resolved
+
+    @staticmethod
+    def resolve_source(requested: str, has_table: bool) -> str:
+        """
+        Resolve a postcode_source setting against a database schema.
+
+        Args:
+            requested: "auto", "postcode_geo" or "unilabel"
+            has_table: Whether the database has a materialized postcode_geo table
+
+        Returns:
+            "postcode_geo" or "unilabel"
+
+        Raises:
+            ValueError: If the source name is unknown
+            RuntimeError: If postcode_geo is requested but not materialized
+        """
+        if requested == "auto":
+            resolved = "postcode_geo" if has_table else "unilabel"
+        elif requested == "postcode_geo" and not has_table:
+            raise RuntimeError(
+                "postcode_source=postcode_geo but the database has no postcode_geo table. "
+                "Run create-postcode-geo-table.sql against the database first."
+            )
+        elif requested in LOOKUP_QUERIES:
+            resolved = requested
+        else:
+            raise ValueError(
+                f"Unknown postcode_source '{requested}'. "
+                f"Expected one of: auto, {', '.join(LOOKUP_QUERIES)}"
+            )
+        return resolved
+
+    @property
+    def engine(self) -> str:
+        """Active lookup engine: "memory", "mmap" or "sqlite"."""
+        return self._index.engine if self._index is not None else "sqlite"
+
+    def attach_index(self, index: Optional[Union[PostcodeIndex, BinaryPostcodeIndex]]) -> None:
+        """
+        Serve lookups from an in-memory or memory-mapped index instead of SQLite.
+
+        Args:
+            index: Loaded PostcodeIndex or mapped BinaryPostcodeIndex, or None
+                to fall back to SQLite
+        """
+        if self._index is not None and self._index is not index:
+            self._index.close()
+        self._index = index
+        self.clear_cache()
+        logger.info("lookup_engine_configured", engine=self.engine)
+
+    def get_index_stats(self) -> Optional[Dict[str, Any]]:
+        """Statistics of the in-memory or mmap engine, or None on SQLite."""
+        return self._index.get_stats() if self._index is not None else None
+
+    def attach_shared_cache(self, shared: Optional[SharedPostcodeCache]) -> None:
+        """
+        Use a cache shared by all workers as second level behind the local cache.
+
+        Args:
+            shared: Opened SharedPostcodeCache, or None to detach
+        """
+        if self._shared is not None and self._shared is not shared:
+            self._shared.close()
+        self._shared = shared
+        logger.info("shared_cache_configured", enabled=shared is not None)
+
+    def _lookup_in_memory(self, postcode: str, lookup_start: float) -> Optional[Dict[str, Any]]:
+        """Resolve a postcode from the attached in-memory index."""
+        result = self._index.get(postcode)
+        outcome = "found" if result else "not_found"
+
+        if METRICS_AVAILABLE:
+            lookup_duration = time.time() - lookup_start
+            postcode_lookups_total.labels(result=outcome).inc()
+            postcode_lookup_duration_seconds.labels(result=outcome).observe(lookup_duration)
+
+        return result
 
     async def get_postcode(self, postcode: str) -> Optional[Dict[str, Any]]:
         """
         Look up postcode data with caching.
 
+        Concurrent cache misses for the same postcode are coalesced: the first
+        caller starts the database query and later callers await its result
+        instead of issuing their own query (single-flight).
+
         Args:
             postcode: Normalized Dutch postcode (e.g., "3511AB")
 
@@ -99,6 +308,10 @@ class PostcodeRepository:
         # Track total lookup time
         lookup_start = time.time()
 
+        # In-memory engine: a binary search is cheaper than the cache itself
+        if self._index is not None:
+            return self._lookup_in_memory(postcode, lookup_start)
+
         # Check cache first
         if self.cache_enabled and postcode in self._cache:
             self._cache_hits += 1
@@ -124,18 +337,103 @@ class PostcodeRepository:
         if METRICS_AVAILABLE:
             cache_operations_total.labels(operation="miss").inc()
 
+        # Another worker may have cached it already
+        if self._shared is not None:
+            result = self._shared.get(postcode)
+            if result is not None:
+                if self.cache_enabled:
+                    self._cache[postcode] = result
+                if METRICS_AVAILABLE:
+                    cache_operations_total.labels(operation="shared_hit").inc()
+                    postcode_lookups_total.labels(result="found").inc()
+                    postcode_lookup_duration_seconds.labels(result="found").observe(time.time() - lookup_start)
+                return result
+
+        # Known-missing postcode: answer from the negative cache
+        if self._is_known_missing(postcode):
+            if METRICS_AVAILABLE:
+                postcode_lookups_total.labels(result="not_found").inc()
+                postcode_lookup_duration_seconds.labels(result="not_found").observe(time.time() - lookup_start)
+            return None
+
+        # Join an in-flight query for the same postcode, or start one.
+        # The query runs as its own task so a cancelled caller (client
+        # disconnect) does not cancel it for the other waiters.
+        task = self._inflight.get(postcode)
+        if task is None:
+            task = asyncio.ensure_future(self._query_postcode(postcode))
+            self._inflight[postcode] = task
+            task.add_done_callback(lambda done, key=postcode: self._inflight_done(key, done))
+        else:
+            self._coalesced += 1
+            logger.debug("cache_miss_coalesced", postcode=postcode)
+            if METRICS_AVAILABLE:
+                cache_coalesced_requests_total.inc()
+
+        result = await asyncio.shield(task)
+
+        # Record lookup outcome and duration
+        outcome = "found" if result else "not_found"
+        lookup_duration = time.time() - lookup_start
+        if METRICS_AVAILABLE:
+            postcode_lookups_total.labels(result=outcome).inc()
+            postcode_lookup_duration_seconds.labels(result=outcome).observe(lookup_duration)
+
+        return result
+
+    def _is_known_missing(self, postcode: str) -> bool:
+        """Check the negative cache, updating its hit/miss counters."""
+        if self._negative_cache is None:
+            return False
+
+        if postcode in self._negative_cache:
+            self._negative_hits += 1
+            logger.debug("negative_cache_hit", postcode=postcode)
+            if METRICS_AVAILABLE:
+                negative_cache_operations_total.labels(operation="hit").inc()
+            return True
+
+        self._negative_misses += 1
+        if METRICS_AVAILABLE:
+            negative_cache_operations_total.labels(operation="miss").inc()
+        return False
+
+    def _remember_missing(self, postcodes: List[str]) -> None:
+        """Store postcodes the database does not know in the negative cache."""
+        if self._negative_cache is None or not postcodes:
+            return
+
+        for postcode in postcodes:
+            self._negative_cache[postcode] = True
+
+        if METRICS_AVAILABLE:
+            negative_cache_size_current.set(len(self._negative_cache))
+
+    def _inflight_done(self, postcode: str, task: asyncio.Future) -> None:
+        """Drop a finished query from the in-flight map."""
+        if self._inflight.get(postcode) is task:
+            del self._inflight[postcode]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _query_postcode(self, postcode: str) -> Optional[Dict[str, Any]]:
+        """
+        Query a single postcode from the database and cache a found result.
+
+        Returns:
+            Postcode data dict or None if not found
+        """
+        generation = self._generation
+
         try:
             # Track database query time
             db_start = time.time()
 
             async with track_performance("database_query"):
-                conn = await DatabasePool.get_connection()
-
-                async with conn.execute(
-                    "SELECT postcode, lat, lon, woonplaats FROM unilabel WHERE postcode = ? LIMIT 1",
-                    (postcode,)
-                ) as cursor:
-                    row = await cursor.fetchone()
+                async with DatabasePool.acquire() as conn:
+                    async with conn.execute(self._lookup_query, (postcode,)) as cursor:
+                        row = await cursor.fetchone()
 
             db_duration = time.time() - db_start
 
@@ -144,39 +442,35 @@ class PostcodeRepository:
                 database_queries_total.labels(operation="postcode_lookup", status="success").inc()
                 database_query_duration_seconds.labels(operation="postcode_lookup").observe(db_duration)
 
-            if row:
-                # Build result dictionary
-                result = {
-                    "postcode": row[0],
-                    "lat": row[1],
-                    "lon": row[2],
-                    "woonplaats": row[3]
-                }
+            # Build result dictionary
+            result = {
+                "postcode": row[0],
+                "lat": row[1],
+                "lon": row[2],
+                "woonplaats": row[3]
+            } if row else None
 
-                # Store in cache
-                if self.cache_enabled:
-                    self._cache[postcode] = result
-                    logger.debug("postcode_cached", postcode=postcode)
+            # Cleared while querying (dataset reloaded): answer, but do not cache
+            if generation != self._generation:
+                return result
 
-                    # Update cache size metric
-                    if METRICS_AVAILABLE:
-                        cache_size_current.set(len(self._cache))
+            if result is None:
+                self._remember_missing([postcode])
+                return None
 
-                # Record successful lookup duration
-                lookup_duration = time.time() - lookup_start
-                if METRICS_AVAILABLE:
-                    postcode_lookups_total.labels(result="found").inc()
-                    postcode_lookup_duration_seconds.labels(result="found").observe(lookup_duration)
+            # Store in cache
+            if self.cache_enabled:
+                self._cache[postcode] = result
+                logger.debug("postcode_cached", postcode=postcode)
 
-                return result
+                # Update cache size metric
+                if METRICS_AVAILABLE:
+                    cache_size_current.set(len(self._cache))
 
-            # Postcode not found
-            lookup_duration = time.time() - lookup_start
-            if METRICS_AVAILABLE:
-                postcode_lookups_total.labels(result="not_found").inc()
-                postcode_lookup_duration_seconds.labels(result="not_found").observe(lookup_duration)
+            if self._shared is not None:
+                self._shared.set(postcode, result)
 
-            return None
+            return result
 
         except Exception as e:
             # Record database error metric
@@ -192,6 +486,207 @@ class PostcodeRepository:
             )
             raise
 
+    async def get_postcode_response(self, postcode: str) -> Optional[CachedResponse]:
+        """
+        Look up a postcode and return its pre-serialized JSON response.
+
+        The body is validated and encoded once, when first cached; later hits
+        return the stored bytes and ETag without building a model or encoding
+        JSON again.
+
+        Args:
+            postcode: Normalized Dutch postcode (e.g., "3511AB")
+
+        Returns:
+            CachedResponse, or None if the postcode was not found
+        """
+        lookup_start = time.time()
+
+        # A serialized hit is also a regular cache hit ("serialized_hit" is its sub-count)
+        if self._response_cache is not None:
+            cached = self._response_cache.get(postcode)
+            if cached is not None:
+                self._cache_hits += 1
+                self._response_hits += 1
+                if METRICS_AVAILABLE:
+                    cache_operations_total.labels(operation="hit").inc()
+                    cache_operations_total.labels(operation="serialized_hit").inc()
+                    postcode_lookups_total.labels(result="found").inc()
+                    postcode_lookup_duration_seconds.labels(result="found").observe(time.time() - lookup_start)
+                return cached
+
+        # Taken before the lookup: a reload during the await must not pair
+        # the old dataset's body with the new dataset's ETag
+        generation = self._generation
+        etag = self.etag(postcode)
+
+        result = await self.get_postcode(postcode)
+        if result is None:
+            return None
+
+        body = PostcodeResponse(**result).model_dump_json().encode("utf-8")
+        response = CachedResponse(
+            body=body,
+            etag=etag,
+            woonplaats=result["woonplaats"]
+        )
+
+        # Cleared while looking up (dataset reloaded): answer, but do not cache
+        if self._response_cache is not None and generation == self._generation:
+            self._response_cache[postcode] = response
+
+        return response
+
+    async def get_postcodes(self, postcodes: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up many postcodes at once.
+
+        Cached postcodes are served from the cache; all misses are resolved
+        with chunked `WHERE postcode IN (...)` queries on a single leased
+        connection instead of one query per postcode.
+
+        Args:
+            postcodes: Normalized, valid Dutch postcodes (duplicates allowed)
+
+        Returns:
+            Mapping of each distinct postcode to its data dict, or None if
+            not found
+        """
+        lookup_start = time.time()
+        unique = list(dict.fromkeys(postcodes))
+
+        if self._index is not None:
+            results = {postcode: self._index.get(postcode) for postcode in unique}
+            self._record_batch_outcomes(results, lookup_start)
+            return results
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        misses: List[str] = []
+
+        for postcode in unique:
+            cached = self._cache.get(postcode) if self.cache_enabled else None
+            if cached is not None:
+                results[postcode] = cached
+            else:
+                misses.append(postcode)
+
+        hits = len(unique) - len(misses)
+        self._cache_hits += hits
+        self._cache_misses += len(misses)
+        if METRICS_AVAILABLE:
+            if hits:
+                cache_operations_total.labels(operation="hit").inc(hits)
+            if misses:
+                cache_operations_total.labels(operation="miss").inc(len(misses))
+
+        # Serve what other workers already cached
+        if self._shared is not None:
+            remaining = []
+            for postcode in misses:
+                shared = self._shared.get(postcode)
+                if shared is not None:
+                    results[postcode] = shared
+                    if self.cache_enabled:
+                        self._cache[postcode] = shared
+                else:
+                    remaining.append(postcode)
+            if METRICS_AVAILABLE and len(remaining) < len(misses):
+                cache_operations_total.labels(operation="shared_hit").inc(len(misses) - len(remaining))
+            misses = remaining
+
+        # Drop postcodes already known to be missing
+        unknown = []
+        for postcode in misses:
+            if self._is_known_missing(postcode):
+                results[postcode] = None
+            else:
+                unknown.append(postcode)
+
+        if unknown:
+            generation = self._generation
+            found = await self._fetch_many(unknown)
+            for postcode in unknown:
+                results[postcode] = found.get(postcode)
+
+            # Cleared while querying (dataset reloaded): answer, but do not cache
+            if generation != self._generation:
+                self._record_batch_outcomes(results, lookup_start)
+                return results
+
+            self._remember_missing([postcode for postcode in unknown if postcode not in found])
+
+            if self.cache_enabled and found:
+                self._cache.update(found)
+                if METRICS_AVAILABLE:
+                    cache_size_current.set(len(self._cache))
+
+            if self._shared is not None:
+                for postcode, result in found.items():
+                    self._shared.set(postcode, result)
+
+        self._record_batch_outcomes(results, lookup_start)
+        return results
+
+    async def _fetch_many(self, postcodes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve postcodes from the database in chunks of BATCH_CHUNK_SIZE."""
+        found: Dict[str, Dict[str, Any]] = {}
+        query_template = BATCH_QUERIES[self.source]
+
+        try:
+            db_start = time.time()
+
+            async with track_performance("database_batch_query"):
+                async with DatabasePool.acquire() as conn:
+                    for i in range(0, len(postcodes), BATCH_CHUNK_SIZE):
+                        chunk = postcodes[i:i + BATCH_CHUNK_SIZE]
+                        query = query_template.format(placeholders=",".join("?" * len(chunk)))
+                        async with conn.execute(query, chunk) as cursor:
+                            for row in await cursor.fetchall():
+                                found[row[0]] = {
+                                    "postcode": row[0],
+                                    "lat": row[1],
+                                    "lon": row[2],
+                                    "woonplaats": row[3]
+                                }
+
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation="postcode_batch_lookup", status="success").inc()
+                database_query_duration_seconds.labels(operation="postcode_batch_lookup").observe(
+                    time.time() - db_start
+                )
+
+            return found
+
+        except Exception as e:
+            if METRICS_AVAILABLE:
+                database_queries_total.labels(operation="postcode_batch_lookup", status="error").inc()
+
+            logger.error(
+                "database_batch_query_failed",
+                postcode_count=len(postcodes),
+                error=str(e),
+                error_type=type(e).__name__,
+                stack_trace=traceback.format_exc()
+            )
+            raise
+
+    def _record_batch_outcomes(
+        self,
+        results: Dict[str, Optional[Dict[str, Any]]],
+        lookup_start: float
+    ) -> None:
+        """Count found/not-found batch results in the lookup metrics."""
+        if not METRICS_AVAILABLE:
+            return
+
+        found = sum(1 for result in results.values() if result is not None)
+        not_found = len(results) - found
+        if found:
+            postcode_lookups_total.labels(result="found").inc(found)
+        if not_found:
+            postcode_lookups_total.labels(result="not_found").inc(not_found)
+        postcode_lookup_duration_seconds.labels(result="batch").observe(time.time() - lookup_start)
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache performance statistics.
@@ -212,8 +707,13 @@ class PostcodeRepository:
 
         stats = {
             "enabled": self.cache_enabled,
+            "source": self.source,
+            "engine": self.engine,
             "hits": self._cache_hits,
             "misses": self._cache_misses,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._inflight),
+            "restored": self._restored,
             "hit_rate": round(hit_rate, 3)
         }
 
@@ -224,18 +724,199 @@ class PostcodeRepository:
                 "ttl_seconds": self.cache_ttl
             })
 
+        negative_total = self._negative_hits + self._negative_misses
+        stats["negative"] = {
+            "enabled": self.negative_cache_enabled,
+            "hits": self._negative_hits,
+            "misses": self._negative_misses,
+            "hit_rate": round(self._negative_hits / negative_total, 3) if negative_total > 0 else 0.0
+        }
+        if self._negative_cache is not None:
+            stats["negative"].update({
+                "size": len(self._negative_cache),
+                "max_size": self.negative_cache_size,
+                "ttl_seconds": self.negative_cache_ttl
+            })
+
+        stats["serialized"] = {
+            "enabled": self.serialized_cache_enabled,
+            "hits": self._response_hits
+        }
+        if self._response_cache is not None:
+            stats["serialized"]["size"] = len(self._response_cache)
+
+        stats["shared"] = {"enabled": self._shared is not None}
+        if self._shared is not None:
+            stats["shared"].update(self._shared.get_stats())
+
+        if self._index is not None:
+            stats["index"] = self._index.get_stats()
+
         # Update Prometheus cache hit ratio gauge
         if METRICS_AVAILABLE:
             cache_hit_ratio.set(hit_rate)
 
         return stats
 
+    def get_cached_postcodes(self) -> List[str]:
+        """List the postcodes currently held in the (positive) cache."""
+        if not self.cache_enabled:
+            return []
+        return list(self._cache.keys())
+
+    def dataset_fingerprint(self) -> str:
+        """Identity of the data served: source plus dataset, the namespace of persisted caches."""
+        return f"{self.source}:{DatabasePool.dataset_fingerprint()}"
+
+    def etag(self, postcode: str) -> str:
+        """
+        Strong ETag of a postcode lookup, known without looking it up.
+
+        Derived from the dataset fingerprint, source, engine (and the binary
+        file's checksum on mmap) and API version, so it only changes when the
+        response could; a matching If-None-Match
+        can be answered with 304 before touching any cache or engine.
+
+        Args:
+            postcode: Normalized Dutch postcode (e.g., "3511AB")
+
+        Returns:
+            Quoted ETag header value
+        """
+        index_sha = getattr(self._index, "sha256", "")
+        seed = f"{self.dataset_fingerprint()}|{self.engine}|{index_sha}|{settings.api_version}|{postcode}"
+        return f'"{hashlib.blake2b(seed.encode("utf-8"), digest_size=8).hexdigest()}"'
+
+    def dump_cache(self, path: str) -> int:
+        """
+        Write the found and not-found caches to a snapshot file.
+
+        Must be called before DatabasePool.close(), which the fingerprint
+        depends on.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries written
+        """
+        found = self._cache.entries() if self.cache_enabled else []
+        missing = self._negative_cache.entries() if self._negative_cache is not None else []
+
+        start = time.perf_counter()
+        written = write_snapshot(
+            path,
+            self.dataset_fingerprint(),
+            found=found,
+            missing=[(postcode, expires_at) for postcode, _, expires_at in missing]
+        )
+        logger.info(
+            "cache_snapshot_written",
+            path=path,
+            entries=written,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2)
+        )
+        return written
+
+    def load_cache(self, path: str) -> int:
+        """
+        Restore cache entries from a snapshot written by dump_cache().
+
+        Entries keep their original expiry time. A snapshot taken against
+        another database file or source is ignored.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries restored
+        """
+        if not self.cache_enabled:
+            return 0
+
+        start = time.perf_counter()
+        snapshot = read_snapshot(path, self.dataset_fingerprint())
+        if snapshot is None:
+            return 0
+
+        for result, expires_at in snapshot.found:
+            self._cache.set_with_expiry(result["postcode"], result, expires_at)
+
+        if self._negative_cache is not None:
+            for postcode, expires_at in snapshot.missing:
+                self._negative_cache.set_with_expiry(postcode, True, expires_at)
+
+        self._restored = len(self._cache) + (len(self._negative_cache) if self._negative_cache is not None else 0)
+
+        if METRICS_AVAILABLE:
+            cache_size_current.set(len(self._cache))
+            if self._negative_cache is not None:
+                negative_cache_size_current.set(len(self._negative_cache))
+
+        logger.info(
+            "cache_snapshot_loaded",
+            path=path,
+            found=len(self._cache),
+            missing=len(self._negative_cache) if self._negative_cache is not None else 0,
+            duration_ms=round((time.perf_counter() - start) * 1000, 2)
+        )
+        return self._restored
+
     def clear_cache(self) -> None:
-        """Clear all cached entries"""
+        """
+        Clear all cached entries, found and not-found.
+
+        Must be called whenever the dataset changes, so postcodes added by
+        the new data are not masked by stale negative entries.
+        """
         if self.cache_enabled and self._cache:
             self._cache.clear()
             logger.info("cache_cleared")
 
+        if self._response_cache is not None:
+            self._response_cache.clear()
+
+        if self._negative_cache is not None:
+            self._negative_cache.clear()
+            if METRICS_AVAILABLE:
+                negative_cache_size_current.set(0)
+            logger.info("negative_cache_cleared")
+
+        if self._shared is not None:
+            # Workers still on the previous dataset keep writing its rows:
+            # only records tagged with this worker's dataset are trusted
+            self._shared.set_dataset(self.dataset_fingerprint())
+            self._shared.invalidate_all()
+
+        # Queries still running started before the clear: new misses must not join them
+        self._generation += 1
+        self._inflight = {}
+
+    def prime_cache(self, results: Dict[str, Optional[Dict[str, Any]]]) -> int:
+        """
+        Fill the found and not-found caches with already resolved postcodes.
+
+        Used after a dataset reload, with the hot postcodes looked up in the
+        new database before it was swapped in, so the switch does not start
+        from a cold cache.
+
+        Args:
+            results: Postcode -> data dict, or None if not found
+
+        Returns:
+            Number of found postcodes cached
+        """
+        if not self.cache_enabled:
+            return 0
+
+        found = {postcode: result for postcode, result in results.items() if result is not None}
+        self._cache.update(found)
+        self._remember_missing([postcode for postcode, result in results.items() if result is None])
+
+        if METRICS_AVAILABLE:
+            cache_size_current.set(len(self._cache))
+        return len(found)
+
     def invalidate_postcode(self, postcode: str) -> None:
         """
         Invalidate specific postcode in cache.
@@ -247,6 +928,16 @@ class PostcodeRepository:
             del self._cache[postcode]
             logger.info("cache_entry_invalidated", postcode=postcode)
 
+        if self._response_cache is not None:
+            self._response_cache.pop(postcode, None)
+
+        if self._negative_cache is not None and postcode in self._negative_cache:
+            del self._negative_cache[postcode]
+            logger.info("negative_cache_entry_invalidated", postcode=postcode)
+
+        if self._shared is not None:
+            self._shared.invalidate(postcode)
+
 
 # Global repository instance
 repository = PostcodeRepository()
@@ -0,0 +1,300 @@
+"""
+Postcode cache shared by all uvicorn workers.
+
+With `--workers N` every worker keeps its own TTL cache: N copies of the hot
+set, each with its own cold misses. This module keeps one cache in an mmap'd
+file (by default on /dev/shm) that all workers of a host map into memory.
+
+Layout:
+- header (64 bytes): magic, version, slot count, generation
+- slots:  fixed-size records in an open-addressing hash table (linear probing)
+
+Record: packed postcode + 1 (0 = empty slot), generation, dataset id,
+expires_at (epoch seconds), lat, lon, woonplaats (UTF-8, NUL-padded), crc32
+of the preceding fields.
+
+Readers take no locks. Writers replace a whole record with one slice
+assignment; a reader that races a writer in another process sees a checksum
+mismatch and treats the slot as a miss. Invalidation bumps the generation in
+the header, which makes every record written under an older generation stale
+at once.
+
+Workers do not switch datasets together: during a rolling restart, or after
+a reload that reached only some workers, old and new datasets are served
+side by side. Each record therefore carries the 64-bit id of the dataset it
+was read from, and a worker only trusts records of its own dataset.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.core.logging_config import get_logger
+from src.db.memory_index import pack_postcode
+
+logger = get_logger(__name__)
+
+SHARED_CACHE_MAGIC = b"PCSHM\0\0\0"
+SHARED_CACHE_VERSION = 2
+
+HEADER = struct.Struct("<8sIII")  # magic, version, slots, generation
+HEADER_SIZE = 64
+GENERATION_OFFSET = 16
+
+RECORD = struct.Struct("<IIQddd44sI")  # key + 1, generation, dataset id, expires_at, lat, lon, woonplaats, crc32
+CHECKED = struct.Struct("<IIQddd44s")
+CITY_BYTES = 44
+
+# Slots probed per lookup/insert before evicting the first probed slot
+MAX_PROBES = 8
+
+
+def dataset_id(fingerprint: str) -> int:
+    """64-bit id of a dataset fingerprint, stored in every record."""
+    return int.from_bytes(hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SharedPostcodeCache:
+    """
+    Fixed-size postcode cache in a memory-mapped file.
+
+    Usage:
+        >>> cache = SharedPostcodeCache.open("/dev/shm/postcode-api-cache", slots=262144, ttl=86400)
+        >>> cache.set("3511AB", {"postcode": "3511AB", "lat": 52.09, "lon": 5.11, "woonplaats": "Utrecht"})
+        >>> cache.get("3511AB")["woonplaats"]
+        'Utrecht'
+    """
+
+    def __init__(self, path: str, mm: mmap.mmap, slots: int, ttl: float, fingerprint: str = ""):
+        self.path = path
+        self.slots = slots
+        self.ttl = ttl
+        self._mm = mm
+        self._mask = slots - 1
+        self._dataset = dataset_id(fingerprint)
+
+        # Per-worker statistics
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @classmethod
+    def open(cls, path: str, slots: int, ttl: float, fingerprint: str = "") -> "SharedPostcodeCache":
+        """
+        Map the shared cache file, creating it if no worker has yet.
+
+        The file is built under a temporary name and linked into place, so
+        other workers never map a file without a header.
+
+        Args:
+            path: Cache file path (use tmpfs, e.g. /dev/shm, for RAM speed)
+            slots: Number of records; rounded up to a power of two
+            ttl: Time-to-live of new entries in seconds
+            fingerprint: Identity of the dataset this worker serves; only
+                records written for it are returned (see set_dataset())
+
+        Raises:
+            RuntimeError: If an existing file has an incompatible layout
+        """
+        slots = 1 << max(0, slots - 1).bit_length()
+        size = HEADER_SIZE + slots * RECORD.size
+        file_path = Path(path)
+
+        if not file_path.exists():
+            tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER.pack(SHARED_CACHE_MAGIC, SHARED_CACHE_VERSION, slots, 1))
+                f.truncate(size)
+            try:
+                os.link(tmp_path, file_path)
+                logger.info("shared_cache_created", path=path, slots=slots, size_mb=round(size / (1024 * 1024), 1))
+            except FileExistsError:
+                pass  # Another worker won the race; use its file
+            finally:
+                tmp_path.unlink()
+
+        with open(file_path, "r+b") as f:
+            mm = mmap.mmap(f.fileno(), 0)
+
+        magic, version, file_slots, generation = HEADER.unpack_from(mm, 0)
+        if (
+            magic != SHARED_CACHE_MAGIC
+            or version != SHARED_CACHE_VERSION
+            or len(mm) != HEADER_SIZE + file_slots * RECORD.size
+        ):
+            mm.close()
+            raise RuntimeError(
+                f"Shared cache file {path} has an incompatible layout. "
+                "Remove it (no worker may be running) and restart."
+            )
+
+        cache = cls(path, mm, file_slots, ttl, fingerprint)
+        if file_slots != slots:
+            logger.warning("shared_cache_size_mismatch", path=path, requested_slots=slots, slots=file_slots)
+
+        logger.info("shared_cache_opened", path=path, slots=file_slots, generation=cache.generation)
+        return cache
+
+    @property
+    def generation(self) -> int:
+        """Current generation; records from older generations are stale."""
+        return struct.unpack_from("<I", self._mm, GENERATION_OFFSET)[0]
+
+    def set_dataset(self, fingerprint: str) -> None:
+        """
+        Switch this worker to another dataset (after a reload).
+
+        Records written for the previous dataset become misses for this
+        worker only; workers still serving it keep using them.
+        """
+        self._dataset = dataset_id(fingerprint)
+        logger.info("shared_cache_dataset_changed", path=self.path)
+
+    def _probe(self, key: int):
+        """Offsets of the slots a key may occupy, in probe order."""
+        slot = ((key * 2654435761) & 0xFFFFFFFF) & self._mask
+        for i in range(min(MAX_PROBES, self.slots)):
+            yield HEADER_SIZE + ((slot + i) & self._mask) * RECORD.size
+
+    def _read(self, offset: int):
+        """Unpack the record at `offset`, or None if it is torn (checksum mismatch)."""
+        record = self._mm[offset:offset + RECORD.size]
+        fields = RECORD.unpack(record)
+        if fields[0] == 0:
+            return fields  # Never written
+        if zlib.crc32(record[:CHECKED.size]) != fields[-1]:
+            return None
+        return fields
+
+    def get(self, postcode: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a normalized postcode.
+
+        Returns:
+            Postcode data dict, or None on a miss (absent, stale or expired)
+        """
+        key = pack_postcode(postcode)
+        if key is None:
+            return None
+        key += 1
+
+        generation = self.generation
+        now = time.time()
+
+        for offset in self._probe(key):
+            fields = self._read(offset)
+            if fields is None:
+                continue
+            slot_key, slot_generation, slot_dataset, expires_at, lat, lon, city, _ = fields
+            if slot_key == 0:
+                break
+            if (
+                slot_key == key
+                and slot_generation == generation
+                and slot_dataset == self._dataset
+                and now < expires_at
+            ):
+                self.hits += 1
+                return {
+                    "postcode": postcode,
+                    "lat": lat,
+                    "lon": lon,
+                    "woonplaats": city.rstrip(b"\0").decode("utf-8")
+                }
+
+        self.misses += 1
+        return None
+
+    def set(self, postcode: str, result: Dict[str, Any]) -> bool:
+        """
+        Store postcode data for all workers.
+
+        Takes the postcode's own slot, else the first empty or stale slot
+        (older generation, other dataset or expired) in its probe range,
+        else evicts the first probed slot.
+
+        Returns:
+            False if the entry cannot be stored (malformed postcode or a
+            woonplaats longer than the record allows)
+        """
+        key = pack_postcode(postcode)
+        city = result["woonplaats"].encode("utf-8")
+        if key is None or len(city) > CITY_BYTES:
+            return False
+        key += 1
+
+        generation = self.generation
+        now = time.time()
+        target = None
+        first = None
+
+        for offset in self._probe(key):
+            if first is None:
+                first = offset
+            fields = self._read(offset)
+            if fields is None:
+                target = target or offset
+                continue
+            slot_key, slot_generation, slot_dataset, expires_at = fields[:4]
+            if slot_key == key or slot_key == 0:
+                target = offset
+                break
+            if target is None and (
+                slot_generation != generation or slot_dataset != self._dataset or expires_at <= now
+            ):
+                target = offset
+
+        checked = CHECKED.pack(
+            key, generation, self._dataset, now + self.ttl, result["lat"], result["lon"], city
+        )
+        offset = target if target is not None else first
+        self._mm[offset:offset + RECORD.size] = checked + struct.pack("<I", zlib.crc32(checked))
+        self.writes += 1
+        return True
+
+    def invalidate(self, postcode: str) -> None:
+        """Mark one postcode stale (its slot stays occupied so probe chains stay intact)."""
+        key = pack_postcode(postcode)
+        if key is None:
+            return
+        key += 1
+
+        for offset in self._probe(key):
+            fields = self._read(offset)
+            if fields is None:
+                continue
+            if fields[0] == 0:
+                return
+            if fields[0] == key:
+                checked = CHECKED.pack(key, 0, 0, 0.0, 0.0, 0.0, b"")
+                self._mm[offset:offset + RECORD.size] = checked + struct.pack("<I", zlib.crc32(checked))
+                return
+
+    def invalidate_all(self) -> None:
+        """Make every entry stale, for every worker, by bumping the generation."""
+        generation = (self.generation % 0xFFFFFFFF) + 1
+        struct.pack_into("<I", self._mm, GENERATION_OFFSET, generation)
+        logger.info("shared_cache_invalidated", path=self.path, generation=generation)
+
+    def close(self) -> None:
+        """Unmap the file. The file itself stays for the other workers."""
+        self._mm.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get shared cache statistics (hit/miss/write counts are this worker's)."""
+        total = self.hits + self.misses
+        return {
+            "path": self.path,
+            "slots": self.slots,
+            "size_mb": round((HEADER_SIZE + self.slots * RECORD.size) / (1024 * 1024), 1),
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate": round(self.hits / total, 3) if total > 0 else 0.0
+        }
@@ -0,0 +1,370 @@
+"""
+In-memory spatial index over one point per postcode.
+
+A uniform grid in NumPy arrays: postcode points are projected to metres
+(equirectangular around the dataset's mean latitude), bucketed into square
+cells and stored sorted by cell id, with a CSR-style `cell_start` offset
+table. The points of a rectangle of cells are then one contiguous slice per
+grid row, so candidate selection is a handful of array slices and distance
+computations are vectorized over all candidates at once.
+
+Layout (parallel arrays, sorted by cell id):
+- keys:     uint32 packed postcodes (see memory_index.pack_postcode)
+- lats:     float64 latitudes
+- lons:     float64 longitudes
+- city_ids: index into the interned woonplaats string table
+"""
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.geo import METERS_PER_DEGREE_LAT, haversine_m_array
+from src.core.logging_config import get_logger
+from src.db.connection import ADMIN_LANE, ConnectionPool, DatabasePool
+from src.db.memory_index import LOAD_BATCH_SIZE, pack_postcode, unpack_postcode
+
+logger = get_logger(__name__)
+
+# One point per postcode: the address centroid from unilabel, or the
+# materialized postcode_geo point
+SPATIAL_LOAD_QUERIES = {
+    "postcode_geo": "SELECT postcode, lat, lon, woonplaats FROM postcode_geo",
+    "unilabel": (
+        "SELECT postcode, AVG(lat), AVG(lon), woonplaats FROM unilabel "
+        "WHERE postcode != '' AND lat IS NOT NULL AND lon IS NOT NULL GROUP BY postcode"
+    ),
+}
+
+# Queries per distance matrix block in nearest_many(); bounds temporary memory
+QUERY_BLOCK_SIZE = 256
+
+
+class SpatialIndex:
+    """
+    Read-only grid index answering k-nearest and radius queries.
+
+    Usage:
+        >>> index = await SpatialIndex.load("postcode_geo", cell_size_m=1000)
+        >>> positions, distances, covered = index.nearest(52.0907, 5.1214, k=3)
+        >>> index.result(positions[0], distances[0])
+        {'postcode': '3511AB', 'woonplaats': 'Utrecht', 'lat': ..., 'lon': ..., 'distance_m': 41.2}
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        city_ids: np.ndarray,
+        cities: List[str],
+        cell_size_m: float
+    ):
+        self.cell_size_m = float(cell_size_m)
+        self.cities = cities
+        self.load_seconds = 0.0
+
+        # Projection: metres per degree at the mean latitude
+        self._lat0 = float(lats.mean()) if len(lats) else 52.0
+        self._m_per_lon = METERS_PER_DEGREE_LAT * math.cos(math.radians(self._lat0))
+        max_abs_lat = float(np.abs(lats).max()) if len(lats) else self._lat0
+        # Projected x shrinks away from lat0; scale covered radii by the worst case
+        self._scale = 0.99 * min(1.0, math.cos(math.radians(max_abs_lat)) / math.cos(math.radians(self._lat0)))
+
+        x = lons * self._m_per_lon
+        y = lats * METERS_PER_DEGREE_LAT
+        self._x0 = float(x.min()) if len(x) else 0.0
+        self._y0 = float(y.min()) if len(y) else 0.0
+        cx = ((x - self._x0) // self.cell_size_m).astype(np.int64)
+        cy = ((y - self._y0) // self.cell_size_m).astype(np.int64)
+        self._cols = int(cx.max()) + 1 if len(cx) else 1
+        self._rows = int(cy.max()) + 1 if len(cy) else 1
+
+        cells = cy * self._cols + cx
+        order = np.argsort(cells, kind="stable")
+        self.keys = keys[order]
+        self.lats = lats[order]
+        self.lons = lons[order]
+        self.city_ids = city_ids[order]
+        self._cell_start = np.searchsorted(cells[order], np.arange(self._rows * self._cols + 1))
+
+    @classmethod
+    def from_rows(cls, rows, cell_size_m: float) -> "SpatialIndex":
+        """
+        Build an index from (postcode, lat, lon, woonplaats) rows.
+
+        Rows with malformed postcodes or missing coordinates are skipped.
+        """
+        keys: List[int] = []
+        lats: List[float] = []
+        lons: List[float] = []
+        city_ids: List[int] = []
+        city_table: Dict[str, int] = {}
+
+        for postcode, lat, lon, woonplaats in rows:
+            key = pack_postcode(postcode or "")
+            if key is None or lat is None or lon is None:
+                continue
+            keys.append(key)
+            lats.append(lat)
+            lons.append(lon)
+            city_ids.append(city_table.setdefault(woonplaats, len(city_table)))
+
+        return cls(
+            np.array(keys, dtype=np.uint32),
+            np.array(lats, dtype=np.float64),
+            np.array(lons, dtype=np.float64),
+            np.array(city_ids, dtype=np.uint32),
+            list(city_table),
+            cell_size_m
+        )
+
+    @classmethod
+    async def load(
+        cls,
+        source: str,
+        cell_size_m: float,
+        pool: Optional[ConnectionPool] = None
+    ) -> "SpatialIndex":
+        """
+        Bulk-load one point per postcode through the admin query lane.
+
+        Args:
+            source: Data source name ("postcode_geo" or "unilabel")
+            cell_size_m: Grid cell edge in metres
+            pool: Admin lane pool to read from instead of the active one (dataset reload)
+
+        Returns:
+            Loaded index with `load_seconds` set
+        """
+        start = time.perf_counter()
+        rows = []
+
+        async with (pool.lease() if pool is not None else DatabasePool.acquire(ADMIN_LANE)) as conn:
+            async with conn.execute(SPATIAL_LOAD_QUERIES[source]) as cursor:
+                while True:
+                    batch = await cursor.fetchmany(LOAD_BATCH_SIZE)
+                    if not batch:
+                        break
+                    rows.extend(batch)
+
+        index = cls.from_rows(rows, cell_size_m)
+        index.load_seconds = time.perf_counter() - start
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _cell_of(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Grid column and row of a point (may lie outside the grid)."""
+        cx = int((lon * self._m_per_lon - self._x0) // self.cell_size_m)
+        cy = int((lat * METERS_PER_DEGREE_LAT - self._y0) // self.cell_size_m)
+        return cx, cy
+
+    def _covered_m(self, rings: int) -> float:
+        """Radius guaranteed to be inside the square of `rings` cells around a point's cell."""
+        return rings * self.cell_size_m * self._scale
+
+    def _rings_for(self, radius_m: float) -> int:
+        """Smallest ring count whose square covers `radius_m`."""
+        return max(1, math.ceil(radius_m / (self.cell_size_m * self._scale)))
+
+    def _candidates(self, cx: int, cy: int, rings: int) -> np.ndarray:
+        """Positions of all points in the cells within `rings` of cell (cx, cy)."""
+        x0 = max(cx - rings, 0)
+        x1 = min(cx + rings, self._cols - 1)
+        y0 = max(cy - rings, 0)
+        y1 = min(cy + rings, self._rows - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+
+        rows = np.arange(y0, y1 + 1) * self._cols
+        starts = self._cell_start[rows + x0]
+        ends = self._cell_start[rows + x1 + 1]
+        slices = [np.arange(s, e) for s, e in zip(starts, ends) if e > s]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        max_radius_m: float = math.inf
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Find the k postcodes nearest to a point.
+
+        The searched square doubles until the k-th distance lies within the
+        radius it is guaranteed to cover, or max_radius_m is covered.
+
+        Returns:
+            (positions, distances_m, covered_m): up to k positions nearest
+            first, their distances, and the radius searched
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0), 0.0
+
+        cx, cy = self._cell_of(lat, lon)
+        max_rings = self._rings_for(max_radius_m) if math.isfinite(max_radius_m) else None
+        rings = 1
+
+        while True:
+            if max_rings is not None:
+                rings = min(rings, max_rings)
+            covered = min(self._covered_m(rings), max_radius_m)
+            candidates = self._candidates(cx, cy, rings)
+            exhausted = (max_rings is not None and rings >= max_rings) or len(candidates) == len(self)
+
+            if len(candidates) >= k or exhausted:
+                distances = haversine_m_array(lat, lon, self.lats[candidates], self.lons[candidates])
+                if k < len(candidates):
+                    top = np.argpartition(distances, k - 1)[:k]
+                    candidates, distances = candidates[top], distances[top]
+                if exhausted or distances.max() <= covered:
+                    break
+
+            rings *= 2
+
+        keep = distances <= max_radius_m
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order], covered
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find all postcodes within `radius_m` of a point.
+
+        Returns:
+            (positions, distances_m), nearest first
+        """
+        cx, cy = self._cell_of(lat, lon)
+        candidates = self._candidates(cx, cy, self._rings_for(radius_m))
+        distances = haversine_m_array(lat, lon, self.lats[candidates], self.lons[candidates])
+        keep = distances <= radius_m
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def nearest_many(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        k: int = 1,
+        max_radius_m: float = math.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        k-nearest postcodes for many points at once.
+
+        Queries are grouped by grid cell; each group shares one candidate set
+        and is answered with one (queries x candidates) distance matrix.
+
+        Returns:
+            (positions, distances_m), both shaped (n, k), nearest first.
+            Missing neighbours (fewer than k within max_radius_m) are -1 / inf.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        n = len(lats)
+        positions = np.full((n, k), -1, dtype=np.int64)
+        distances = np.full((n, k), np.inf)
+        if n == 0 or len(self) == 0:
+            return positions, distances
+
+        cx = ((lons * self._m_per_lon - self._x0) // self.cell_size_m).astype(np.int64)
+        cy = ((lats * METERS_PER_DEGREE_LAT - self._y0) // self.cell_size_m).astype(np.int64)
+        cells, inverse = np.unique(np.stack([cx, cy], axis=1), axis=0, return_inverse=True)
+        by_cell = np.argsort(inverse.ravel(), kind="stable")
+        bounds = np.searchsorted(inverse.ravel()[by_cell], np.arange(len(cells) + 1))
+
+        for group, (cell_x, cell_y) in enumerate(cells):
+            members = by_cell[bounds[group]:bounds[group + 1]]
+            for i in range(0, len(members), QUERY_BLOCK_SIZE):
+                block = members[i:i + QUERY_BLOCK_SIZE]
+                block_pos, block_dist = self._nearest_block(
+                    int(cell_x), int(cell_y), lats[block], lons[block], k, max_radius_m
+                )
+                positions[block, :block_pos.shape[1]] = block_pos
+                distances[block, :block_dist.shape[1]] = block_dist
+
+        return positions, distances
+
+    def _nearest_block(
+        self,
+        cx: int,
+        cy: int,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        k: int,
+        max_radius_m: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """k-nearest for queries in one cell: shared candidates, one distance matrix."""
+        max_rings = self._rings_for(max_radius_m) if math.isfinite(max_radius_m) else None
+        rings = 1
+
+        while True:
+            if max_rings is not None:
+                rings = min(rings, max_rings)
+            covered = min(self._covered_m(rings), max_radius_m)
+            candidates = self._candidates(cx, cy, rings)
+            exhausted = (max_rings is not None and rings >= max_rings) or len(candidates) == len(self)
+
+            if len(candidates) >= k or exhausted:
+                matrix = haversine_m_array(
+                    lats[:, None], lons[:, None],
+                    self.lats[candidates][None, :], self.lons[candidates][None, :]
+                )
+                kk = min(k, len(candidates))
+                if kk == 0:
+                    return np.full((len(lats), 0), -1), np.full((len(lats), 0), np.inf)
+                top = np.argpartition(matrix, kk - 1, axis=1)[:, :kk] if kk < len(candidates) else (
+                    np.broadcast_to(np.arange(kk), (len(lats), kk))
+                )
+                top_dist = np.take_along_axis(matrix, top, axis=1)
+                if exhausted or top_dist.max() <= covered:
+                    break
+
+            rings *= 2
+
+        order = np.argsort(top_dist, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_dist = np.take_along_axis(top_dist, order, axis=1)
+        block_pos = candidates[top]
+        beyond = top_dist > max_radius_m
+        block_pos[beyond] = -1
+        top_dist[beyond] = np.inf
+        return block_pos, top_dist
+
+    def result(self, position: int, distance_m: Optional[float] = None) -> Dict[str, Any]:
+        """Postcode dict for an index position, in the shape GeoRepository returns."""
+        result = {
+            "postcode": unpack_postcode(int(self.keys[position])),
+            "woonplaats": self.cities[self.city_ids[position]],
+            "lat": round(float(self.lats[position]), 6),
+            "lon": round(float(self.lons[position]), 6),
+        }
+        if distance_m is not None:
+            result["distance_m"] = round(float(distance_m), 1)
+        return result
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the point arrays and the cell table."""
+        arrays = (self.keys, self.lats, self.lons, self.city_ids, self._cell_start)
+        return sum(arr.nbytes for arr in arrays)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            "postcodes": len(self),
+            "cities": len(self.cities),
+            "cell_size_m": self.cell_size_m,
+            "grid": f"{self._cols}x{self._rows}",
+            "memory_mb": round(self.memory_bytes() / (1024 * 1024), 2),
+            "load_seconds": round(self.load_seconds, 3)
+        }
@@ -0,0 +1,208 @@
+"""
+Cache warm-up at startup.
+
+After a deploy or restart the repository cache is empty and every lookup
+lands on SQLite until the hot set is cached again. Warm-up pre-populates the
+cache in the background from one or more sources:
+
+- file:     a configured list of hot postcodes (one per line, '#' comments)
+- snapshot: the cache keys the previous process wrote at shutdown
+- top:      the N postcodes with the most addresses, from the database
+
+Postcodes are loaded through PostcodeRepository.get_postcodes() in chunks,
+with a bounded number of chunks (= pooled connections) in flight at once.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.config import settings
+from src.core.logging_config import get_logger
+from src.db.connection import ADMIN_LANE, DatabasePool
+from src.db.memory_index import pack_postcode
+from src.db.repository import PostcodeRepository, BATCH_CHUNK_SIZE
+
+logger = get_logger(__name__)
+
+WARMUP_SOURCES = ("file", "snapshot", "top")
+
+# Most-addressed postcodes per data source
+TOP_POSTCODE_QUERIES = {
+    "postcode_geo": "SELECT postcode FROM postcode_geo ORDER BY address_count DESC LIMIT ?",
+    "unilabel": (
+        "SELECT postcode FROM nums WHERE postcode != '' "
+        "GROUP BY postcode ORDER BY COUNT(*) DESC LIMIT ?"
+    ),
+}
+
+
+class WarmupState:
+    """Progress of the background warm-up, exposed to readiness and debug endpoints."""
+
+    def __init__(self):
+        self.status = "disabled"  # disabled, running, complete, failed
+        self.requested = 0
+        self.loaded = 0
+        self.duration_seconds = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """True unless warm-up is still running (a failed warm-up does not block readiness)."""
+        return self.status != "running"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "requested": self.requested,
+            "loaded": self.loaded,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "error": self.error
+        }
+
+
+# Global warm-up state
+warmup_state = WarmupState()
+
+
+def read_postcode_file(path: str) -> List[str]:
+    """
+    Read postcodes from a text file, one per line.
+
+    Blank lines, '#' comments and malformed postcodes are skipped.
+
+    Returns:
+        Normalized postcodes in file order (empty if the file does not exist)
+    """
+    file_path = Path(path)
+    if not file_path.exists():
+        logger.info("warmup_file_missing", path=path)
+        return []
+
+    postcodes = []
+    for line in file_path.read_text(encoding="utf-8").splitlines():
+        postcode = line.split("#", 1)[0].upper().strip().replace(" ", "")
+        if postcode and pack_postcode(postcode) is not None:
+            postcodes.append(postcode)
+    return postcodes
+
+
+def write_key_snapshot(repository: PostcodeRepository, path: str) -> int:
+    """
+    Write the repository's cached postcodes to a file for the next process.
+
+    Returns:
+        Number of postcodes written
+    """
+    postcodes = repository.get_cached_postcodes()
+    file_path = Path(path)
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+
+    tmp_path.write_text("".join(f"{postcode}\n" for postcode in postcodes), encoding="utf-8")
+    tmp_path.replace(file_path)
+
+    logger.info("cache_key_snapshot_written", path=path, postcodes=len(postcodes))
+    return len(postcodes)
+
+
+async def top_postcodes(source: str, limit: int) -> List[str]:
+    """Fetch the `limit` postcodes with the most addresses (a full scan, on the admin lane)."""
+    async with DatabasePool.acquire(ADMIN_LANE) as conn:
+        async with conn.execute(TOP_POSTCODE_QUERIES[source], (limit,)) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+
+async def collect_postcodes(repository: PostcodeRepository, sources: List[str]) -> List[str]:
+    """
+    Gather warm-up postcodes from the configured sources.
+
+    Returns:
+        Distinct postcodes, in source order, capped at the cache size
+    """
+    postcodes: List[str] = []
+
+    for source in sources:
+        if source == "file":
+            postcodes.extend(read_postcode_file(settings.cache_warmup_file))
+        elif source == "snapshot":
+            postcodes.extend(read_postcode_file(settings.cache_snapshot_file))
+        elif source == "top":
+            postcodes.extend(await top_postcodes(repository.source, settings.cache_warmup_top_n))
+        else:
+            logger.warning("warmup_source_unknown", source=source, expected=list(WARMUP_SOURCES))
+
+    return list(dict.fromkeys(postcodes))[:repository.cache_size]
+
+
+async def warm_cache(
+    repository: PostcodeRepository,
+    postcodes: List[str],
+    concurrency: int
+) -> int:
+    """
+    Load postcodes into the repository cache.
+
+    Args:
+        repository: Repository whose cache to fill
+        postcodes: Postcodes to load
+        concurrency: Maximum number of chunks queried at once
+
+    Returns:
+        Number of postcodes found (and therefore cached)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def load_chunk(chunk: List[str]) -> int:
+        async with semaphore:
+            results = await repository.get_postcodes(chunk)
+        loaded = sum(1 for result in results.values() if result is not None)
+        warmup_state.loaded += loaded
+        return loaded
+
+    chunks = [postcodes[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(postcodes), BATCH_CHUNK_SIZE)]
+    return sum(await asyncio.gather(*(load_chunk(chunk) for chunk in chunks)))
+
+
+async def run_warmup(repository: PostcodeRepository) -> None:
+    """
+    Warm the repository cache from the configured sources.
+
+    Intended to run as a background task started from lifespan. Failures are
+    logged and recorded in warmup_state; they never stop the service.
+    """
+    warmup_state.status = "running"
+    start = time.perf_counter()
+
+    try:
+        postcodes = await collect_postcodes(repository, settings.cache_warmup_sources)
+        warmup_state.requested = len(postcodes)
+        logger.info(
+            "cache_warmup_started",
+            sources=settings.cache_warmup_sources,
+            postcodes=len(postcodes),
+            concurrency=settings.cache_warmup_concurrency
+        )
+
+        loaded = await warm_cache(repository, postcodes, settings.cache_warmup_concurrency)
+
+        warmup_state.status = "complete"
+        warmup_state.duration_seconds = time.perf_counter() - start
+        logger.info(
+            "cache_warmup_complete",
+            requested=len(postcodes),
+            loaded=loaded,
+            duration_seconds=round(warmup_state.duration_seconds, 3)
+        )
+
+    except asyncio.CancelledError:
+        warmup_state.status = "failed"
+        warmup_state.error = "cancelled"
+        raise
+
+    except Exception as e:
+        warmup_state.status = "failed"
+        warmup_state.error = str(e)
+        warmup_state.duration_seconds = time.perf_counter() - start
+        logger.error("cache_warmup_failed", error=str(e), error_type=type(e).__name__)
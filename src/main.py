@@ -18,6 +18,7 @@ Architecture:
 - Fully typed with Pydantic
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -32,7 +33,19 @@ from src.core.middleware import (
     PerformanceMiddleware
 )
 from src.db.connection import DatabasePool
+from src.db.repository import repository
+from src.db.binary_index import BinaryPostcodeIndex
+from src.db.export import current_bag_version
+from src.db.memory_index import PostcodeIndex
+from src.db.spatial_index import SpatialIndex
+from src.db.geo_repository import geo_repository
+from src.db.shared_cache import SharedPostcodeCache
+from src.db.reload import watch_dataset
+from src.db.warmup import run_warmup, write_key_snapshot
+from src.api.admin import admin_router
 from src.api.routes import router
+from src.api.csv_geocode import csv_router
+from src.api.export import export_router
 from src.api.debug import debug_router
 from src.api.metrics_endpoint import metrics_router
 
@@ -41,6 +54,70 @@ setup_logging(debug=settings.is_debug_mode, json_logs=settings.use_json_logs)
 logger = get_logger(__name__)
 
 
+async def load_memory_index() -> None:
+    """
+    Bulk-load all postcodes into the in-memory engine.
+
+    A failed load is logged and leaves the repository on SQLite.
+    """
+    try:
+        index = await PostcodeIndex.load(repository.source)
+    except Exception as e:
+        logger.error("memory_index_load_failed", error=str(e), fallback_engine="sqlite")
+        return
+
+    repository.attach_index(index)
+    logger.info("memory_index_loaded", source=repository.source, **index.get_stats())
+
+
+def load_binary_index() -> None:
+    """
+    Map the prebuilt binary postcode file (build-postcode-index.py).
+
+    A missing or corrupt file is logged and leaves the repository on SQLite;
+    a file built from another BAG version than the one ingested is served
+    with a warning.
+    """
+    try:
+        index = BinaryPostcodeIndex.open(settings.binary_index_path)
+    except (OSError, RuntimeError) as e:
+        logger.error(
+            "binary_index_load_failed",
+            path=settings.binary_index_path,
+            error=str(e),
+            fallback_engine="sqlite"
+        )
+        return
+
+    current = current_bag_version()
+    if current and index.bag_version != current:
+        logger.warning(
+            "binary_index_stale",
+            path=settings.binary_index_path,
+            index_bag_version=index.bag_version or None,
+            current_bag_version=current
+        )
+
+    repository.attach_index(index)
+    logger.info("binary_index_loaded", **index.get_stats())
+
+
+async def load_spatial_index() -> None:
+    """
+    Load the in-memory spatial index for coordinate lookups.
+
+    A failed load is logged and leaves reverse geocoding on the R-tree.
+    """
+    try:
+        index = await SpatialIndex.load(repository.source, settings.spatial_grid_cell_m)
+    except Exception as e:
+        logger.error("spatial_index_load_failed", error=str(e), fallback_engine="rtree")
+        return
+
+    geo_repository.attach_index(index)
+    logger.info("spatial_index_loaded", source=repository.source, **index.get_stats())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -48,10 +125,19 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - Initialize database connection pool
+    - Select postcode lookup source
+    - Optionally load the in-memory postcode and spatial indexes, or map
+      the binary postcode file
+    - Map the cross-worker shared cache (if configured)
+    - Restore the cache snapshot (if configured)
+    - Start background cache warm-up (if configured)
+    - Start watching the dataset files for reloads (if configured)
+    - Start the dataset deep check against dataset_meta (if configured)
     - Log configuration
     - Verify database connectivity
 
     Shutdown:
+    - Stop warm-up, the dataset watcher and deep check, write the cache (key) snapshots (if configured)
     - Close database connections
     - Log shutdown event
     """
@@ -70,9 +156,56 @@ async def lifespan(app: FastAPI):
         db_path = settings.get_db_path_for_env()
         await DatabasePool.initialize(
             db_path=db_path,
-            cache_size=settings.db_cache_statements
+            cache_size=settings.db_cache_statements,
+            pool_size=settings.db_pool_size,
+            timeout=settings.db_pool_timeout_seconds,
+            max_waiters=settings.db_pool_max_waiters
         )
 
+        # Pick lookup table (materialized postcode_geo when available)
+        repository.configure_source()
+
+        # Optional in-memory or mmap engine (SQLite stays the fallback)
+        if settings.lookup_engine.lower() == "memory":
+            await load_memory_index()
+        elif settings.lookup_engine.lower() == "mmap":
+            load_binary_index()
+
+        # Optional in-memory spatial engine (geoindex R-tree stays the fallback)
+        if settings.spatial_engine.lower() == "memory":
+            await load_spatial_index()
+
+        # One cache for all workers on this host, behind each worker's own cache
+        if settings.shared_cache_enabled and repository.engine == "sqlite":
+            repository.attach_shared_cache(SharedPostcodeCache.open(
+                settings.shared_cache_path,
+                slots=settings.shared_cache_slots,
+                ttl=settings.cache_ttl_seconds,
+                fingerprint=repository.dataset_fingerprint()
+            ))
+
+        # Restore the previous process's cache; warm-up then only loads what is missing
+        if settings.cache_persist_enabled and repository.engine == "sqlite":
+            try:
+                repository.load_cache(settings.cache_persist_path)
+            except OSError as e:
+                logger.warning("cache_snapshot_load_failed", error=str(e), path=settings.cache_persist_path)
+
+        # Warm the cache in the background; the in-memory and mmap engines have no cache to warm
+        warmup_task = None
+        if settings.cache_warmup_sources and repository.engine == "sqlite" and repository.cache_enabled:
+            warmup_task = asyncio.create_task(run_warmup(repository))
+
+        # Swap in a new database when its file is replaced
+        watch_task = None
+        if settings.reload_watch_enabled:
+            watch_task = asyncio.create_task(watch_dataset())
+
+        # Recount the tables against dataset_meta once serving (admin lane)
+        deep_check_task = None
+        if settings.db_deep_check_enabled:
+            deep_check_task = asyncio.create_task(DatabasePool.deep_check())
+
         # Initialize Prometheus metrics
         try:
             from src.core.metrics import set_app_info, initialize_static_metrics
@@ -96,6 +229,29 @@ async def lifespan(app: FastAPI):
     logger.info("application_shutting_down")
 
     try:
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+            await asyncio.gather(warmup_task, return_exceptions=True)
+
+        for task in (watch_task, deep_check_task):
+            if task is not None and not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        if settings.cache_persist_enabled and repository.engine == "sqlite":
+            try:
+                repository.dump_cache(settings.cache_persist_path)
+            except OSError as e:
+                logger.warning("cache_snapshot_write_failed", error=str(e), path=settings.cache_persist_path)
+
+        if "snapshot" in settings.cache_warmup_sources and repository.engine == "sqlite":
+            try:
+                write_key_snapshot(repository, settings.cache_snapshot_file)
+            except OSError as e:
+                logger.warning("cache_key_snapshot_failed", error=str(e), path=settings.cache_snapshot_file)
+
+        if settings.shared_cache_enabled:
+            repository.attach_shared_cache(None)
         await DatabasePool.close()
         logger.info("application_shutdown_complete")
 
@@ -143,6 +299,9 @@ app.add_middleware(LoggingMiddleware)
 
 # Include API routes
 app.include_router(router)
+app.include_router(csv_router)
+app.include_router(export_router)
+app.include_router(admin_router)
 
 # Include metrics endpoint (for Prometheus scraping)
 app.include_router(metrics_router)
@@ -175,6 +334,7 @@ async def root():
         "description": settings.api_description,
         "documentation": "/docs",
         "health_check": "/health",
+        "dataset_version": "/version",
         "example_usage": "/postcode/3511AB"
     }
 
@@ -4,6 +4,7 @@ Pydantic response models for API endpoints.
 All API responses are validated and documented through these models.
 """
 
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -56,6 +57,212 @@ class PostcodeResponse(BaseModel):
     }
 
 
+class BatchLookupRequest(BaseModel):
+    """
+    Request model for batch postcode lookup.
+
+    Example:
+        {
+            "postcodes": ["3511AB", "1012 ab", "9999ZZ", "bogus"]
+        }
+    """
+    postcodes: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Postcodes to look up; normalized the same way as GET /postcode/{postcode}",
+        examples=[["3511AB", "1012AB"]]
+    )
+
+
+class BatchLookupItem(BaseModel):
+    """
+    Result for a single postcode in a batch lookup.
+
+    Example:
+        {
+            "query": "3511 ab",
+            "postcode": "3511AB",
+            "status": "found",
+            "lat": 52.096065,
+            "lon": 5.115926,
+            "woonplaats": "Utrecht"
+        }
+    """
+    query: str = Field(..., description="Postcode as submitted")
+    postcode: str = Field(..., description="Normalized postcode")
+    status: Literal["found", "not_found", "invalid"] = Field(
+        ...,
+        description="Lookup outcome for this postcode"
+    )
+    lat: Optional[float] = Field(None, description="Latitude (WGS84) when found")
+    lon: Optional[float] = Field(None, description="Longitude (WGS84) when found")
+    woonplaats: Optional[str] = Field(None, description="City or town name when found")
+
+
+class BatchLookupResponse(BaseModel):
+    """
+    Response model for batch postcode lookup.
+
+    Results are returned in input order, one per submitted postcode.
+    """
+    results: List[BatchLookupItem] = Field(..., description="Per-postcode results in input order")
+    found: int = Field(..., description="Number of postcodes found")
+    not_found: int = Field(..., description="Number of valid postcodes not in the database")
+    invalid: int = Field(..., description="Number of postcodes with an invalid format")
+
+
+class DistanceMatrixRequest(BaseModel):
+    """
+    Request model for a great-circle distance matrix.
+
+    Example:
+        {
+            "origins": ["3511AB", "1012AB"],
+            "destinations": ["9901EG", "3011 ab", "9999ZZ"],
+            "format": "json"
+        }
+    """
+    origins: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Origin postcodes (matrix rows); normalized like GET /postcode/{postcode}",
+        examples=[["3511AB", "1012AB"]]
+    )
+    destinations: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        description="Destination postcodes (matrix columns); defaults to the origins",
+        examples=[["9901EG", "3011AB"]]
+    )
+    format: Literal["json", "binary"] = Field(
+        "json",
+        description="json, or binary: float32 row-major matrix with a small header"
+    )
+
+
+class AddressResponse(BaseModel):
+    """
+    A single address (nummeraanduiding) with the location of its verblijfsobject.
+
+    Example:
+        {
+            "postcode": "3511AB",
+            "huisnummer": 12,
+            "huisletter": "A",
+            "huistoevoeging": "",
+            "straat": "Oudegracht",
+            "woonplaats": "Utrecht",
+            "lat": 52.09098,
+            "lon": 5.12093,
+            "rd_x": 136517.0,
+            "rd_y": 455890.0,
+            "oppervlakte": 85,
+            "gebruiksdoelen": "woonfunctie",
+            "status": "Naamgeving uitgegeven"
+        }
+    """
+    postcode: str = Field(..., description="Dutch postcode")
+    huisnummer: int = Field(..., description="House number")
+    huisletter: str = Field("", description="House letter (empty if none)")
+    huistoevoeging: str = Field("", description="House number addition (empty if none)")
+    straat: str = Field(..., description="Street name (openbare ruimte)")
+    woonplaats: str = Field(..., description="City or town name (Dutch: woonplaats)")
+    lat: float = Field(..., description="Latitude in WGS84 coordinate system")
+    lon: float = Field(..., description="Longitude in WGS84 coordinate system")
+    rd_x: Optional[float] = Field(None, description="X coordinate in Rijksdriehoek (EPSG:28992)")
+    rd_y: Optional[float] = Field(None, description="Y coordinate in Rijksdriehoek (EPSG:28992)")
+    oppervlakte: Optional[int] = Field(None, description="Floor area in m2")
+    gebruiksdoelen: Optional[str] = Field(None, description="Intended use(s) of the verblijfsobject")
+    status: Optional[str] = Field(None, description="BAG status of the address")
+
+
+class AddressLookupResponse(BaseModel):
+    """
+    Response model for postcode + house number lookup.
+
+    Without huisletter/huistoevoeging filters, every address sharing the
+    house number is returned (e.g. 12, 12A and 12-2).
+    """
+    postcode: str = Field(..., description="Normalized postcode")
+    huisnummer: int = Field(..., description="House number")
+    addresses: List[AddressResponse] = Field(..., description="Matching addresses, ordered by letter and addition")
+
+
+class ReverseGeocodeResult(BaseModel):
+    """A postcode near the queried point."""
+    postcode: str = Field(..., description="Dutch postcode")
+    woonplaats: str = Field(..., description="City or town name (Dutch: woonplaats)")
+    lat: float = Field(..., description="Latitude of the postcode's nearest address (or its point with SPATIAL_ENGINE=memory)")
+    lon: float = Field(..., description="Longitude of the postcode's nearest address (or its point with SPATIAL_ENGINE=memory)")
+    distance_m: float = Field(..., description="Great-circle distance to that location in metres")
+
+
+class ReverseGeocodeResponse(BaseModel):
+    """
+    Response model for reverse geocoding.
+
+    Example:
+        {
+            "lat": 52.0907,
+            "lon": 5.1214,
+            "radius_m": 250.0,
+            "results": [
+                {
+                    "postcode": "3511AB",
+                    "woonplaats": "Utrecht",
+                    "lat": 52.09098,
+                    "lon": 5.12093,
+                    "distance_m": 41.2
+                }
+            ]
+        }
+    """
+    lat: float = Field(..., description="Queried latitude")
+    lon: float = Field(..., description="Queried longitude")
+    radius_m: float = Field(..., description="Search radius that produced the results")
+    results: List[ReverseGeocodeResult] = Field(..., description="Nearest postcodes, nearest first")
+
+
+class NearbyResponse(BaseModel):
+    """
+    Response model for radius search (postcodes within N km).
+
+    Results are sorted nearest first and paginated with offset/limit; `total`
+    counts all postcodes in the radius, up to NEARBY_MAX_RESULTS (`truncated`
+    is true when more were found).
+
+    Example:
+        {
+            "postcode": "3511AB",
+            "lat": 52.096065,
+            "lon": 5.115926,
+            "radius_km": 1.0,
+            "total": 214,
+            "truncated": false,
+            "offset": 0,
+            "limit": 100,
+            "results": [
+                {
+                    "postcode": "3511AB",
+                    "woonplaats": "Utrecht",
+                    "lat": 52.096031,
+                    "lon": 5.115872,
+                    "distance_m": 5.3
+                }
+            ]
+        }
+    """
+    postcode: Optional[str] = Field(None, description="Centre postcode (for /postcode/{postcode}/nearby)")
+    lat: float = Field(..., description="Latitude of the search centre")
+    lon: float = Field(..., description="Longitude of the search centre")
+    radius_km: float = Field(..., description="Search radius in kilometres")
+    total: int = Field(..., description="Postcodes within the radius (after the result cap)")
+    truncated: bool = Field(..., description="True if more postcodes lie within the radius than the cap")
+    offset: int = Field(..., description="Index of the first result on this page")
+    limit: int = Field(..., description="Page size")
+    results: List[ReverseGeocodeResult] = Field(..., description="Postcodes on this page, nearest first")
+
+
 class HealthResponse(BaseModel):
     """
     Response model for health check endpoints.
@@ -78,6 +285,44 @@ class HealthResponse(BaseModel):
     )
 
 
+class VersionResponse(BaseModel):
+    """
+    Response model for the dataset version endpoint.
+
+    Facts recorded at ingest in the database's dataset_meta table (see
+    write-dataset-meta.py); `dataset` is the identity that keys the caches
+    and lookup ETags.
+
+    Example:
+        {
+            "dataset": "2026-09-08:44b0971f4bbe8f99",
+            "bag_version": "2026-09-08",
+            "built_at": "2026-09-09T03:12:44Z",
+            "postcodes": 463718,
+            "postcodes_sha256": "44b0971f4bbe8f9949313fa6f692965e7c66facc373004a5eab31dee576c88a6",
+            "row_counts": {"nums": 9876543, "postcode_geo": 463718},
+            "address_count": 9876543,
+            "source": "postcode_geo",
+            "engine": "mmap",
+            "index": {"bag_version": "2026-09-08", "sha256": "9c1f...", "built_at": "2026-09-09T03:20:01+00:00"},
+            "api_version": "1.0.0"
+        }
+    """
+    dataset: Optional[str] = Field(None, description="Dataset fingerprint (cache namespace and ETag seed)")
+    bag_version: Optional[str] = Field(None, description="BAG extract date")
+    built_at: Optional[str] = Field(None, description="When dataset_meta was written (UTC)")
+    postcodes: Optional[int] = Field(None, description="Distinct postcodes recorded at ingest")
+    postcodes_sha256: Optional[str] = Field(None, description="Checksum of the postcode rows served")
+    row_counts: Dict[str, int] = Field(default_factory=dict, description="Table row counts recorded at ingest")
+    address_count: Optional[int] = Field(None, description="Address rows of the database served")
+    source: str = Field(..., description="Lookup source table", examples=["postcode_geo", "unilabel"])
+    engine: str = Field(..., description="Lookup engine", examples=["sqlite", "memory", "mmap"])
+    index: Optional[Dict[str, Any]] = Field(
+        None, description="BAG version, checksum and build time of the binary postcode file (mmap engine)"
+    )
+    api_version: str = Field(..., description="API version")
+
+
 class ErrorResponse(BaseModel):
     """
     Standard error response format.
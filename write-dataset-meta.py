@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Dataset Metadata Writer - Records row counts and BAG version in bag.sqlite
+
+Counts the BAG tables once and stores the counts, a checksum of the
+postcode rows the API serves, the BAG version from
+current-bag-version.json and the build time in the dataset_meta table
+(keys in src/db/dataset_meta.py). The API then verifies the database at
+startup and on reload from this table instead of counting ~10M address
+rows, and keys its caches and ETags to the checksum. Run as the last
+ingest step, after create-postcode-geo-table.sql, on the writable copy
+that is renamed into place afterwards:
+
+    python3 write-dataset-meta.py --db /opt/postcode/geodata/bag.sqlite.new
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.db.dataset_meta import write_dataset_meta  # noqa: E402
+from src.db.memory_index import LOAD_QUERIES  # noqa: E402
+
+# Configuration
+DEFAULT_DB = Path("/opt/postcode/geodata/bag.sqlite")
+CURRENT_VERSION_FILE = Path("/opt/postcode/current-bag-version.json")
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger('write-dataset-meta')
+
+
+def read_bag_version(version_file):
+    """BAG version date from the version file, or "" if unavailable"""
+    try:
+        return json.loads(Path(version_file).read_text()).get("version_date") or ""
+    except (OSError, ValueError):
+        logger.warning(f"No BAG version in {version_file}; bag_version is left empty")
+        return ""
+
+
+def write_meta(db_path, version_file):
+    """Count and checksum the database and write its dataset_meta table"""
+    start = time.time()
+    bag_version = read_bag_version(version_file)
+
+    logger.info(f"Counting tables in {db_path}...")
+    conn = sqlite3.connect(db_path)
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postcode_geo'"
+        ).fetchone()
+        source = "postcode_geo" if has_table else "unilabel"
+        meta = write_dataset_meta(
+            conn,
+            bag_version=bag_version,
+            checksum_source=source,
+            checksum_query=LOAD_QUERIES[source]
+        )
+    finally:
+        conn.close()
+
+    logger.info("✓ Dataset metadata written!")
+    for key, value in meta.items():
+        logger.info(f"  {key}: {value or '-'}")
+    logger.info(f"  Time: {time.time() - start:.1f}s")
+    return meta
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description="Write the dataset_meta table into a BAG database")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help="SQLite database to update")
+    parser.add_argument("--version-file", type=Path, default=CURRENT_VERSION_FILE,
+                        help="BAG version file to record")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        logger.error(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    try:
+        write_meta(args.db, args.version_file)
+    except Exception as e:
+        logger.error(f"Writing dataset metadata failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()